@@ -0,0 +1,991 @@
+"""Benchmark suite for django-postgres-loader.
+
+Start a throwaway PostgreSQL cluster in a temporary directory, generate
+synthetic models of several widths, and measure the throughput (rows/second)
+and peak Python memory (via tracemalloc) of every load operation, every update
+operation, and every supported input type at several data sizes. Loads that
+skip columns of the data are measured with each projection ("stream" and
+"stage") at several ratios of loaded to total columns, and the faster one is
+reported for each ratio. Operations that the server can run as MERGE are
+measured with each engine ("on_conflict" and "merge"), and the faster one is
+reported for each case. Upserts of shuffled keys are measured with and without
+order_by, recording the buffer hit rate of the target table and its indexes.
+Results are written as JSON and may be compared against a baseline results file; any
+measurement that regresses by more than the configured threshold causes a
+non-zero exit code.
+
+Example:
+    python benchmarks/run_benchmarks.py \
+        --sizes 10000 1000000 \
+        --output results.json \
+        --baseline baseline.json \
+        --threshold 0.1
+
+Requires the PostgreSQL server binaries (initdb, pg_ctl) to be on PATH (or in
+the directory given by --pg-bin) and psycopg2 to be installed.
+"""
+
+# standard library imports
+import argparse
+import atexit
+import csv
+import datetime
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple, Type
+
+# make the package importable when run from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_SIZES = [10_000, 1_000_000, 10_000_000]
+DEFAULT_WIDTHS = [5, 20, 100]
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_PROJECTION_RATIOS = [0.05, 0.25, 0.5, 0.75]
+PROJECTIONS = ["stream", "stage"]
+ENGINES = ["on_conflict", "merge"]
+ORDER_BY_OPTIONS = [True, False]
+STATS_FLUSH_SECONDS = 1.0
+INPUT_TYPES = [
+    "path",
+    "stringio",
+    "bytesio",
+    "dataframe",
+]
+BENCHMARK_APP_LABEL = "dpl_benchmarks"
+
+
+def find_free_port() -> int:
+    """Find a free TCP port on the local machine.
+
+    Returns (int):
+        A port number that was free at the time of the call.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_postgres(pg_bin: Optional[str] = None) -> Dict[str, str]:
+    """Start a throwaway PostgreSQL cluster in a temporary directory.
+
+    Steps:
+        1.  Resolve the initdb and pg_ctl executables.
+        2.  Initialize a new cluster with trust authentication.
+        3.  Start the server on a free port, listening on a Unix socket in the
+            cluster directory only.
+        4.  Register a handler to stop the server and remove the cluster when
+            the process exits.
+        5.  Return.
+
+    Args:
+        pg_bin ([str]):
+            The directory containing the PostgreSQL server binaries. If not
+            provided, then the binaries are looked up on PATH.
+
+    Returns (dict[str, str]):
+        Connection details for the new cluster.
+    """
+    # Step 1
+    initdb = (
+        os.path.join(pg_bin, "initdb") if pg_bin else shutil.which("initdb")
+    )
+    pg_ctl = (
+        os.path.join(pg_bin, "pg_ctl") if pg_bin else shutil.which("pg_ctl")
+    )
+    if (initdb is None) or (pg_ctl is None):
+        raise FileNotFoundError(
+            "PostgreSQL server binaries (initdb, pg_ctl) not found."
+        )
+
+    # Step 2
+    cluster_dir = tempfile.mkdtemp(prefix="dpl_bench_")
+    data_dir = os.path.join(cluster_dir, "data")
+    subprocess.run(
+        [initdb, "-D", data_dir, "-A", "trust", "-U", "postgres", "-E", "UTF8"],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+    # Step 3
+    port = find_free_port()
+    options = f"-p {port} -k {cluster_dir} -c listen_addresses='' -c fsync=off"
+    subprocess.run(
+        [
+            pg_ctl,
+            "-D",
+            data_dir,
+            "-o",
+            options,
+            "-l",
+            os.path.join(cluster_dir, "server.log"),
+            "-w",
+            "start",
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+    # Step 4
+    def stop_postgres():
+        subprocess.run(
+            [pg_ctl, "-D", data_dir, "-m", "immediate", "-w", "stop"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        shutil.rmtree(cluster_dir, ignore_errors=True)
+
+    atexit.register(stop_postgres)
+
+    # Step 5
+    return {
+        "HOST": cluster_dir,
+        "PORT": str(port),
+        "USER": "postgres",
+        "NAME": "postgres",
+    }
+
+
+def configure_django(database: Dict[str, str]) -> None:
+    """Configure a minimal Django project pointed at [database].
+
+    Args:
+        database (dict[str, str]):
+            Connection details for the benchmark database.
+
+    Returns:
+        None
+    """
+    # third-party imports
+    import django
+    from django.conf import settings
+
+    settings.configure(
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.postgresql",
+                **database,
+            },
+        },
+        INSTALLED_APPS=[],
+        USE_TZ=True,
+    )
+    django.setup()
+
+
+def column_types(width: int) -> List[str]:
+    """Get the list of synthetic value column types for a model of [width].
+
+    The first column of every synthetic model is the integer key; value columns
+    cycle through integer, float, and text types.
+
+    Args:
+        width (int):
+            The total number of columns in the model, including the key.
+
+    Returns (list[str]):
+        The type of each non-key column ("integer", "float", or "text").
+    """
+    cycle = ["integer", "float", "text"]
+    return [cycle[i % len(cycle)] for i in range(width - 1)]
+
+
+def build_model(width: int) -> Type:
+    """Build a synthetic Django model with [width] columns.
+
+    Steps:
+        1.  Build the key column, which is unique so that it can be used as a
+            conflict target.
+        2.  Build the value columns.
+        3.  Create the model class.
+
+    Args:
+        width (int):
+            The total number of columns in the model, including the key.
+
+    Returns (type[models.Model]):
+        The synthetic model.
+    """
+    # third-party imports
+    from django.db import models
+
+    # local imports
+    from django_postgres_loader import CopyLoadManager
+
+    # Step 1
+    attrs = {
+        "__module__": __name__,
+        "key": models.BigIntegerField(unique=True),
+        "objects": CopyLoadManager(),
+    }
+
+    # Step 2
+    field_classes = {
+        "integer": lambda: models.BigIntegerField(null=True),
+        "float": lambda: models.FloatField(null=True),
+        "text": lambda: models.TextField(null=True),
+    }
+    for i, column_type in enumerate(column_types(width)):
+        attrs[f"c{i:03d}"] = field_classes[column_type]()
+
+    # Step 3
+    attrs["Meta"] = type(
+        "Meta",
+        (),
+        {
+            "app_label": BENCHMARK_APP_LABEL,
+            "db_table": f"dpl_bench_w{width}",
+        },
+    )
+    return type(f"BenchW{width}", (models.Model,), attrs)
+
+
+def create_table(model: Type) -> None:
+    """Create the database table for [model], dropping any existing one.
+
+    Args:
+        model (type[models.Model]):
+            The synthetic model.
+
+    Returns:
+        None
+    """
+    # third-party imports
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS "{model._meta.db_table}"')
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(model)
+
+
+def write_data_file(
+    directory: str,
+    width: int,
+    n_rows: int,
+    seed: int = 0,
+    shuffled: bool = False,
+) -> str:
+    """Write a deterministic synthetic CSV file for a model of [width].
+
+    Values are always strictly positive so that every update operation
+    (including division) is valid.
+
+    Args:
+        directory (str):
+            The directory in which to write the file.
+        width (int):
+            The total number of columns in the model, including the key.
+        n_rows (int):
+            The number of data rows to write.
+        seed (int):
+            The seed for the random number generator.
+        shuffled (bool):
+            Whether to write the keys in random order rather than ascending.
+
+    Returns (str):
+        The path to the written file.
+    """
+    suffix = "_shuffled" if shuffled else ""
+    path = os.path.join(directory, f"w{width}_n{n_rows}{suffix}.csv")
+    if os.path.isfile(path):
+        return path
+
+    rng = random.Random(seed)
+    types = column_types(width)
+    generators = {
+        "integer": lambda: str(rng.randint(1, 1_000_000)),
+        "float": lambda: f"{rng.uniform(1, 1000):.4f}",
+        "text": lambda: "".join(rng.choices("abcdefghijklmnop", k=12)),
+    }
+    with open(path, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["key"] + [f"c{i:03d}" for i in range(len(types))])
+        keys = list(range(n_rows))
+        if shuffled:
+            rng.shuffle(keys)
+        for key in keys:
+            writer.writerow([key] + [generators[t]() for t in types])
+
+    return path
+
+
+def make_input(input_type: str, path: str):
+    """Build the [data] argument for a load from the file at [path].
+
+    Args:
+        input_type (str):
+            One of INPUT_TYPES.
+        path (str):
+            The path to the synthetic CSV file.
+
+    Returns:
+        The value to pass as [data], or None if [input_type] is unavailable.
+    """
+    if input_type == "path":
+        return path
+    elif input_type == "stringio":
+        with open(path, mode="r") as file:
+            return io.StringIO(file.read())
+    elif input_type == "bytesio":
+        with open(path, mode="rb") as file:
+            return io.BytesIO(file.read())
+    elif input_type == "dataframe":
+        try:
+            import pandas
+        except ImportError:
+            return None
+        return pandas.read_csv(path)
+    else:
+        raise ValueError(f"Unknown input type {input_type}.")
+
+
+def build_cases(
+    operations: List[str],
+    update_operations: List[str],
+    width: int,
+) -> List[Tuple[str, Optional[str], Optional[Dict[str, str]], bool]]:
+    """Build the (operation, update operation) combinations to measure.
+
+    Arithmetic update operations are only applied to numeric columns; text
+    columns are not updated when benchmarking update operations.
+
+    Args:
+        operations (list[str]):
+            The load operations to measure.
+        update_operations (list[str]):
+            The update operations to measure for "update", "upsert", and
+            "sync".
+        width (int):
+            The total number of columns in the model, including the key.
+
+    Returns (list[tuple]):
+        One (operation, update operation name, update operation argument,
+        prefill flag) tuple per case. If the prefill flag is set, then the
+        target table is populated before the measured load so that the load
+        encounters conflicts.
+    """
+    numeric_columns = [
+        f"c{i:03d}"
+        for i, t in enumerate(column_types(width))
+        if t in ("integer", "float")
+    ]
+
+    cases = []
+    for operation in operations:
+        if operation in ("update", "upsert", "sync"):
+            for update_operation in update_operations:
+                update_argument = {
+                    column: update_operation for column in numeric_columns
+                }
+                cases.append(
+                    (operation, update_operation, update_argument, True)
+                )
+        else:
+            cases.append((operation, None, None, operation != "append"))
+
+    return cases
+
+
+def build_projection_columns(width: int, ratio: float) -> Optional[List[str]]:
+    """Build the columns loaded when measuring projection at [ratio].
+
+    Args:
+        width (int):
+            The total number of columns in the model, including the key.
+        ratio (float):
+            The fraction of the data's columns to load.
+
+    Returns ([list[str]]):
+        The key and the first value columns, or None if [ratio] of [width]
+        would load every column.
+    """
+    n_columns = max(2, round(ratio * width))
+    if n_columns >= width:
+        return None
+    return ["key"] + [f"c{i:03d}" for i in range(n_columns - 1)]
+
+
+def run_load(
+    model: Type,
+    data,
+    operation: str,
+    update_operation: Optional[Dict[str, str]],
+    options: Optional[Dict] = None,
+) -> int:
+    """Run a single load of [data] into [model].
+
+    Args:
+        model (type[models.Model]):
+            The synthetic model.
+        data:
+            The data to load.
+        operation (str):
+            The load operation.
+        update_operation ([dict[str, str]]):
+            The update operation, if any.
+        options ([dict]):
+            Additional CopyLoader arguments.
+
+    Returns (int):
+        The number of rows affected by the load.
+    """
+    # local imports
+    from django_postgres_loader import CopyLoader
+
+    loader = CopyLoader(
+        model=model,
+        data=data,
+        operation=operation,
+        conflict_target=None if operation == "append" else ["key"],
+        update_operation=update_operation,
+        **(options or {}),
+    )
+    return loader.load()
+
+
+def measure(
+    model: Type,
+    path: str,
+    input_type: str,
+    operation: str,
+    update_operation: Optional[Dict[str, str]],
+    prefill: bool,
+    options: Optional[Dict] = None,
+) -> Optional[Dict[str, float]]:
+    """Measure throughput and peak memory of one load.
+
+    Steps:
+        1.  Reset the target table (and prefill it if required), then time a
+            load without tracemalloc running.
+        2.  Reset the target table again, then measure peak memory of the same
+            load with tracemalloc running.
+        3.  Return.
+
+    Input construction (e.g. reading a file into a StringIO) is included in both
+    measurements, since that is part of the cost a caller pays.
+
+    Args:
+        model (type[models.Model]):
+            The synthetic model.
+        path (str):
+            The path to the synthetic CSV file.
+        input_type (str):
+            One of INPUT_TYPES.
+        operation (str):
+            The load operation.
+        update_operation ([dict[str, str]]):
+            The update operation, if any.
+        prefill (bool):
+            Whether to populate the target table before the measured load.
+        options ([dict]):
+            Additional CopyLoader arguments for the measured load.
+
+    Returns ([dict[str, float]]):
+        The measurements, or None if [input_type] is unavailable.
+    """
+
+    # third-party imports
+    from django.db import connection
+
+    def reset():
+        with connection.cursor() as cursor:
+            cursor.execute(f'TRUNCATE "{model._meta.db_table}"')
+        if prefill:
+            run_load(model, path, "append", None)
+
+    # Step 1
+    reset()
+    start = time.perf_counter()
+    data = make_input(input_type, path)
+    if data is None:
+        return None
+    n_rows_affected = run_load(
+        model, data, operation, update_operation, options
+    )
+    seconds = time.perf_counter() - start
+    del data
+
+    # Step 2
+    reset()
+    tracemalloc.start()
+    try:
+        data = make_input(input_type, path)
+        run_load(model, data, operation, update_operation, options)
+        del data
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Step 3
+    return {
+        "seconds": seconds,
+        "rows_affected": n_rows_affected,
+        "peak_memory_bytes": peak_memory_bytes,
+    }
+
+
+def read_buffer_counts(model: Type) -> Dict[str, int]:
+    """Read the cumulative buffer hits and reads of [model]'s table.
+
+    The backend's pending statistics are flushed first (on PostgreSQL 15 or
+    higher by forcing the next flush, otherwise by waiting for the statistics
+    collector), so that the counts include the last load.
+
+    Args:
+        model (type[models.Model]):
+            The synthetic model.
+
+    Returns (dict[str, int]):
+        The buffer hits and reads of the table and its indexes.
+    """
+    # third-party imports
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        if connection.pg_version >= 150000:
+            cursor.execute("SELECT pg_stat_force_next_flush()")
+            cursor.execute("SELECT 1")
+        else:
+            time.sleep(STATS_FLUSH_SECONDS)
+        cursor.execute("SELECT pg_stat_clear_snapshot()")
+        cursor.execute(
+            "SELECT "
+            "coalesce(heap_blks_hit, 0) + coalesce(idx_blks_hit, 0), "
+            "coalesce(heap_blks_read, 0) + coalesce(idx_blks_read, 0) "
+            "FROM pg_statio_user_tables WHERE relid = %s::regclass",
+            [f'"{model._meta.db_table}"'],
+        )
+        hits, reads = cursor.fetchone()
+
+    return {"hits": hits, "reads": reads}
+
+
+def measure_buffers(
+    model: Type,
+    path: str,
+    operation: str,
+    update_operation: Optional[Dict[str, str]],
+    options: Optional[Dict] = None,
+) -> Dict[str, float]:
+    """Measure the buffer hit rate of one load into a prefilled table.
+
+    Steps:
+        1.  Reset and prefill the target table.
+        2.  Read the table's buffer counts before and after the load.
+        3.  Return the difference.
+
+    Args:
+        model (type[models.Model]):
+            The synthetic model.
+        path (str):
+            The path to the synthetic CSV file.
+        operation (str):
+            The load operation.
+        update_operation ([dict[str, str]]):
+            The update operation, if any.
+        options ([dict]):
+            Additional CopyLoader arguments for the measured load.
+
+    Returns (dict[str, float]):
+        The buffer hits and reads of the load, and the fraction of its buffer
+        accesses that were hits.
+    """
+
+    # third-party imports
+    from django.db import connection
+
+    # Step 1
+    with connection.cursor() as cursor:
+        cursor.execute(f'TRUNCATE "{model._meta.db_table}"')
+    run_load(model, path, "append", None)
+
+    # Step 2
+    before = read_buffer_counts(model)
+    run_load(model, path, operation, update_operation, options)
+    after = read_buffer_counts(model)
+
+    # Step 3
+    hits = after["hits"] - before["hits"]
+    reads = after["reads"] - before["reads"]
+    return {
+        "buffer_hits": hits,
+        "buffer_reads": reads,
+        "buffer_hit_rate": hits / (hits + reads) if hits + reads > 0 else 1.0,
+    }
+
+
+def result_key(result: Dict) -> str:
+    """Build the key used to match a result against the baseline.
+
+    Args:
+        result (dict):
+            A single benchmark result.
+
+    Returns (str):
+        The key identifying the measured case.
+    """
+    keys = ["operation", "update_operation", "input_type", "width", "rows"]
+    if "projection" in result:
+        keys += ["projection", "ratio"]
+    if "engine" in result:
+        keys += ["engine"]
+    if "order_by" in result:
+        keys += ["order_by"]
+    return "|".join(str(result[k]) for k in keys)
+
+
+def find_regressions(
+    results: List[Dict],
+    baseline: List[Dict],
+    threshold: float,
+) -> List[str]:
+    """Compare [results] against [baseline].
+
+    A case regresses if its throughput drops, or its peak memory grows, by more
+    than [threshold] (a fraction) relative to the baseline. Cases that are not
+    present in the baseline are ignored.
+
+    Args:
+        results (list[dict]):
+            The current benchmark results.
+        baseline (list[dict]):
+            The baseline benchmark results.
+        threshold (float):
+            The permitted relative change.
+
+    Returns (list[str]):
+        A description of each regression found.
+    """
+    baseline_by_key = {result_key(r): r for r in baseline}
+    regressions = []
+    for result in results:
+        key = result_key(result)
+        if key not in baseline_by_key:
+            continue
+        old = baseline_by_key[key]
+
+        if result["rows_per_second"] < old["rows_per_second"] * (1 - threshold):
+            regressions.append(
+                f"{key}: throughput {result['rows_per_second']:.0f} rows/s "
+                f"(baseline {old['rows_per_second']:.0f} rows/s)"
+            )
+        if result["peak_memory_bytes"] > old["peak_memory_bytes"] * (
+            1 + threshold
+        ):
+            regressions.append(
+                f"{key}: peak memory {result['peak_memory_bytes']} bytes "
+                f"(baseline {old['peak_memory_bytes']} bytes)"
+            )
+
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv ([list[str]]):
+            The arguments to parse. If not provided, then sys.argv is used.
+
+    Returns (argparse.Namespace):
+        The parsed arguments.
+    """
+    # local imports
+    from django_postgres_loader.core import definitions
+
+    update_operations = [
+        op for op in definitions.INCLUDED_UPDATE_OPERATIONS if op is not None
+    ]
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--widths", type=int, nargs="+", default=DEFAULT_WIDTHS)
+    parser.add_argument(
+        "--operations",
+        nargs="+",
+        default=definitions.INCLUDED_OPERATIONS,
+        choices=definitions.INCLUDED_OPERATIONS,
+    )
+    parser.add_argument(
+        "--update-operations",
+        nargs="+",
+        default=update_operations,
+        choices=update_operations,
+    )
+    parser.add_argument(
+        "--input-types",
+        nargs="+",
+        default=INPUT_TYPES,
+        choices=INPUT_TYPES,
+    )
+    parser.add_argument(
+        "--projection-ratios",
+        type=float,
+        nargs="*",
+        default=DEFAULT_PROJECTION_RATIOS,
+    )
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--pg-bin", default=None)
+    parser.add_argument("--data-dir", default=None)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite.
+
+    Steps:
+        1.  Parse arguments, start PostgreSQL, and configure Django.
+        2.  For each width, build the synthetic model and its table, then for
+            each size write the data file and measure every case.
+            2.1.    Measure loading a subset of the columns with each
+                    projection at every ratio, and report the faster one.
+            2.2.    Measure every case the server can run as MERGE with each
+                    engine, and report the faster one.
+            2.3.    Measure upserting shuffled keys with and without
+                    order_by, and report the buffer hit rates.
+        3.  Write the results as JSON.
+        4.  If a baseline was provided, then compare against it.
+
+    Args:
+        argv ([list[str]]):
+            The command-line arguments. If not provided, then sys.argv is used.
+
+    Returns (int):
+        The process exit code; 1 if any regression was found, otherwise 0.
+    """
+    # Step 1
+    args = parse_args(argv)
+    database = start_postgres(args.pg_bin)
+    configure_django(database)
+
+    # third-party imports
+    import django
+    from django.db import connection
+
+    # local imports
+    from django_postgres_loader.core import definitions
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="dpl_bench_data_")
+    os.makedirs(data_dir, exist_ok=True)
+
+    # Step 2
+    results = []
+    for width in args.widths:
+        model = build_model(width)
+        create_table(model)
+        cases = build_cases(args.operations, args.update_operations, width)
+
+        for n_rows in args.sizes:
+            path = write_data_file(data_dir, width, n_rows)
+            for input_type in args.input_types:
+                for operation, update_name, update_argument, prefill in cases:
+                    measurement = measure(
+                        model=model,
+                        path=path,
+                        input_type=input_type,
+                        operation=operation,
+                        update_operation=update_argument,
+                        prefill=prefill,
+                    )
+                    if measurement is None:
+                        continue
+
+                    result = {
+                        "operation": operation,
+                        "update_operation": update_name,
+                        "input_type": input_type,
+                        "width": width,
+                        "rows": n_rows,
+                        "rows_per_second": n_rows / measurement["seconds"],
+                        **measurement,
+                    }
+                    results.append(result)
+                    print(
+                        f"{result_key(result)}: "
+                        f"{result['rows_per_second']:.0f} rows/s, "
+                        f"{result['peak_memory_bytes'] / 2**20:.1f} MiB peak",
+                        file=sys.stderr,
+                    )
+
+            # Step 2.1
+            for ratio in args.projection_ratios:
+                include_columns = build_projection_columns(width, ratio)
+                if include_columns is None:
+                    continue
+                rows_per_second = {}
+                for projection in PROJECTIONS:
+                    measurement = measure(
+                        model=model,
+                        path=path,
+                        input_type="path",
+                        operation="append",
+                        update_operation=None,
+                        prefill=False,
+                        options={
+                            "include_columns": include_columns,
+                            "projection": projection,
+                        },
+                    )
+                    result = {
+                        "operation": "append",
+                        "update_operation": None,
+                        "input_type": "path",
+                        "width": width,
+                        "rows": n_rows,
+                        "projection": projection,
+                        "ratio": ratio,
+                        "rows_per_second": n_rows / measurement["seconds"],
+                        **measurement,
+                    }
+                    results.append(result)
+                    rows_per_second[projection] = result["rows_per_second"]
+                fastest = max(rows_per_second, key=rows_per_second.get)
+                print(
+                    f"projection w{width} n{n_rows} ratio {ratio}: "
+                    + ", ".join(
+                        f"{projection} {value:.0f} rows/s"
+                        for projection, value in rows_per_second.items()
+                    )
+                    + f"; {fastest} is faster",
+                    file=sys.stderr,
+                )
+
+            # Step 2.2
+            for operation, update_name, update_argument, prefill in cases:
+                min_version = definitions.MERGE_ENGINE_MIN_VERSIONS.get(
+                    operation
+                )
+                if (min_version is None) or (
+                    connection.pg_version < min_version
+                ):
+                    continue
+                rows_per_second = {}
+                for engine in ENGINES:
+                    measurement = measure(
+                        model=model,
+                        path=path,
+                        input_type="path",
+                        operation=operation,
+                        update_operation=update_argument,
+                        prefill=prefill,
+                        options={"engine": engine},
+                    )
+                    result = {
+                        "operation": operation,
+                        "update_operation": update_name,
+                        "input_type": "path",
+                        "width": width,
+                        "rows": n_rows,
+                        "engine": engine,
+                        "rows_per_second": n_rows / measurement["seconds"],
+                        **measurement,
+                    }
+                    results.append(result)
+                    rows_per_second[engine] = result["rows_per_second"]
+                fastest = max(rows_per_second, key=rows_per_second.get)
+                print(
+                    f"engine {operation} {update_name} w{width} n{n_rows}: "
+                    + ", ".join(
+                        f"{engine} {value:.0f} rows/s"
+                        for engine, value in rows_per_second.items()
+                    )
+                    + f"; {fastest} is faster",
+                    file=sys.stderr,
+                )
+
+            # Step 2.3
+            if "upsert" in args.operations:
+                shuffled_path = write_data_file(
+                    data_dir, width, n_rows, shuffled=True
+                )
+                update_argument = {
+                    column: "replace"
+                    for column in [
+                        f"c{i:03d}" for i in range(len(column_types(width)))
+                    ]
+                }
+                hit_rates = {}
+                for order_by in ORDER_BY_OPTIONS:
+                    options = {"order_by": order_by}
+                    measurement = measure(
+                        model=model,
+                        path=shuffled_path,
+                        input_type="path",
+                        operation="upsert",
+                        update_operation=update_argument,
+                        prefill=True,
+                        options=options,
+                    )
+                    buffers = measure_buffers(
+                        model=model,
+                        path=shuffled_path,
+                        operation="upsert",
+                        update_operation=update_argument,
+                        options=options,
+                    )
+                    result = {
+                        "operation": "upsert",
+                        "update_operation": "replace",
+                        "input_type": "path",
+                        "width": width,
+                        "rows": n_rows,
+                        "order_by": order_by,
+                        "rows_per_second": n_rows / measurement["seconds"],
+                        **measurement,
+                        **buffers,
+                    }
+                    results.append(result)
+                    hit_rates[order_by] = result["buffer_hit_rate"]
+                print(
+                    f"order_by w{width} n{n_rows}: "
+                    + ", ".join(
+                        f"{'on' if order_by else 'off'} {value:.2%} buffer hits"
+                        for order_by, value in hit_rates.items()
+                    ),
+                    file=sys.stderr,
+                )
+
+    # Step 3
+    output = {
+        "meta": {
+            "timestamp": datetime.datetime.now(
+                datetime.timezone.utc
+            ).isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "postgresql": connection.pg_version,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(args.output, mode="w") as file:
+        json.dump(output, file, indent=2)
+
+    # Step 4
+    if args.baseline is not None:
+        with open(args.baseline, mode="r") as file:
+            baseline = json.load(file)["results"]
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,14 @@
+from .dump import CopyDumper
+from .graph import LoadGraph
 from .load import CopyLoader
 from .managers import CopyLoadQuerySet, CopyLoadManager
+from .spec import LoadSpec
 
 __all__ = (
+    "CopyDumper",
     "CopyLoader",
     "CopyLoadQuerySet",
     "CopyLoadManager",
+    "LoadGraph",
+    "LoadSpec",
 )
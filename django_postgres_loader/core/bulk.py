@@ -0,0 +1,138 @@
+"""Bookkeeping for the indexes that bulk-mode loads suspend."""
+
+# standard library imports
+from typing import List, Tuple
+
+# third-party imports
+from django.db import connections
+
+# local imports
+from . import definitions
+
+
+def record_suspended_indexes(
+    cursor,
+    table_name: str,
+    indexes: List[Tuple[str, str]],
+) -> None:
+    """Record the definitions of indexes that are about to be dropped.
+
+    The definitions are stored in the definitions.SUSPENDED_INDEX_TABLE table
+    of the current schema (created if needed), so that they survive the
+    process: if a load is interrupted before it rebuilds an index, then
+    restore_suspended_indexes can still rebuild it. Outside a transaction,
+    they are committed before this returns.
+
+    Args:
+        cursor:
+            Cursor.
+        table_name (str):
+            The name of the table the indexes belong to.
+        indexes (list[tuple[str, str]]):
+            The (name, definition) of each index.
+
+    Returns:
+        None
+    """
+    # Step 1
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS "{definitions.SUSPENDED_INDEX_TABLE}" (\n'
+        "\tindex_name text PRIMARY KEY,\n"
+        "\ttable_name text NOT NULL,\n"
+        "\tdefinition text NOT NULL,\n"
+        "\tsuspended_at timestamp with time zone NOT NULL DEFAULT now()\n"
+        ")"
+    )
+
+    # Step 2
+    for name, definition in indexes:
+        cursor.execute(
+            f'INSERT INTO "{definitions.SUSPENDED_INDEX_TABLE}" '
+            "(index_name, table_name, definition) VALUES (%s, %s, %s) "
+            "ON CONFLICT (index_name) DO UPDATE SET "
+            "table_name = EXCLUDED.table_name, "
+            "definition = EXCLUDED.definition, "
+            "suspended_at = EXCLUDED.suspended_at",
+            [name, table_name, definition],
+        )
+
+
+def forget_suspended_index(cursor, index_name: str) -> None:
+    """Remove the record of an index that has been rebuilt.
+
+    Args:
+        cursor:
+            Cursor.
+        index_name (str):
+            The name of the index, as recorded by record_suspended_indexes.
+
+    Returns:
+        None
+    """
+    # Step 1
+    cursor.execute(
+        f'DELETE FROM "{definitions.SUSPENDED_INDEX_TABLE}" '
+        "WHERE index_name = %s",
+        [index_name],
+    )
+
+
+def list_suspended_indexes(using: str = "default") -> List[Tuple[str, str]]:
+    """List the indexes dropped by bulk-mode loads that were never rebuilt.
+
+    An index stays recorded if the load that dropped it was interrupted (e.g.
+    its process was killed) or failed to rebuild it.
+
+    Args:
+        using (str):
+            The alias of the database.
+
+    Returns (list[tuple[str, str]]):
+        The (name, definition) of each index, in order of name.
+    """
+    # Step 1
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT to_regclass(%s) IS NULL",
+            [f'"{definitions.SUSPENDED_INDEX_TABLE}"'],
+        )
+        if cursor.fetchone()[0]:
+            return []
+
+        # Step 2
+        cursor.execute(
+            "SELECT index_name, definition "
+            f'FROM "{definitions.SUSPENDED_INDEX_TABLE}" '
+            "ORDER BY index_name"
+        )
+        return [(name, definition) for name, definition in cursor.fetchall()]
+
+
+def restore_suspended_indexes(using: str = "default") -> List[str]:
+    """Rebuild the indexes listed by list_suspended_indexes.
+
+    Indexes that already exist again are only removed from the record. This
+    should only be called when no bulk-mode loads are in progress on the
+    database, since theirs are listed too.
+
+    Args:
+        using (str):
+            The alias of the database.
+
+    Returns (list[str]):
+        The names of the indexes rebuilt.
+    """
+    # Step 1
+    restored = []
+    with connections[using].cursor() as cursor:
+        for name, definition in list_suspended_indexes(using=using):
+            cursor.execute("SELECT to_regclass(%s) IS NULL", [name])
+            if cursor.fetchone()[0]:
+                cursor.execute(definition)
+                restored.append(name)
+
+            # Step 2
+            forget_suspended_index(cursor, name)
+
+    # Step 3
+    return restored
@@ -0,0 +1,135 @@
+"""Helpers for filling model columns that are missing from the data."""
+
+# standard library imports
+import datetime
+import json
+from typing import List, Optional
+import uuid
+
+# third-party imports
+from django.db import models
+from django.utils import timezone
+
+# local imports
+from . import sql
+
+
+def has_default(field: models.Field) -> bool:
+    """Check whether [field] has a value Django would fill in on save.
+
+    Auto-incrementing primary keys and fields with a database default are
+    filled by the database itself, so they do not count.
+
+    Args:
+        field (models.Field):
+            The field to check.
+
+    Returns (bool):
+        True if [field] is auto_now/auto_now_add or has a Django default.
+    """
+    # Step 1
+    if isinstance(field, models.AutoField):
+        return False
+    db_default = getattr(field, "db_default", models.NOT_PROVIDED)
+    if db_default is not models.NOT_PROVIDED:
+        return False
+
+    # Step 2
+    if getattr(field, "auto_now", False) or getattr(
+        field, "auto_now_add", False
+    ):
+        return True
+
+    # Step 3
+    return field.has_default()
+
+
+def get_default_sql(field: models.Field, connection) -> Optional[str]:
+    """Render the default value of [field] as SQL, if possible.
+
+    Steps:
+        1.  auto_now and auto_now_add fields use the transaction timestamp.
+        2.  Static defaults are rendered as literals.
+        3.  Callable defaults with a server-side equivalent (uuid4 on
+            PostgreSQL 13+, timezone.now, datetime.now, date.today) use it.
+        4.  Any other callable default cannot be rendered.
+
+    Args:
+        field (models.Field):
+            A field for which has_default is True.
+        connection:
+            The database connection the SQL is for.
+
+    Returns ([str]):
+        A SQL expression giving the default, or None if the default must be
+        generated client-side (once per row).
+    """
+    # Step 1
+    if getattr(field, "auto_now", False) or getattr(
+        field, "auto_now_add", False
+    ):
+        return "now()"
+
+    # Step 2
+    if not callable(field.default):
+        value = field.get_db_prep_save(field.get_default(), connection)
+        return sql.interpolate(connection, "%s", [value])
+
+    # Step 3
+    if (field.default is uuid.uuid4) and (connection.pg_version >= 130000):
+        return "gen_random_uuid()"
+    elif field.default in (timezone.now, datetime.datetime.now):
+        return "now()"
+    elif field.default is datetime.date.today:
+        return "CURRENT_DATE"
+
+    # Step 4
+    return None
+
+
+def to_copy_text(field: models.Field, value) -> Optional[str]:
+    """Render a Python value of [field] as text PostgreSQL can cast back.
+
+    Args:
+        field (models.Field):
+            The field the value belongs to.
+        value:
+            The value.
+
+    Returns ([str]):
+        The text representation of [value], or None if it is null.
+    """
+    # Step 1
+    value = field.get_prep_value(value)
+
+    # Step 2
+    if value is None:
+        return None
+    elif isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, (dict, list)):
+        return json.dumps(value)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    else:
+        return str(value)
+
+
+def format_csv_row(values: List[Optional[str]]) -> str:
+    """Format a row of text values as a line of PostgreSQL CSV.
+
+    Every non-null value is quoted, so that empty strings and nulls (written as
+    unquoted empty fields) stay distinct.
+
+    Args:
+        values (list[[str]]):
+            The values of the row.
+
+    Returns (str):
+        The CSV line, including its line terminator.
+    """
+    fields = [
+        "" if value is None else '"' + value.replace('"', '""') + '"'
+        for value in values
+    ]
+    return ",".join(fields) + "\n"
@@ -14,8 +14,32 @@ INCLUDED_OPERATIONS = [
     "safe_append",
     "update",
     "upsert",
+    "delete",
+    "sync",
 ]
 
+INCLUDED_ENGINES = [
+    "on_conflict",
+    "merge",
+    "auto",
+]
+
+MERGE_ENGINE_MIN_VERSIONS = {
+    "update": 150000,
+    "upsert": 150000,
+    "delete": 150000,
+    "sync": 170000,
+}
+
+INCLUDED_ADVISORY_LOCKS = [
+    "model",
+    "bucket",
+]
+
+DEFAULT_LOCK_BUCKETS = 64
+
+MODEL_LOCK_BUCKET = -1
+
 INCLUDED_UPDATE_OPERATIONS = [
     "add",
     "subtract_new",
@@ -30,3 +54,98 @@ INCLUDED_UPDATE_OPERATIONS = [
     "least",
     None,
 ]
+
+INCLUDED_COPY_FORMATS = [
+    "csv",
+    "binary",
+]
+
+INCLUDED_SOURCES = [
+    "client",
+    "server",
+]
+
+SERVER_HEADER_READ_SIZE = 65536
+
+INCLUDED_COMPRESSIONS = [
+    "gzip",
+    "bz2",
+    "xz",
+]
+
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+}
+
+COMPRESSION_MAGIC_NUMBERS = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+}
+
+INCLUDED_ON_ERROR = [
+    "abort",
+    "ignore",
+    "reject",
+]
+
+TEMP_TABLE_PREFIX = "tmp_"
+
+MAX_IDENTIFIER_LENGTH = 63
+
+REJECT_TABLE_SUFFIX = "_rejects"
+
+SHARED_STAGING_PREFIX = "dpl_stage_"
+
+ROW_NUMBER_COLUMN = "__dpl_row"
+
+ERROR_COLUMN = "__dpl_error"
+
+ON_ERROR_SKIPPED_PATTERN = r"(\d+) rows? (?:was|were) skipped"
+
+DEFAULTS_BATCH_SIZE = 10000
+
+UNRESOLVED_KEYS_REPORTED = 5
+
+INCLUDED_PROJECTIONS = [
+    "auto",
+    "stream",
+    "stage",
+]
+
+PROJECTION_STREAM_MAX_RATIO = 0.25
+
+PROJECTION_READ_SIZE = 1 << 20
+
+SKIPPED_COLUMN_PREFIX = "__dpl_skip_"
+
+STAGING_PK_FIELD_NAME = "dpl_staging_pk"
+
+STAGING_ALIAS_PREFIX = "dpl_column_"
+
+STAGING_RESERVED_FIELD_NAMES = {"pk", "objects", "Meta", STAGING_PK_FIELD_NAME}
+
+SESSION_PROFILES = {
+    "bulk_load": {
+        "work_mem": "256MB",
+        "maintenance_work_mem": "1GB",
+        "synchronous_commit": "off",
+        "statement_timeout": "0",
+        "temp_buffers": "256MB",
+    },
+}
+
+SESSION_SETTING_PATTERN = r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$"
+
+INDEX_REBUILD_MAX_WORKERS = 4
+
+SUSPENDED_INDEX_TABLE = "dpl_suspended_indexes"
+
+TRANSFER_CSV_OPTIONS = {
+    "null_string": "\\N",
+    "encoding": "UTF8",
+}
@@ -0,0 +1,239 @@
+"""Helpers for compiling Django expressions against a loader's temp table."""
+
+# standard library imports
+import functools
+import keyword
+from typing import Dict, List, Optional, Tuple, Type
+
+# third-party imports
+from django.apps.registry import Apps
+from django.core import exceptions
+from django.db import models
+from django.db.models.sql import Query
+
+# local imports
+from . import definitions, sql
+
+# Django 4.2 raises FullResultSet for conditions that match every row; older
+# versions compile them to an empty string instead
+FullResultSet = getattr(exceptions, "FullResultSet", exceptions.EmptyResultSet)
+
+
+def build_staging_field(
+    field: models.Field,
+    column: str,
+) -> models.Field:
+    """Build a field reading a typed temp table column like a model field.
+
+    Relations are replaced by the field they point to and auto fields by the
+    integer field of the same size, so the staging model has no relations and
+    no sequences; other fields are rebuilt from their deconstructed arguments.
+
+    Args:
+        field (models.Field):
+            The model field whose type the temp table column has.
+        column (str):
+            The name of the temp table column.
+
+    Returns (models.Field):
+        An unbound field stored in [column].
+    """
+    # Step 1
+    if field.is_relation:
+        field = field.target_field
+
+    # Step 2
+    if isinstance(field, models.BigAutoField):
+        field_class, args, kwargs = models.BigIntegerField, [], {}
+    elif isinstance(field, getattr(models, "SmallAutoField", ())):
+        field_class, args, kwargs = models.SmallIntegerField, [], {}
+    elif isinstance(field, models.AutoField):
+        field_class, args, kwargs = models.IntegerField, [], {}
+    else:
+        _, _, args, kwargs = field.deconstruct()
+        field_class = field.__class__
+
+    # Step 3
+    kwargs.update(
+        db_column=column,
+        primary_key=False,
+        unique=False,
+        null=True,
+    )
+    kwargs.pop("default", None)
+    return field_class(*args, **kwargs)
+
+
+def get_staging_field_name(column: str, index: int) -> str:
+    """Get the name of the staging model field stored in a temp table column.
+
+    A column is named after itself if that is a safe Django field name. If not
+    (e.g. "pk", "objects", or "Meta", the name of a Model attribute such as
+    "save", a name containing "__", which would be read as a lookup, a name
+    starting with definitions.STAGING_ALIAS_PREFIX, or any name that is not a
+    Python identifier), then it is given an alias based on its position, so
+    that it cannot shadow or break the rest of the model.
+    Aliased columns can only be referenced from SQL transforms and conditions.
+
+    Args:
+        column (str):
+            The name of the temp table column.
+        index (int):
+            The position of the column in the temp table.
+
+    Returns (str):
+        The name of the field.
+    """
+    if (
+        column.isidentifier()
+        and (not keyword.iskeyword(column))
+        and ("__" not in column)
+        and (not column.startswith("_"))
+        and (not column.endswith("_"))
+        and (not column.startswith(definitions.STAGING_ALIAS_PREFIX))
+        and (column not in definitions.STAGING_RESERVED_FIELD_NAMES)
+        and (not hasattr(models.Model, column))
+    ):
+        return column
+    return f"{definitions.STAGING_ALIAS_PREFIX}{index}"
+
+
+def build_staging_model(
+    table_name: str,
+    columns: List[str],
+    fields: Optional[Dict[str, models.Field]] = None,
+) -> Type[models.Model]:
+    """Build an unmanaged model describing a temp table.
+
+    Columns are TextFields, matching how the temp table is staged when
+    expressions are read from it, unless the model field whose type a column
+    has is given in [fields]. Fields are named after their columns where
+    possible (see get_staging_field_name). The model's primary key is a
+    synthetic field that is never read, so no column of the data takes that
+    role. The model is registered in its own app registry, so it never clashes
+    with (or appears among) the project's models, and is cached, so building
+    the same model again is free.
+
+    Args:
+        table_name (str):
+            The name of the temp table.
+        columns (list[str]):
+            The names of the temp table's columns.
+        fields ([dict[str, models.Field]]):
+            The model field (keyed by column) whose type each typed column of
+            the temp table has.
+
+    Returns (models.Model):
+        A model whose fields are stored in [columns].
+    """
+    fields = fields or {}
+    return _build_staging_model(
+        table_name,
+        tuple(columns),
+        tuple(
+            (column, fields[column]) for column in columns if column in fields
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _build_staging_model(
+    table_name: str,
+    columns: Tuple[str, ...],
+    fields: Tuple[Tuple[str, models.Field], ...],
+) -> Type[models.Model]:
+    """Build (and cache) the model of build_staging_model.
+
+    Args:
+        table_name (str):
+            The name of the temp table.
+        columns (tuple[str]):
+            The names of the temp table's columns.
+        fields (tuple[tuple[str, models.Field]]):
+            The model field whose type each typed column has, as pairs.
+
+    Returns (models.Model):
+        A model whose fields are stored in [columns].
+    """
+    # Step 1
+    typed_fields = dict(fields)
+    attrs = {
+        "__module__": __name__,
+        definitions.STAGING_PK_FIELD_NAME: models.IntegerField(
+            db_column=definitions.STAGING_PK_FIELD_NAME,
+            primary_key=True,
+        ),
+    }
+    for index, column in enumerate(columns):
+        field_name = get_staging_field_name(column, index)
+        if column in typed_fields:
+            attrs[field_name] = build_staging_field(
+                typed_fields[column],
+                column,
+            )
+        else:
+            attrs[field_name] = models.TextField(db_column=column)
+
+    # Step 2
+    meta = type(
+        "Meta",
+        (),
+        {
+            "app_label": "django_postgres_loader",
+            "db_table": table_name,
+            "managed": False,
+            "apps": Apps(),
+        },
+    )
+    attrs["Meta"] = meta
+
+    # Step 3
+    return type(f"Staging_{table_name}", (models.Model,), attrs)
+
+
+def compile_expression(
+    expression,
+    model: Type[models.Model],
+    connection,
+) -> str:
+    """Compile a Django expression (or Q object) into a SQL snippet.
+
+    Steps:
+        1.  Resolve [expression] against a query on [model], so that F()
+            references become columns of [model]'s table.
+        2.  Compile the resolved expression. A condition that Django proves
+            matches no rows (or every row), e.g. Q(pk__in=[]), compiles to
+            FALSE (or TRUE).
+        3.  Interpolate its parameters, since the snippet is rendered into a
+            template rather than executed with bind parameters.
+
+    Args:
+        expression (Expression|Q):
+            The expression to compile.
+        model (models.Model):
+            The model whose fields [expression] refers to (see
+            build_staging_model).
+        connection:
+            The database connection to compile for.
+
+    Returns (str):
+        The SQL of [expression].
+    """
+    # Step 1
+    query = Query(model)
+    query.get_initial_alias()
+    resolved = expression.resolve_expression(query, allow_joins=False)
+
+    # Step 2
+    compiler = query.get_compiler(connection=connection)
+    try:
+        snippet, params = compiler.compile(resolved)
+    except exceptions.EmptyResultSet:
+        return "FALSE"
+    except FullResultSet:
+        return "TRUE"
+    if snippet == "":
+        return "TRUE"
+
+    # Step 3
+    return sql.interpolate(connection, snippet, params)
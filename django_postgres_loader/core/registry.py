@@ -0,0 +1,169 @@
+"""Per-model metadata registry shared across loader instances."""
+
+# standard library imports
+import threading
+from typing import Dict, List, Optional, Set, Tuple, Type
+
+# third-party imports
+from django.db import models
+
+
+class ModelMetadata:
+    """Introspected details of a model on a particular database connection."""
+
+    def __init__(
+        self,
+        model: Type[models.Model],
+        connection,
+    ):
+        """Introspect [model] on [connection].
+
+        Steps:
+            1.  Store the model, its table name, and the connection's alias.
+            2.  Map each concrete field's attname to its column (and vice
+                versa) and record the list of column names.
+            3.  Record the database type and the cast type of each column, and
+                which columns are NOT NULL or auto_now.
+            4.  Record the primary key column and all valid conflict targets.
+
+        Args:
+            model (models.Model):
+                The model to introspect.
+            connection:
+                The database connection whose types should be used.
+        """
+        # Step 1
+        self.model = model
+        self.db_table = model._meta.db_table
+        self.alias = connection.alias
+
+        # Step 2
+        self.fields_by_column: Dict[str, models.Field] = dict()
+        self.attname_to_column: Dict[str, str] = dict()
+        self.column_to_attname: Dict[str, str] = dict()
+        self.columns: List[str] = []
+        for f in model._meta.fields:
+            attname, column = f.get_attname_column()
+            self.fields_by_column[column] = f
+            self.attname_to_column[attname] = column
+            self.column_to_attname[column] = attname
+            self.columns.append(column)
+
+        # Step 3
+        self.db_types: Dict[str, str] = dict()
+        self.cast_types: Dict[str, str] = dict()
+        for column, f in self.fields_by_column.items():
+            self.db_types[column] = f.db_type(connection)
+            self.cast_types[column] = f.cast_db_type(connection)
+        self.not_null_columns: Set[str] = {
+            column for column, f in self.fields_by_column.items() if not f.null
+        }
+        self.auto_now_columns: Set[str] = {
+            column
+            for column, f in self.fields_by_column.items()
+            if getattr(f, "auto_now", False)
+        }
+
+        # Step 4
+        self.pk_column = model._meta.pk.get_attname_column()[1]
+        self.valid_conflict_targets = self.get_valid_conflict_targets()
+
+    def get_valid_conflict_targets(self) -> List[Set[str]]:
+        """Get a list of all sets of columns that are unique within the model.
+
+        A set of columns in a valid conflict target if the columns are required
+        to be unique within the model. This can be met in the following ways:
+            *   The column that serves as the model's primary key
+            *   Any column in the model for which unique=True
+            *   Any column(s) for which a UniqueConstraint is defined
+            *   Any column(s) listed in unique_together
+
+        Returns (list[set[str]]:
+            All permissible values of a conflict target.
+        """
+        # Step 1
+        valid_conflict_targets = [{self.pk_column}]
+
+        # Step 2
+        for f in self.model._meta.get_fields():
+            if (hasattr(f, "unique")) and (f.unique) and (not f.primary_key):
+                field_name = f.get_attname_column()[1]
+                valid_conflict_targets.append({field_name})
+
+        # Step 3
+        for c in self.model._meta.constraints:
+            if isinstance(c, models.UniqueConstraint):
+                valid_conflict_targets.append(set(c.fields))
+
+        # Step 4
+        if self.model._meta.unique_together:
+            valid_conflict_targets.append(set(self.model._meta.unique_together))
+
+        # Step 5
+        return valid_conflict_targets
+
+
+_registry: Dict[Tuple[str, str], ModelMetadata] = dict()
+_registry_lock = threading.Lock()
+
+
+def get_model_metadata(
+    model: Type[models.Model],
+    connection,
+) -> ModelMetadata:
+    """Get the cached metadata for [model] on [connection].
+
+    Metadata is built lazily the first time a model is used with a database
+    alias and reused afterwards. Entries are keyed by the model's label, so if
+    the model's class has been reloaded (e.g. by a development autoreloader or a
+    test creating a new class with the same label), then the stale entry is
+    detected by identity and rebuilt.
+
+    Steps:
+        1.  Look up the cached entry for the model and alias.
+        2.  If there is no entry, or the entry describes a different class
+            object, then build and store a new entry.
+        3.  Return.
+
+    Args:
+        model (models.Model):
+            The model whose metadata is desired.
+        connection:
+            The database connection whose types should be used.
+
+    Returns (ModelMetadata):
+        The metadata of [model] on [connection].
+    """
+    # Step 1
+    key = (model._meta.label, connection.alias)
+    metadata = _registry.get(key)
+
+    # Step 2
+    if (metadata is None) or (metadata.model is not model):
+        with _registry_lock:
+            metadata = _registry.get(key)
+            if (metadata is None) or (metadata.model is not model):
+                metadata = ModelMetadata(model, connection)
+                _registry[key] = metadata
+
+    # Step 3
+    return metadata
+
+
+def clear_model_metadata(model: Optional[Type[models.Model]] = None) -> None:
+    """Remove cached metadata.
+
+    Args:
+        model ([models.Model]):
+            The model whose metadata should be removed. If not provided, then
+            all cached metadata is removed.
+
+    Returns:
+        None
+    """
+    with _registry_lock:
+        if model is None:
+            _registry.clear()
+        else:
+            for key in [k for k in _registry if k[0] == model._meta.label]:
+                del _registry[key]
@@ -0,0 +1,446 @@
+"""Helpers for reading the data sources handed to COPY."""
+
+# standard library imports
+import bz2
+import codecs
+import gzip
+import lzma
+import os
+import re
+from typing import List, Optional
+
+# local imports
+from . import definitions
+
+
+def python_encoding(pg_encoding: str = None) -> str:
+    """Get the Python codec name matching a PostgreSQL encoding name.
+
+    Only the header row of a data source is ever decoded client-side, so if the
+    encoding has no Python equivalent, then UTF-8 is used.
+
+    Steps:
+        1.  If no encoding is provided, then use UTF-8 (the client encoding
+            Django configures for PostgreSQL connections).
+        2.  Normalize PostgreSQL-specific names (e.g. "WIN1252" -> "cp1252",
+            "SQL_ASCII" -> "latin-1").
+        3.  Confirm that Python knows the codec, falling back to UTF-8.
+
+    Args:
+        pg_encoding ([str]):
+            The PostgreSQL encoding name, e.g. "UTF8", "LATIN1", "WIN1252".
+
+    Returns (str):
+        The name of the matching Python codec.
+    """
+    # Step 1
+    if pg_encoding is None:
+        return "utf-8"
+
+    # Step 2
+    name = pg_encoding.strip().strip("'").lower().replace("_", "")
+    if name.startswith("win"):
+        name = "cp" + name[3:]
+    elif name == "sqlascii":
+        name = "latin-1"
+
+    # Step 3
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return "utf-8"
+
+
+def is_rewindable(stream) -> bool:
+    """Check whether [stream] can be rewound to its start.
+
+    Args:
+        stream:
+            A readable stream.
+
+    Returns (bool):
+        True if [stream] is seekable, otherwise False.
+    """
+    seekable = getattr(stream, "seekable", None)
+    return bool(seekable()) if callable(seekable) else False
+
+
+def read_header_line(stream, encoding: str = None) -> str:
+    """Read and decode the first line of [stream].
+
+    Args:
+        stream:
+            A readable text or binary stream positioned at its start.
+        encoding ([str]):
+            The PostgreSQL encoding of [stream] if it is binary.
+
+    Returns (str):
+        The decoded header line.
+    """
+    # Step 1
+    line = stream.readline()
+
+    # Step 2
+    if isinstance(line, bytes):
+        line = line.decode(python_encoding(encoding), errors="replace")
+
+    # Step 3
+    return line
+
+
+def detect_compression_from_name(name: str) -> Optional[str]:
+    """Detect the compression of a file from the suffix of its [name].
+
+    Args:
+        name (str):
+            The name or path of the file.
+
+    Returns ([str]):
+        The compression (one of definitions.INCLUDED_COMPRESSIONS), or None if
+        the suffix is not that of a known compression.
+    """
+    suffix = os.path.splitext(name)[1].lower()
+    return definitions.COMPRESSION_SUFFIXES.get(suffix)
+
+
+def detect_compression(data) -> Optional[str]:
+    """Detect the compression of [data] from its suffix or magic bytes.
+
+    Steps:
+        1.  If [data] is a path (or a file object with a name), then check its
+            suffix.
+        2.  Peek at the first bytes of [data] without consuming them and compare
+            them with known magic numbers. Text streams and streams that can be
+            neither peeked nor rewound are treated as uncompressed.
+
+    Args:
+        data (str|BinaryIO|TextIO):
+            A path or a readable stream.
+
+    Returns ([str]):
+        The compression (one of definitions.INCLUDED_COMPRESSIONS), or None if
+        [data] does not appear to be compressed.
+    """
+    # Step 1
+    name = data if isinstance(data, str) else getattr(data, "name", None)
+    if isinstance(name, str):
+        compression = detect_compression_from_name(name)
+        if compression is not None:
+            return compression
+
+    # Step 2
+    n_bytes = max(len(m) for m in definitions.COMPRESSION_MAGIC_NUMBERS)
+    if isinstance(data, str):
+        with open(file=data, mode="rb") as file:
+            head = file.read(n_bytes)
+    elif hasattr(data, "peek"):
+        head = data.peek(n_bytes)[:n_bytes]
+    elif is_rewindable(data):
+        position = data.tell()
+        head = data.read(n_bytes)
+        data.seek(position)
+    else:
+        return None
+
+    if not isinstance(head, bytes):
+        return None
+    magic_numbers = definitions.COMPRESSION_MAGIC_NUMBERS
+    for magic_number, compression in magic_numbers.items():
+        if head.startswith(magic_number):
+            return compression
+
+    return None
+
+
+def decompress(stream, compression: str):
+    """Wrap [stream] in a streaming decompressor.
+
+    Args:
+        stream (BinaryIO):
+            A readable binary stream of compressed data.
+        compression (str):
+            One of definitions.INCLUDED_COMPRESSIONS.
+
+    Returns (BinaryIO):
+        A readable binary stream of decompressed data. Closing it does not
+        close [stream].
+    """
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    elif compression == "bz2":
+        return bz2.BZ2File(stream, mode="rb")
+    elif compression == "xz":
+        return lzma.LZMAFile(stream, mode="rb")
+    else:
+        raise ValueError(
+            f"Compression must be one of: {', '.join(definitions.INCLUDED_COMPRESSIONS)}."
+        )
+
+
+def compress(stream, compression: str):
+    """Wrap [stream] in a streaming compressor.
+
+    Args:
+        stream (BinaryIO):
+            A writable binary stream.
+        compression (str):
+            One of definitions.INCLUDED_COMPRESSIONS.
+
+    Returns (BinaryIO):
+        A writable binary stream whose data is compressed into [stream].
+        Closing it flushes the compressor but does not close [stream].
+    """
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=stream, mode="wb")
+    elif compression == "bz2":
+        return bz2.BZ2File(stream, mode="wb")
+    elif compression == "xz":
+        return lzma.LZMAFile(stream, mode="wb")
+    else:
+        raise ValueError(
+            f"Compression must be one of: {', '.join(definitions.INCLUDED_COMPRESSIONS)}."
+        )
+
+
+class PrefixedReader:
+    """Stream that replays already-read data before the rest of a stream.
+
+    Used when the header row of a stream that cannot be rewound has been read
+    for column detection, so that COPY still sees (and skips) the header. The
+    reader can be rewound to its start until data beyond the prefix is read.
+    """
+
+    def __init__(self, prefix, stream):
+        """Instantiate a PrefixedReader instance.
+
+        Args:
+            prefix (bytes|str):
+                The data already read from [stream].
+            stream:
+                The remainder of the data.
+        """
+        self.prefix = prefix
+        self.stream = stream
+        self.position = 0
+        self.started = False
+
+    def read(self, size: int = -1):
+        """Read up to [size] bytes or characters.
+
+        Args:
+            size (int):
+                The maximum amount to read. If negative, read everything.
+
+        Returns (bytes|str):
+            The data read.
+        """
+        # Step 1
+        if self.position < len(self.prefix):
+            if (size is None) or (size < 0):
+                data = self.prefix[self.position :] + self.stream.read()
+                self.position = len(self.prefix)
+                self.started = True
+            else:
+                data = self.prefix[self.position : self.position + size]
+                self.position += len(data)
+            return data
+
+        # Step 2
+        self.started = True
+        return self.stream.read(size)
+
+    def readline(self, size: int = -1):
+        """Read the next line.
+
+        Args:
+            size (int):
+                Ignored; present for file-like compatibility.
+
+        Returns (bytes|str):
+            The line read.
+        """
+        if self.position < len(self.prefix):
+            data = self.prefix[self.position :]
+            self.position = len(self.prefix)
+            return data
+        self.started = True
+        return self.stream.readline()
+
+    def seekable(self) -> bool:
+        """Report whether the reader can still be rewound to its start."""
+        return not self.started
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Rewind the reader to its start.
+
+        Args:
+            offset (int):
+                Must be 0.
+            whence (int):
+                Must be 0 (io.SEEK_SET).
+
+        Returns (int):
+            The new position (always 0).
+        """
+        if (offset != 0) or (whence != 0) or self.started:
+            raise OSError("PrefixedReader can only be rewound to its start.")
+        self.position = 0
+        return 0
+
+
+class ColumnProjector:
+    """Stream that re-emits a subset of the fields of a CSV stream.
+
+    Records are split with a single regular expression that keeps each field's
+    raw text, quotes included, so the selected fields reach COPY byte for byte
+    and quoted empty strings stay distinct from NULLs. A record continues onto
+    the next line while it has an odd number of quote characters (a newline
+    inside a quoted field).
+    """
+
+    def __init__(
+        self,
+        stream,
+        indexes: List[int],
+        n_columns: int,
+        delimiter: str = ",",
+        quote_character: Optional[str] = None,
+        encoding: Optional[str] = None,
+    ):
+        """Instantiate a ColumnProjector instance.
+
+        Args:
+            stream:
+                A readable text or binary stream of CSV data.
+            indexes (list[int]):
+                The positions of the fields to keep, in order.
+            n_columns (int):
+                The number of fields every record of [stream] must have.
+            delimiter (str):
+                The character separating fields.
+            quote_character ([str]):
+                The quoting character. If not provided, then '"' is used.
+            encoding ([str]):
+                The PostgreSQL encoding of [stream] if it is binary; the
+                projected data is encoded the same way.
+        """
+        # Step 1
+        self.stream = stream
+        self.indexes = indexes
+        self.n_columns = n_columns
+        self.delimiter = delimiter
+        self.quote_character = quote_character or '"'
+
+        # Step 2
+        self.codec = python_encoding(encoding)
+        self.decoder = codecs.getincrementaldecoder(self.codec)(errors="strict")
+        delimiter, quote = re.escape(delimiter), re.escape(self.quote_character)
+        self.field_pattern = re.compile(
+            f"((?:[^{delimiter}{quote}]|{quote}[^{quote}]*{quote})*){delimiter}"
+        )
+
+        # Step 3
+        self.line_number = 0
+        self.partial = ""
+        self.record = ""
+        self.buffer = b""
+        self.offset = 0
+        self.exhausted = False
+
+    def project(self, lines: List[str]) -> str:
+        """Project complete lines of data.
+
+        Args:
+            lines (list[str]):
+                Lines of data without their trailing newlines.
+
+        Returns (str):
+            The projected records, each ending with a newline.
+        """
+        projected = []
+        for line in lines:
+            # Step 1
+            self.line_number += 1
+            record = self.record + line
+            if record.count(self.quote_character) % 2 == 1:
+                self.record = record + "\n"
+                continue
+            self.record = ""
+
+            # Step 2
+            if record.endswith("\r"):
+                record = record[:-1]
+            fields = self.field_pattern.findall(record + self.delimiter)
+            if len(fields) != self.n_columns:
+                raise ValueError(
+                    f"Line {self.line_number} of the data has {len(fields)} "
+                    f"fields, expected {self.n_columns}."
+                )
+
+            # Step 3
+            projected.append(
+                self.delimiter.join([fields[index] for index in self.indexes])
+            )
+
+        # Step 4
+        return "".join(record + "\n" for record in projected)
+
+    def fill(self) -> None:
+        """Project the next block of [self].stream into [self].buffer.
+
+        Returns:
+            None
+        """
+        # Step 1
+        chunk = self.stream.read(definitions.PROJECTION_READ_SIZE)
+        final = len(chunk) == 0
+        if isinstance(chunk, bytes):
+            chunk = self.decoder.decode(chunk, final=final)
+
+        # Step 2
+        lines = (self.partial + chunk).split("\n")
+        self.partial = lines.pop()
+        if final:
+            if (len(self.partial) > 0) or (len(self.record) > 0):
+                lines.append(self.partial)
+            self.partial = ""
+            self.exhausted = True
+
+        # Step 3
+        self.buffer = self.buffer[self.offset :] + self.project(lines).encode(
+            self.codec
+        )
+        self.offset = 0
+        if self.exhausted and (len(self.record) > 0):
+            raise ValueError("The data ends inside a quoted field.")
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to [size] bytes of projected data.
+
+        Args:
+            size (int):
+                The maximum number of bytes to read. If negative, read
+                everything.
+
+        Returns (bytes):
+            The data read; empty at the end of the data.
+        """
+        # Step 1
+        while (not self.exhausted) and (
+            (size is None)
+            or (size < 0)
+            or (len(self.buffer) - self.offset < size)
+        ):
+            self.fill()
+
+        # Step 2
+        end = len(self.buffer)
+        if (size is not None) and (size >= 0):
+            end = min(end, self.offset + size)
+        data = self.buffer[self.offset : end]
+        self.offset = end
+        return data
+
+    def readable(self) -> bool:
+        """Report that the projector can be read from."""
+        return True
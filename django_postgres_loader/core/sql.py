@@ -0,0 +1,105 @@
+"""Helpers for rendering values into SQL templates and reading the catalog."""
+
+# standard library imports
+import re
+from typing import Dict
+
+# local imports
+from . import sources
+
+
+def quote_literal(value: str) -> str:
+    """Render [value] as a PostgreSQL string literal.
+
+    Args:
+        value (str):
+            The value to quote.
+
+    Returns (str):
+        [value] enclosed in single quotes, with embedded single quotes doubled.
+    """
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
+def interpolate(connection, query: str, params) -> str:
+    """Render [params] into [query] client-side.
+
+    Used where bind parameters are not accepted, e.g. inside COPY or in SQL
+    that is rendered into a template.
+
+    Args:
+        connection:
+            The database connection whose quoting rules should be used.
+        query (str):
+            The query, with %s placeholders.
+        params:
+            The parameters of [query].
+
+    Returns (str):
+        [query] with [params] rendered as literals.
+    """
+    # Step 1
+    with connection.cursor() as cursor:
+        query = cursor.mogrify(query, params)
+
+    # Step 2
+    if isinstance(query, bytes):
+        query = query.decode(
+            sources.python_encoding(connection.connection.encoding)
+        )
+
+    # Step 3
+    return query
+
+
+def strip_length(cast_type: str) -> str:
+    """Remove the length modifier of a character type.
+
+    An explicit cast to a character type with a length silently truncates the
+    value, whereas assigning it to a column of that type raises an error, so
+    values are cast without the length. A bare "char" (or "character") means
+    char(1), so fixed-length character types become "bpchar", the same type
+    with no length limit.
+
+    Args:
+        cast_type (str):
+            The type, e.g. "varchar(20)" or "char(3)".
+
+    Returns (str):
+        [cast_type] without its length if it is a character type, e.g.
+        "varchar" or "bpchar"; otherwise, [cast_type] unchanged.
+    """
+    lowered = cast_type.lower()
+    if lowered.startswith(("varchar", "character varying")):
+        return re.sub(r"\s*\(\d+\)$", "", cast_type)
+    elif lowered.startswith(("char", "bpchar")):
+        return "bpchar"
+    return cast_type
+
+
+def get_column_types(connection, table: str) -> Dict[str, str]:
+    """Get the types of the columns of [table] as the server formats them.
+
+    Types are read from the catalog with format_type(), so they include any
+    modifiers (e.g. "character varying(20)" or "numeric(8,2)") and reflect
+    the table as it exists, whatever its model declares.
+
+    Args:
+        connection:
+            The database connection.
+        table (str):
+            The name of the table.
+
+    Returns (dict[str, str]):
+        The type of each column, keyed on column name.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT attname, format_type(atttypid, atttypmod) "
+            "FROM pg_attribute "
+            "WHERE (attrelid = %s::regclass) AND (attnum > 0) "
+            "AND (NOT attisdropped)",
+            [f'"{table}"'],
+        )
+        return dict(cursor.fetchall())
@@ -0,0 +1,60 @@
+"""Housekeeping for staging tables shared between connections."""
+
+# standard library imports
+from typing import List
+
+# third-party imports
+from django.db import connections
+
+# local imports
+from . import definitions
+
+
+def list_shared_staging_tables(using: str = "default") -> List[str]:
+    """List the shared staging tables in the current schema of a database.
+
+    Shared staging tables (see CopyLoader.set_shared_staging) are UNLOGGED
+    tables whose generated names start with definitions.SHARED_STAGING_PREFIX.
+    Unlike temp tables, they are not removed when a session ends, so a process
+    killed mid-load leaves its table behind.
+
+    Args:
+        using (str):
+            The alias of the database.
+
+    Returns (list[str]):
+        The names of the tables, in alphabetical order.
+    """
+    pattern = definitions.SHARED_STAGING_PREFIX.replace("_", "\\_") + "%"
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_class AS c "
+            "JOIN pg_namespace AS n ON n.oid = c.relnamespace "
+            "WHERE (c.relkind = 'r') AND (c.relpersistence = 'u') "
+            "AND (n.nspname = current_schema()) AND (c.relname LIKE %s) "
+            "ORDER BY c.relname",
+            [pattern],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def drop_shared_staging_tables(using: str = "default") -> List[str]:
+    """Drop the shared staging tables left behind by interrupted loads.
+
+    Every table listed by list_shared_staging_tables is dropped, including
+    that of any load still running, so this should only be called when no
+    loads with parallel copies (or concurrently-staged load graphs) are in
+    progress on the database.
+
+    Args:
+        using (str):
+            The alias of the database.
+
+    Returns (list[str]):
+        The names of the tables dropped.
+    """
+    tables = list_shared_staging_tables(using=using)
+    with connections[using].cursor() as cursor:
+        for table in tables:
+            cursor.execute(f'DROP TABLE IF EXISTS "{table}"')
+    return tables
@@ -0,0 +1,307 @@
+"""Bounded in-memory byte streams for overlapping producers and consumers."""
+
+# standard library imports
+import contextlib
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, Optional
+
+
+class ChunkReader:
+    """Readable binary stream over an iterator of byte chunks.
+
+    Chunks are only requested from the iterator as they are read, so it can be
+    a generator streaming data of any size (e.g. CopyDumper.iterate).
+    """
+
+    def __init__(self, chunks: Optional[Iterable[bytes]] = None):
+        """Instantiate a ChunkReader instance.
+
+        Args:
+            chunks ([Iterable[bytes]]):
+                The chunks of data. Empty chunks are skipped.
+        """
+        self._chunks = iter(chunks) if chunks is not None else None
+        self._chunk = b""
+        self._offset = 0
+        self._eof = False
+
+    def _next_chunk(self) -> Optional[bytes]:
+        """Get the next chunk of data.
+
+        Returns ([bytes]):
+            The chunk, or None at the end of the data.
+        """
+        return next(self._chunks, None)
+
+    def _fill(self) -> bool:
+        """Make sure the current chunk has unread data.
+
+        Returns (bool):
+            False if the end of the data has been reached, otherwise True.
+        """
+        while self._offset >= len(self._chunk):
+            if self._eof:
+                return False
+            chunk = self._next_chunk()
+            if chunk is None:
+                self._eof = True
+                return False
+            self._chunk = chunk
+            self._offset = 0
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to [size] bytes, blocking until data is available.
+
+        Args:
+            size (int):
+                The maximum number of bytes to read. If negative, then read
+                until the end of the data.
+
+        Returns (bytes):
+            The data read; empty at the end of the data.
+        """
+        pieces = []
+        remaining = size if (size is not None) and (size >= 0) else None
+        while ((remaining is None) or (remaining > 0)) and self._fill():
+            end = len(self._chunk)
+            if remaining is not None:
+                end = min(end, self._offset + remaining)
+                remaining -= end - self._offset
+            pieces.append(self._chunk[self._offset : end])
+            self._offset = end
+        return b"".join(pieces)
+
+    def readline(self, size: int = -1) -> bytes:
+        """Read up to and including the next newline.
+
+        Args:
+            size (int):
+                Ignored; present for file-like compatibility.
+
+        Returns (bytes):
+            The line read; empty at the end of the data.
+        """
+        pieces = []
+        while self._fill():
+            newline = self._chunk.find(b"\n", self._offset)
+            end = len(self._chunk) if newline < 0 else newline + 1
+            pieces.append(self._chunk[self._offset : end])
+            self._offset = end
+            if newline >= 0:
+                break
+        return b"".join(pieces)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the data in chunks as they were written.
+
+        Returns (Iterator[bytes]):
+            The chunks of data.
+        """
+        while self._fill():
+            chunk = self._chunk[self._offset :]
+            self._offset = len(self._chunk)
+            yield chunk
+
+    def readable(self) -> bool:
+        """Report that the stream can be read from."""
+        return True
+
+    def writable(self) -> bool:
+        """Report that the stream cannot be written to."""
+        return False
+
+    def seekable(self) -> bool:
+        """Report that the stream cannot be rewound."""
+        return False
+
+
+class Pipe(ChunkReader):
+    """Bounded, thread-safe byte pipe with a file-like interface on each end.
+
+    A producer calls write() (and finally close_writer()) while a consumer calls
+    read(), readline(), or iterates over the pipe. At most [max_chunks] written
+    chunks are held in memory at any time; a producer that gets ahead of its
+    consumer blocks until the consumer catches up. If the consumer calls
+    close(), then any blocked or subsequent write() raises BrokenPipeError so
+    that the producer can stop.
+    """
+
+    def __init__(self, max_chunks: int = 8):
+        """Instantiate a Pipe instance.
+
+        Args:
+            max_chunks (int):
+                The maximum number of chunks buffered between the producer and
+                the consumer.
+        """
+        super().__init__()
+        self._queue = queue.Queue(maxsize=max_chunks)
+        self._closed = threading.Event()
+
+    def _put(self, item) -> None:
+        """Put [item] on the queue, giving up if the consumer has closed.
+
+        Args:
+            item (bytes|BaseException):
+                A chunk of data, the end-of-data marker (b""), or an error.
+
+        Returns:
+            None
+        """
+        while True:
+            if self._closed.is_set():
+                raise BrokenPipeError("Pipe has been closed by its reader.")
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def write(self, data) -> int:
+        """Write [data] to the pipe, blocking while the pipe is full.
+
+        Args:
+            data (bytes|bytearray|memoryview|str):
+                The data to write. Strings are encoded as UTF-8.
+
+        Returns (int):
+            The number of bytes or characters written.
+        """
+        # Step 1
+        if isinstance(data, str):
+            chunk = data.encode("utf-8")
+        else:
+            chunk = bytes(data)
+
+        # Step 2
+        if chunk:
+            self._put(chunk)
+
+        # Step 3
+        return len(data)
+
+    def close_writer(self, error: Optional[BaseException] = None) -> None:
+        """Signal that the producer has finished.
+
+        Args:
+            error ([BaseException]):
+                If provided, then the consumer's next read raises [error]
+                instead of reaching the end of the data.
+
+        Returns:
+            None
+        """
+        self._put(error if error is not None else b"")
+
+    def _next_chunk(self) -> Optional[bytes]:
+        """Wait for the next chunk written by the producer.
+
+        Returns ([bytes]):
+            The chunk, or None once the producer has finished.
+        """
+        item = self._queue.get()
+        if isinstance(item, BaseException):
+            self._eof = True
+            raise item
+        return item if item != b"" else None
+
+    def writable(self) -> bool:
+        """Report that the pipe can be written to."""
+        return True
+
+    def close(self) -> None:
+        """Close the reading end of the pipe, unblocking the producer.
+
+        Returns:
+            None
+        """
+        self._closed.set()
+        self._eof = True
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+
+@contextlib.contextmanager
+def produce_in_thread(
+    producer: Callable[[Pipe], None],
+    max_chunks: int = 8,
+) -> Iterator[Pipe]:
+    """Run [producer] on a background thread, writing into a Pipe.
+
+    The producer's writes are closed automatically when it returns, and any
+    exception it raises is re-raised in the consumer when it next reads. On
+    exit, the pipe is closed (stopping a producer that has not finished) and the
+    thread is joined.
+
+    Args:
+        producer (Callable[[Pipe], None]):
+            Function writing data into the pipe it is given.
+        max_chunks (int):
+            The maximum number of chunks buffered between the producer and the
+            consumer.
+
+    Returns (Iterator[Pipe]):
+        Context manager yielding the reading end of the pipe.
+    """
+    # Step 1
+    pipe = Pipe(max_chunks=max_chunks)
+
+    def run():
+        try:
+            producer(pipe)
+            pipe.close_writer()
+        except BrokenPipeError:
+            pass
+        except BaseException as error:
+            try:
+                pipe.close_writer(error)
+            except BrokenPipeError:
+                pass
+
+    # Step 2
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+
+    # Step 3
+    try:
+        yield pipe
+    finally:
+        pipe.close()
+        thread.join()
+
+
+def read_in_thread(
+    stream,
+    chunk_size: int = 1024 * 1024,
+    max_chunks: int = 8,
+) -> contextlib.AbstractContextManager:
+    """Read [stream] on a background thread.
+
+    Useful when reading [stream] is CPU-bound (e.g. decompression), so that the
+    reads overlap with the consumer sending data to the server.
+
+    Args:
+        stream:
+            A readable binary stream.
+        chunk_size (int):
+            The number of bytes to request from [stream] at a time.
+        max_chunks (int):
+            The maximum number of chunks read ahead of the consumer.
+
+    Returns (AbstractContextManager):
+        Context manager yielding a Pipe with the contents of [stream].
+    """
+
+    def producer(pipe: Pipe) -> None:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            pipe.write(chunk)
+
+    return produce_in_thread(producer, max_chunks=max_chunks)
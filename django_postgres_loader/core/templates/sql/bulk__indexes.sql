@@ -0,0 +1,19 @@
+SELECT
+    "pg_index"."indexrelid"::regclass::text,
+    pg_get_indexdef("pg_index"."indexrelid")
+FROM
+    "pg_index"
+WHERE
+    "pg_index"."indrelid" = '"{model_table_name}"'::regclass
+    AND NOT "pg_index"."indisunique"
+    AND NOT EXISTS (
+        SELECT
+            1
+        FROM
+            "pg_constraint"
+        WHERE
+            "pg_constraint"."conindid" = "pg_index"."indexrelid"
+    )
+ORDER BY
+    1
+;
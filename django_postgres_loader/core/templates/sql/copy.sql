@@ -1,7 +1,8 @@
 COPY "{temp_table_name}" (
     {columns}
 )
-FROM STDIN
-WITH CSV HEADER
+FROM {source}
+WITH (
     {header_options}
+)
 ;
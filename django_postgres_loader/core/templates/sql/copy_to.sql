@@ -0,0 +1,8 @@
+COPY (
+    {query}
+)
+TO STDOUT
+WITH (
+    {header_options}
+)
+;
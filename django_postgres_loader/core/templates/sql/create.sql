@@ -1,4 +1,4 @@
-CREATE TEMPORARY TABLE "{temp_table_name}" (
+CREATE {table_type} TABLE "{temp_table_name}" (
     {field_definitions}
 )
 ;
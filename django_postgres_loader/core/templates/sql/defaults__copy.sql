@@ -0,0 +1,8 @@
+COPY "{defaults_table_name}" (
+    {columns}
+)
+FROM STDIN
+WITH (
+    FORMAT csv
+)
+;
@@ -0,0 +1,4 @@
+CREATE TEMPORARY TABLE "{defaults_table_name}" (
+    {field_definitions}
+)
+;
@@ -0,0 +1,6 @@
+DELETE FROM "{model_table_name}"
+USING
+    {from_clause}
+WHERE
+    {delete_conditions}
+;
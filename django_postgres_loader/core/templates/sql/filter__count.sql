@@ -0,0 +1,7 @@
+SELECT
+    count(*)
+FROM
+    "{temp_table_name}"
+WHERE
+    ({where_condition}) IS NOT TRUE
+;
@@ -2,8 +2,10 @@ INSERT INTO "{model_table_name}" (
     {columns}
 )
 SELECT
-    {columns}
+    {select_columns}
 FROM
-    "{temp_table_name}"
+    {from_clause}
+{where_clause}
+{order_by_clause}
 ON CONFLICT ({conflict_target}) DO NOTHING
 ;
@@ -0,0 +1,40 @@
+WITH upserted AS (
+    INSERT INTO "{model_table_name}" (
+        {columns}
+    )
+    SELECT
+        {select_columns}
+    FROM
+        {from_clause}
+    {where_clause}
+    {order_by_clause}
+    ON CONFLICT ({conflict_target}) DO UPDATE SET
+        {update_operations}
+    {update_condition}
+    RETURNING
+        (xmax = 0) AS inserted
+),
+
+deleted AS (
+    DELETE FROM "{model_table_name}"
+    WHERE
+        {scope_condition}
+        AND NOT EXISTS (
+            SELECT
+                1
+            FROM
+                {from_clause}
+            WHERE
+                {sync_join_conditions}
+        )
+    RETURNING
+        1
+)
+
+SELECT
+    count(*) FILTER (WHERE inserted),
+    count(*) FILTER (WHERE NOT inserted),
+    (SELECT count(*) FROM deleted)
+FROM
+    upserted
+;
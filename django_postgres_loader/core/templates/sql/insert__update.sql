@@ -1,19 +1,15 @@
-WITH update_data AS (
+UPDATE "{model_table_name}"
+SET
+    {update_operations}
+FROM (
     SELECT
-        "{temp_table_name}".*
+        {select_columns}
     FROM
-        "{temp_table_name}"
-        INNER JOIN "{model_table_name}" ON
-            {update_join_conditions}
-)
-
-INSERT INTO "{model_table_name}" (
-    {columns}
-)
-SELECT
-    {columns}
-FROM
-    update_data
-ON CONFLICT ({conflict_target}) DO UPDATE SET
-    {update_operations}
+        {from_clause}
+    {where_clause}
+    {order_by_clause}
+) AS excluded
+WHERE
+    {update_join_conditions}
+    {update_condition}
 ;
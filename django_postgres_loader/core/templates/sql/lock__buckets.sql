@@ -0,0 +1,8 @@
+SELECT DISTINCT
+    ((hashtext(ROW({key_expressions})::text) % {n_buckets}) + {n_buckets}) % {n_buckets}
+FROM
+    {from_clause}
+{where_clause}
+ORDER BY
+    1
+;
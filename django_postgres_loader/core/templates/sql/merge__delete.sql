@@ -0,0 +1,13 @@
+MERGE INTO "{model_table_name}"
+USING (
+    SELECT DISTINCT
+        {select_columns}
+    FROM
+        {from_clause}
+    {where_clause}
+) AS excluded
+ON
+    {merge_join_conditions}
+WHEN MATCHED THEN
+    DELETE
+;
@@ -0,0 +1,35 @@
+WITH merged AS (
+    MERGE INTO "{model_table_name}"
+    USING (
+        SELECT
+            {select_columns}
+        FROM
+            {from_clause}
+        {where_clause}
+        {order_by_clause}
+    ) AS excluded
+    ON
+        {merge_join_conditions}
+    WHEN MATCHED {matched_condition}THEN
+        UPDATE SET
+            {update_operations}
+    WHEN NOT MATCHED THEN
+        INSERT (
+            {columns}
+        )
+        VALUES (
+            {insert_values}
+        )
+    WHEN NOT MATCHED BY SOURCE THEN
+        DELETE
+    RETURNING
+        merge_action() AS action
+)
+
+SELECT
+    count(*) FILTER (WHERE action = 'INSERT'),
+    count(*) FILTER (WHERE action = 'UPDATE'),
+    count(*) FILTER (WHERE action = 'DELETE')
+FROM
+    merged
+;
@@ -0,0 +1,15 @@
+MERGE INTO "{model_table_name}"
+USING (
+    SELECT
+        {select_columns}
+    FROM
+        {from_clause}
+    {where_clause}
+    {order_by_clause}
+) AS excluded
+ON
+    {merge_join_conditions}
+WHEN MATCHED {matched_condition}THEN
+    UPDATE SET
+        {update_operations}
+;
@@ -0,0 +1,10 @@
+CREATE TABLE IF NOT EXISTS "{reject_table_name}" (
+    id BIGSERIAL PRIMARY KEY,
+    model_table_name TEXT NOT NULL,
+    source TEXT,
+    line_number BIGINT,
+    error TEXT NOT NULL,
+    raw_row JSONB NOT NULL,
+    rejected_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+)
+;
@@ -0,0 +1,12 @@
+CREATE OR REPLACE FUNCTION pg_temp.dpl_input_error(value TEXT, type_name TEXT)
+RETURNS TEXT
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    EXECUTE format('SELECT %L::%s', value, type_name);
+    RETURN NULL;
+EXCEPTION WHEN others THEN
+    RETURN SQLERRM;
+END;
+$$
+;
@@ -0,0 +1,4 @@
+DELETE FROM "{temp_table_name}"
+WHERE
+    {error_expression} IS NOT NULL
+;
@@ -0,0 +1,25 @@
+WITH rejected AS (
+    DELETE FROM "{temp_table_name}"
+    WHERE
+        {error_expression} IS NOT NULL
+    RETURNING
+        "{temp_table_name}".*,
+        {error_expression} AS "{error_column}"
+)
+
+INSERT INTO "{reject_table_name}" (
+    model_table_name,
+    source,
+    line_number,
+    error,
+    raw_row
+)
+SELECT
+    {model_table_name},
+    {source_expression},
+    {line_number_expression},
+    "{error_column}",
+    to_jsonb(rejected) - '{row_number_column}' - '{error_column}'
+FROM
+    rejected
+;
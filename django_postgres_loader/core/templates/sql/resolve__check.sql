@@ -0,0 +1,17 @@
+SELECT
+    "{temp_table_name}"."{source_column}",
+    count(*) OVER ()
+FROM
+    "{temp_table_name}"
+WHERE
+    "{temp_table_name}"."{source_column}" IS NOT NULL
+    AND NOT EXISTS (
+        SELECT
+            1
+        FROM
+            "{parent_table_name}"
+        WHERE
+            "{parent_table_name}"."{parent_column}" = {natural_key}
+    )
+LIMIT {limit}
+;
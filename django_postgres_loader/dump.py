@@ -0,0 +1,308 @@
+"""Handlers for exporting data from the database."""
+
+# standard library imports
+import contextlib
+import os
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Union
+
+# third-party imports
+from django.db import connections, models, NotSupportedError
+
+# local imports
+from .core import definitions, sources, sql, streams
+
+
+class CopyDumper:
+    """Export the result of a QuerySet with COPY ... TO STDOUT."""
+
+    def __init__(
+        self,
+        queryset: models.QuerySet,
+        data_format: str = "csv",
+        compression: Optional[str] = None,
+        header: bool = True,
+        delimiter: Optional[str] = None,
+        null_string: Optional[str] = None,
+        quote_character: Optional[str] = None,
+        encoding: Optional[str] = None,
+    ):
+        """Instantiate a CopyDumper instance.
+
+        Args:
+            queryset (QuerySet):
+                The QuerySet whose rows will be exported. Its SQL is compiled
+                and run on the server inside COPY (<query>) TO STDOUT, so no
+                model instances or tuples are built client-side.
+            data_format (str):
+                The output format: "csv" or "binary" (PostgreSQL's binary COPY
+                format).
+            compression ([str]):
+                If provided, then the output is compressed while it is streamed
+                ("gzip", "bz2", or "xz").
+            header (bool):
+                Whether to write a header row. Only used if [data_format] is
+                "csv".
+            delimiter ([str]):
+                The character used to separate columns. If not provided, then
+                the PostgreSQL default (",") will be used.
+            null_string ([str]):
+                The string that represents a null value. If not provided, then
+                the PostgreSQL default ("") will be used.
+            quote_character ([str]):
+                The quoting character. If not provided, then the PostgreSQL
+                default ('"') will be used.
+            encoding ([str]):
+                The encoding of the output. If not provided, then the client
+                encoding will be used.
+        """
+        # Step 1
+        if isinstance(queryset, models.QuerySet):
+            self.queryset = queryset
+        else:
+            raise TypeError("QuerySet must be a Django QuerySet.")
+
+        # Step 2
+        self.db_alias = queryset.db
+        self.db_connection = connections[self.db_alias]
+        if self.db_connection.vendor != "postgresql":
+            raise NotSupportedError("Backend must be PostgreSQL.")
+
+        # Step 3
+        if data_format in definitions.INCLUDED_COPY_FORMATS:
+            self.data_format = data_format
+        elif isinstance(data_format, str):
+            raise ValueError(
+                f"Format must be one of: {', '.join(definitions.INCLUDED_COPY_FORMATS)}."
+            )
+        else:
+            raise TypeError("Format must be a string.")
+
+        # Step 4
+        if (compression is None) or (
+            compression in definitions.INCLUDED_COMPRESSIONS
+        ):
+            self.compression = compression
+        else:
+            raise ValueError(
+                f"Compression must be one of: {', '.join(definitions.INCLUDED_COMPRESSIONS)}."
+            )
+
+        # Step 5
+        if isinstance(header, bool):
+            self.header = header
+        else:
+            raise TypeError("Header flag must be a boolean.")
+
+        # Step 6
+        for name, value in (
+            ("Delimiter", delimiter),
+            ("Quote character", quote_character),
+        ):
+            if value is None:
+                pass
+            elif not isinstance(value, str):
+                raise TypeError(f"{name} must be a string.")
+            elif len(value) != 1:
+                raise ValueError(f"{name} must be a single character.")
+        self.delimiter = delimiter
+        self.quote_character = quote_character
+
+        # Step 7
+        if (null_string is None) or (isinstance(null_string, str)):
+            self.null_string = null_string
+        else:
+            raise TypeError("NULL string must be a string or None.")
+
+        # Step 8
+        if (encoding is None) or (isinstance(encoding, str)):
+            self.encoding = encoding
+        else:
+            raise TypeError("Encoding method must be a string or None.")
+
+    def build_select_query(self) -> str:
+        """Compile [self].queryset into a single SQL string.
+
+        Steps:
+            1.  Compile the QuerySet for [self].db_alias.
+            2.  Interpolate its parameters client-side, since COPY does not
+                accept bind parameters.
+
+        Returns (str):
+            The SELECT query of [self].queryset.
+        """
+        # Step 1
+        compiler = self.queryset.query.get_compiler(using=self.db_alias)
+        select_query, params = compiler.as_sql()
+
+        # Step 2
+        select_query = sql.interpolate(self.db_connection, select_query, params)
+
+        # Step 3
+        return select_query
+
+    def build_copy_query(self) -> str:
+        """Build the query used to copy [self].queryset to STDOUT.
+
+        Returns (str):
+            The query used to copy data out of the database.
+        """
+        # Step 1
+        copy_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            "copy_to.sql",
+        )
+        copy_query = Path(copy_query_path).read_text()
+
+        # Step 2
+        copy_query = copy_query.replace("{query}", self.build_select_query())
+
+        # Step 3
+        header_options = [f"FORMAT {self.data_format}"]
+        if self.data_format == "csv":
+            header_options.append(f"HEADER {str(self.header).lower()}")
+            if self.quote_character is not None:
+                header_options.append(
+                    f"QUOTE {sql.quote_literal(self.quote_character)}"
+                )
+            if self.delimiter is not None:
+                header_options.append(
+                    f"DELIMITER {sql.quote_literal(self.delimiter)}"
+                )
+            if self.null_string is not None:
+                header_options.append(
+                    f"NULL {sql.quote_literal(self.null_string)}"
+                )
+        if self.encoding is not None:
+            header_options.append(
+                f"ENCODING {sql.quote_literal(self.encoding)}"
+            )
+
+        # Step 4
+        header_options = ",\n\t".join(header_options)
+        copy_query = copy_query.replace("{header_options}", header_options)
+
+        # Step 5
+        return copy_query
+
+    def write(self, stream: BinaryIO) -> int:
+        """Copy [self].queryset into a writable binary [stream].
+
+        Args:
+            stream (BinaryIO):
+                The stream to write to. It is not closed.
+
+        Returns (int):
+            The number of rows exported.
+        """
+        # Step 1
+        copy_query = self.build_copy_query()
+
+        # Step 2
+        with contextlib.ExitStack() as stack:
+            if self.compression is not None:
+                stream = stack.enter_context(
+                    sources.compress(stream, self.compression)
+                )
+            with self.db_connection.cursor() as cursor:
+                cursor.copy_expert(copy_query, stream)
+                n_rows = cursor.rowcount
+
+        # Step 3
+        return n_rows
+
+    def iterate(self) -> Iterator[bytes]:
+        """Stream [self].queryset as an iterator of byte chunks.
+
+        The COPY runs on a background thread using the caller's connection (so
+        it sees the caller's transaction), writing into a bounded pipe; memory
+        use is therefore flat however large the result is. The connection must
+        not be used for anything else until the iterator is exhausted or
+        closed.
+
+        If the iterator is closed early (or garbage collected), then the COPY
+        is stopped before the connection is handed back: outside a transaction
+        the query is cancelled on the server, and inside one (where cancelling
+        would abort the transaction) the rest of its output is read and
+        discarded. Either way, the thread has finished with the connection
+        before the iterator's close() returns.
+
+        Steps:
+            1.  Build the COPY query.
+            2.  Define the producer, which runs the COPY into the pipe.
+            3.  Share the connection with the producer's thread and yield the
+                chunks it writes. If the iterator is closed early, then cancel
+                the COPY (outside a transaction) or drain the rest of its
+                output (inside one) before the pipe is closed and the thread
+                is joined.
+
+        Returns (Iterator[bytes]):
+            The exported data in chunks.
+        """
+        # Step 1
+        copy_query = self.build_copy_query()
+        connection = self.db_connection
+
+        # Step 2
+        def producer(pipe: streams.Pipe) -> None:
+            with contextlib.ExitStack() as stack:
+                stream = pipe
+                if self.compression is not None:
+                    stream = stack.enter_context(
+                        sources.compress(pipe, self.compression)
+                    )
+                with connection.cursor() as cursor:
+                    cursor.copy_expert(copy_query, stream)
+
+        # Step 3
+        connection.inc_thread_sharing()
+        try:
+            with streams.produce_in_thread(producer) as pipe:
+                try:
+                    yield from pipe
+                except GeneratorExit:
+                    if not connection.in_atomic_block:
+                        connection.connection.cancel()
+                    else:
+                        with contextlib.suppress(Exception):
+                            for _ in pipe:
+                                pass
+                    raise
+        finally:
+            connection.dec_thread_sharing()
+
+    def dump(
+        self,
+        target: Optional[Union[str, BinaryIO]] = None,
+    ) -> Union[int, Iterator[bytes]]:
+        """Export [self].queryset to [target].
+
+        Args:
+            target ([str|BinaryIO]):
+                If a string, then the path of the file to write (created or
+                overwritten). If a file-like object, then a writable binary
+                stream, which is left open. If not provided, then an iterator
+                of byte chunks is returned instead.
+
+        Returns (int|Iterator[bytes]):
+            The number of rows exported, or the iterator of chunks if [target]
+            is not provided.
+        """
+        # Step 1
+        if target is None:
+            return self.iterate()
+
+        # Step 2
+        elif isinstance(target, str):
+            with open(file=target, mode="wb") as file:
+                return self.write(file)
+
+        # Step 3
+        elif hasattr(target, "write"):
+            return self.write(target)
+
+        # Step 4
+        else:
+            raise TypeError(
+                "Target must be a path, a writable file-like object, or None."
+            )
@@ -0,0 +1,367 @@
+"""Loading several related models in a single transaction."""
+
+# standard library imports
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Type
+
+# third-party imports
+from django.db import (
+    connections,
+    DatabaseError,
+    models,
+    NotSupportedError,
+    transaction,
+)
+
+# local imports
+from .load import CopyLoader
+
+
+class LoadGraph:
+    """Load data into several models that reference one another.
+
+    Each entry is a model, its data, and the options of its CopyLoader:
+
+        graph = LoadGraph(
+            [
+                (Book, "books.csv", {"operation": "upsert", ...}),
+                (Author, "authors.csv", {"operation": "upsert", ...}),
+            ]
+        )
+        graph.load()
+
+    Every input is staged first (concurrently, each on its own connection, when
+    possible). The staged data is then merged into the models' tables in
+    foreign key order (referenced models first) inside a single transaction
+    with constraints deferred, so either every model is loaded or none is.
+
+    The session settings of an entry (see CopyLoader) are applied while its
+    input is staged, in a transaction of its own, and again just before it is
+    merged. Settings are transaction-local, so those of an entry stay in effect
+    for the entries merged after it unless they set the same settings.
+    """
+
+    def __init__(
+        self,
+        entries: Optional[List[Tuple]] = None,
+        using: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """Instantiate a LoadGraph instance.
+
+        Args:
+            entries ([list[tuple]]):
+                The loads to perform, each a tuple of (model, data) or (model,
+                data, options), where options is a dictionary of CopyLoader
+                arguments. More entries can be added with [self].add.
+            using ([str]):
+                The database alias to load into. If not provided, then the
+                alias of the first entry (by default that of the database
+                router) is used, and every entry must agree with it.
+            max_workers ([int]):
+                The maximum number of inputs to stage concurrently. If not
+                provided, then every input is staged at once. If 1, then the
+                inputs are staged one after another on the caller's
+                connection.
+        """
+        # Step 1
+        self.db_alias = using
+        self.loaders: Dict[Type[models.Model], CopyLoader] = {}
+
+        # Step 2
+        if (max_workers is None) or (
+            isinstance(max_workers, int)
+            and (not isinstance(max_workers, bool))
+            and (max_workers >= 1)
+        ):
+            self.max_workers = max_workers
+        else:
+            raise ValueError("Max workers must be a positive integer or None.")
+
+        # Step 3
+        for entry in entries or []:
+            if (not isinstance(entry, tuple)) or (len(entry) not in (2, 3)):
+                raise TypeError(
+                    "Entries must be tuples of (model, data) or (model, data, "
+                    "options)."
+                )
+            options = entry[2] if len(entry) == 3 else {}
+            if not isinstance(options, dict):
+                raise TypeError("Entry options must be a dictionary.")
+            self.add(entry[0], entry[1], **options)
+
+    def add(self, model: Type[models.Model], data, **options) -> CopyLoader:
+        """Add a load to the graph.
+
+        Args:
+            model (models.Model):
+                The model into which data will be loaded. Each model can only
+                appear once in a graph.
+            data:
+                The data to load (see CopyLoader).
+            **options:
+                The remaining CopyLoader arguments (e.g. operation and
+                conflict_target). If operation is not provided, then it is
+                "append", as for CopyLoadQuerySet.load.
+
+        Returns (CopyLoader):
+            The loader created for the entry.
+        """
+        # Step 1
+        if model in self.loaders:
+            raise ValueError(
+                f"Model {model.__name__} has already been added to the graph."
+            )
+
+        # Step 2
+        options.setdefault("operation", "append")
+        if (self.db_alias is not None) and ("using" not in options):
+            options["using"] = self.db_alias
+        loader = CopyLoader(model=model, data=data, **options)
+
+        # Step 3
+        if self.db_alias is None:
+            self.db_alias = loader.db_alias
+        elif loader.db_alias != self.db_alias:
+            raise ValueError(
+                "Every model in a load graph must be loaded into the same "
+                "database."
+            )
+
+        # Step 4
+        self.loaders[model] = loader
+        return loader
+
+    def get_dependencies(self, model: Type[models.Model]) -> List[Type]:
+        """Get the models of the graph that [model] references.
+
+        Args:
+            model (models.Model):
+                A model of the graph.
+
+        Returns (list[models.Model]):
+            The models of the graph, other than [model] itself, that forward
+            relations of [model] (including multi-table inheritance parent
+            links) point to.
+        """
+        # Step 1
+        models_by_concrete = {
+            graph_model._meta.concrete_model: graph_model
+            for graph_model in self.loaders
+        }
+
+        # Step 2
+        dependencies = []
+        for field in model._meta.concrete_fields:
+            if (not field.is_relation) or (field.related_model is None):
+                continue
+            related_model = models_by_concrete.get(
+                field.related_model._meta.concrete_model
+            )
+            if (
+                (related_model is not None)
+                and (related_model is not model)
+                and (related_model not in dependencies)
+            ):
+                dependencies.append(related_model)
+
+        # Step 3
+        return dependencies
+
+    def get_load_order(self) -> List[CopyLoader]:
+        """Order the loaders of the graph so that referenced models come first.
+
+        Steps:
+            1.  Collect the dependencies of every model.
+            2.  Repeatedly take the models whose dependencies have all been
+                taken, in the order they were added (Kahn's algorithm).
+            3.  Append the models of any reference cycle in the order they were
+                added; their constraints are only checked at commit.
+
+        Returns (list[CopyLoader]):
+            The loaders in merge order.
+        """
+        # Step 1
+        remaining = {
+            model: set(self.get_dependencies(model)) for model in self.loaders
+        }
+
+        # Step 2
+        order = []
+        ready = [model for model in self.loaders if len(remaining[model]) == 0]
+        while len(ready) > 0:
+            model = ready.pop(0)
+            order.append(model)
+            del remaining[model]
+            for other in self.loaders:
+                if (other in remaining) and (model in remaining[other]):
+                    remaining[other].discard(model)
+                    if len(remaining[other]) == 0:
+                        ready.append(other)
+
+        # Step 3
+        order.extend(model for model in self.loaders if model in remaining)
+
+        # Step 4
+        return [self.loaders[model] for model in order]
+
+    def stage(
+        self,
+        loader: CopyLoader,
+        connection,
+        staged: List[CopyLoader],
+    ) -> None:
+        """Create and populate the staging table of a loader.
+
+        If the loader has session settings, then its input is staged in a
+        transaction (a savepoint inside the caller's) with the settings
+        applied (see CopyLoader.apply_session_settings).
+
+        Args:
+            loader (CopyLoader):
+                The loader whose input is staged.
+            connection:
+                The connection to stage on.
+            staged (list[CopyLoader]):
+                The loader is appended to this list once its staging table has
+                been created, so that it can be dropped.
+
+        Returns:
+            None
+        """
+        # Step 1
+        with contextlib.ExitStack() as stack:
+            if loader.session_settings is not None:
+                stack.enter_context(transaction.atomic(using=connection.alias))
+            cursor = stack.enter_context(connection.cursor())
+            if loader.session_settings is not None:
+                loader.apply_session_settings(cursor=cursor)
+
+            # Step 2
+            loader.create(cursor=cursor)
+            staged.append(loader)
+            loader.copy(cursor=cursor)
+
+    def stage_concurrently(
+        self,
+        loaders: List[CopyLoader],
+        staged: List[CopyLoader],
+    ) -> None:
+        """Create and populate the staging tables of [loaders] concurrently.
+
+        Each worker thread uses its own connection to [self].db_alias, which is
+        closed once its input is staged, so the staging tables are UNLOGGED and
+        committed rather than temporary.
+
+        Args:
+            loaders (list[CopyLoader]):
+                The loaders whose inputs are staged.
+            staged (list[CopyLoader]):
+                The loaders whose staging tables have been created are appended
+                to this list, so that they can be dropped.
+        """
+
+        # Step 1
+        def stage_on_own_connection(loader: CopyLoader) -> None:
+            connection = connections[self.db_alias]
+            try:
+                self.stage(loader, connection, staged)
+            finally:
+                connection.close()
+
+        # Step 2
+        max_workers = self.max_workers or len(loaders)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(stage_on_own_connection, loader)
+                for loader in loaders
+            ]
+
+        # Step 3
+        for future in futures:
+            future.result()
+
+    def load(self) -> Dict[Type[models.Model], int]:
+        """Load every entry of the graph.
+
+        Steps:
+            1.  Order the loaders and decide whether the inputs can be staged
+                concurrently (not inside a transaction and with more than one
+                worker).
+            2.  Stage every input (see [self].stage).
+            3.  Merge the staged inputs in order inside a single transaction,
+                deferring constraint checks until it commits and applying the
+                session settings of each loader before its merge.
+            4.  Drop the staging tables (also on failure, unless inside a
+                transaction, whose rollback removes them).
+            5.  Return.
+
+        The counts of each load are stored in the stats of its loader (see
+        [self].loaders and CopyLoader.load).
+
+        Returns (dict[models.Model, int]):
+            The number of rows affected in each model, in merge order.
+        """
+        # Step 1
+        if len(self.loaders) == 0:
+            raise ValueError("A load graph must contain at least one model.")
+        loaders = self.get_load_order()
+        connection = connections[self.db_alias]
+        concurrent = (not connection.in_atomic_block) and (
+            self.max_workers != 1
+        )
+        for loader in loaders:
+            if (loader.parallel_copies > 1) and connection.in_atomic_block:
+                raise NotSupportedError(
+                    "Parallel copies cannot be used inside a transaction."
+                )
+            loader.set_shared_staging(
+                concurrent
+                or (
+                    (loader.parallel_copies > 1)
+                    and (len(loader.data_sources) > 1)
+                )
+            )
+            loader.stats = {
+                "rows_copied": 0,
+                "rows_rejected": 0,
+                "rows_filtered": 0,
+                "rows_affected": 0,
+            }
+
+        # Step 2
+        staged = []
+        n_rows_affected = {}
+        try:
+            if concurrent:
+                self.stage_concurrently(loaders, staged)
+            else:
+                for loader in loaders:
+                    self.stage(loader, connection, staged)
+
+            # Step 3
+            with transaction.atomic(using=self.db_alias):
+                with connection.cursor() as cursor:
+                    cursor.execute("SET CONSTRAINTS ALL DEFERRED;")
+                    for loader in loaders:
+                        if loader.session_settings is not None:
+                            loader.apply_session_settings(cursor=cursor)
+                        n_rows_affected[loader.model] = loader.merge(
+                            cursor=cursor
+                        )
+
+        # Step 4
+        except Exception:
+            if not connection.in_atomic_block:
+                with connection.cursor() as cursor:
+                    for loader in staged:
+                        with contextlib.suppress(DatabaseError):
+                            loader.drop(cursor=cursor)
+            raise
+        with connection.cursor() as cursor:
+            for loader in staged:
+                loader.drop(cursor=cursor)
+
+        # Step 5
+        return n_rows_affected
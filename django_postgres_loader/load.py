@@ -1,21 +1,56 @@
 """Handlers for loading data into the database."""
 
 # standard library imports
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
 import csv
+import glob
+import hashlib
 import inspect
 import io
 import os
 from pathlib import Path
 import random
+import re
 import string
-from typing import Callable, Dict, List, Optional, Set, Type, Union
+import time
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 # third-party imports
+from django.core.exceptions import EmptyResultSet
 from django.db import models
-from django.db import connections, NotSupportedError, router
+from django.db import (
+    connections,
+    DatabaseError,
+    NotSupportedError,
+    router,
+    transaction,
+)
+from django.db.models import Expression, Q
 
 # local imports
-from .core import definitions, field_updaters
+from .core import (
+    bulk,
+    defaults,
+    definitions,
+    expressions,
+    field_updaters,
+    registry,
+    sources,
+    sql,
+    streams,
+)
 
 
 class CopyLoader:
@@ -24,7 +59,13 @@ class CopyLoader:
     def __init__(
         self,
         model: Type[models.Model],
-        data: Union[str, io.StringIO],
+        data: Union[
+            str,
+            io.StringIO,
+            io.BytesIO,
+            BinaryIO,
+            List[Union[str, io.StringIO, io.BytesIO, BinaryIO]],
+        ],
         operation: str,
         conflict_target: Optional[List[str]] = None,
         update_operation: Optional[
@@ -38,6 +79,34 @@ class CopyLoader:
         force_null: Optional[List[str]] = None,
         encoding: Optional[str] = None,
         temp_table_name: Optional[str] = None,
+        compression: Optional[str] = "infer",
+        decompress_in_thread: bool = False,
+        parallel_copies: int = 1,
+        source: str = "client",
+        using: Optional[str] = None,
+        data_format: str = "csv",
+        columns: Optional[List[str]] = None,
+        on_error: str = "abort",
+        reject_table_name: Optional[str] = None,
+        transforms: Optional[Dict[str, Union[str, Expression]]] = None,
+        fill_defaults: bool = True,
+        resolve: Optional[
+            Dict[str, Tuple[str, Type[models.Model], str]]
+        ] = None,
+        where: Optional[Union[str, Q]] = None,
+        include_columns: Optional[List[str]] = None,
+        ignore_extra_columns: bool = False,
+        projection: str = "auto",
+        batch_size: Optional[int] = None,
+        scope: Optional[models.QuerySet] = None,
+        hash_column: Optional[str] = None,
+        engine: str = "on_conflict",
+        order_by: Optional[Union[bool, List[str]]] = None,
+        advisory_lock: Optional[str] = None,
+        lock_buckets: int = definitions.DEFAULT_LOCK_BUCKETS,
+        session_settings: Optional[Union[str, Dict[str, str]]] = None,
+        bulk_mode: bool = False,
+        disable_triggers: bool = False,
     ):
         """Instantiate a CopyLoader instance.
 
@@ -51,10 +120,20 @@ class CopyLoader:
                             [conflict_target] matches that of an existing row.
             "update":       If [conflict_target] matches that of an existing
                             row, then update the row using [update_operation].
-                            Otherwise, do nothing.
+                            Otherwise, do nothing. The rows are updated by a
+                            single UPDATE ... FROM the staged data, so
+                            [conflict_target] need not be unique; if several
+                            rows of [data] match the same existing row, then
+                            only one of them (which one is unspecified) is
+                            applied.
             "upsert":       If [conflict_target] matches that of an existing
                             row, then update the row using [update_operation].
                             Otherwise, insert a new row.
+            "delete":       Delete every existing row whose [conflict_target]
+                            matches that of a row of [data].
+            "sync":         Upsert [data], then delete every existing row
+                            within [scope] whose [conflict_target] matches no
+                            row of [data].
 
         Supported update operations ([old] = existing value; [new] = new value):
             "add":          [old] + [new]
@@ -73,16 +152,25 @@ class CopyLoader:
         Args:
             model (models.Model):
                 The model into which data will be loaded
-            data (StringIO):
-                The data to load into [model]. If a StringIO object, then must
-                be CSV-formatted data. If a string, then must be a path to an
-                existing CSV file.
+            data (StringIO|BytesIO|BinaryIO|str|list):
+                The data to load into [model]. If a file-like object (text or
+                binary), then must be CSV-formatted data. If a string, then must
+                be a path to an existing CSV file or a glob pattern matching one
+                or more CSV files. If a list, then each element must be a
+                file-like object or a path. Binary data (including files given
+                by path) is passed to COPY without being decoded; the server
+                decodes it using [encoding].
+
+                If there are several sources, then they must all have the same
+                header. All of them are copied into a single temp table, which
+                is then merged into [model] once.
             operation (str):
                 The type of load to perform. See above for permissible values
                 and descriptions.
             conflict_target ([list[str]]):
                 The set of columns to use as the conflict target in the
-                "ON CONFLICT" clause of the insert. Must be provided if
+                "ON CONFLICT" clause of the insert (or to match existing rows
+                if [operation] is "update" or "delete"). Must be provided if
                 [operation] is "safe_append", "update", or "upsert"; will not be
                 used if [operation] is "append" or "replace". If provided, must
                 be a subset of [model]'s columns.
@@ -126,11 +214,296 @@ class CopyLoader:
                 if it has been quoted.
             encoding ([str]):
                 The encoding method used in the file. If not provided, then the
-                PostgreSQL default (client encoding) will be used.
+                PostgreSQL default (client encoding) will be used. Only the
+                header row is decoded client-side, to detect column names.
             temp_table_name ([str]):
                 The name to give the temporary table storing [data] before it
                 is loaded into [model]'s database table. If not provided, then
                 a name will be randomly generated.
+            compression ([str]):
+                The compression of [data]: "gzip", "bz2", or "xz". If "infer"
+                (the default), then the compression is detected from the suffix
+                of [data]'s file name or from its leading magic bytes. If None,
+                then [data] is assumed to be uncompressed. Compressed data is
+                decompressed on the fly while being streamed into COPY.
+            decompress_in_thread (bool):
+                If True, then compressed data is decompressed on a background
+                thread, overlapping decompression with sending data to the
+                server and server-side parsing.
+            parallel_copies (int):
+                The maximum number of data sources to copy concurrently, each
+                over its own database connection. If greater than 1, then the
+                load cannot run inside a transaction, and if [data] has more
+                than one source, then it is staged in an UNLOGGED table
+                (visible to all of the connections) instead of a temp table.
+                Unless [temp_table_name] is provided, the table's name starts
+                with definitions.SHARED_STAGING_PREFIX, so that tables left
+                behind by an interrupted process can be found and removed (see
+                core.staging.drop_shared_staging_tables).
+            source (str):
+                Where [data] is read from. If "client" (the default), then
+                [data] is read by this process and streamed to the server. If
+                "server", then [data] must be a path (or list of paths) to an
+                uncompressed file on the database server, which the server reads
+                directly with COPY ... FROM '<path>', removing the round trip
+                through the client. Requires a role with the
+                pg_read_server_files privilege (or superuser).
+            using ([str]):
+                The alias of the database to load into. If not provided, then
+                the database router's write database for [model] is used.
+            data_format (str):
+                The COPY format of [data]: "csv" (the default) or "binary"
+                (PostgreSQL's binary COPY format, e.g. as produced by
+                COPY ... TO STDOUT WITH (FORMAT binary)). Binary data must
+                match the types of [model]'s columns exactly, and [columns]
+                must be provided since it has no header row.
+            columns ([list[str]]):
+                The columns of [data], in order. If provided, then [data] is
+                assumed to have no header row and its columns are not detected.
+                Required if [data_format] is "binary".
+            on_error (str):
+                What to do with rows that cannot be loaded because a value does
+                not match its column's type or a NOT NULL column is null:
+                    "abort":    Raise an error and load nothing (the default).
+                    "ignore":   Skip such rows and load the rest. On PostgreSQL
+                                17+, values that fail type input are skipped by
+                                COPY itself (ON_ERROR ignore).
+                    "reject":   Skip such rows, load the rest, and record each
+                                skipped row in [reject_table_name] with the
+                                error, its source, and its line number.
+                Unless COPY skips the rows itself, the data is staged as text
+                and checked and cast server-side in set-based SQL (before
+                PostgreSQL 16, invalid rows are first located by casting ranges
+                of rows and bisecting those that fail; see
+                [self].find_invalid_input_rows). The number of skipped rows is
+                reported in [self].stats after the load. Only
+                supported for CSV data, and not with [parallel_copies] greater
+                than 1 (staged row order is needed for line numbers).
+            reject_table_name ([str]):
+                The table that rejected rows are written to (created if it does
+                not exist). Only used if [on_error] is "reject". Must start with
+                a letter or underscore, contain only letters, digits, and
+                underscores, and be no longer than
+                definitions.MAX_IDENTIFIER_LENGTH characters. If not provided,
+                then "<model table>_rejects" is used; if that is too long, then
+                the model table's name is shortened and followed by a hash of
+                it, so that the name stays unique to the model.
+            transforms ([dict[str, str|Expression]]):
+                Server-side transformations applied while the data is merged
+                into [model]. Keys are columns of [model]; values are SQL
+                expressions or Django expressions (e.g. Upper(Trim("code")))
+                computing the column's value from the data's columns (after
+                [field_mapping] is applied), e.g.
+                {"day": "to_date(\"day\", 'DD/MM/YYYY')"}. SQL expressions
+                refer to data columns by their (double-quoted) names, and
+                Django expressions by their names, except for columns whose
+                names cannot be field names (e.g. "pk" or "a__b"; see
+                core.expressions.get_staging_field_name). A key may
+                be a data column (transforming it in place) or a model column
+                missing from the data. Data columns that are not columns of
+                [model] are allowed if transforms are provided, and are only
+                available to the transforms. If provided, then every data
+                column is staged as text, and each expression's result is cast
+                to its column's type in the insert, so the transformations run
+                set-based inside the single merge.
+            fill_defaults (bool):
+                Whether to fill columns of [model] that are missing from the
+                data (and not transformed) the way Django would on save. If
+                True (the default), then auto_now and auto_now_add columns are
+                set to now(), static defaults are rendered as SQL literals, and
+                callable defaults with a server-side equivalent (uuid4 on
+                PostgreSQL 13+, timezone.now, date.today) use it. Other
+                callable defaults are called once per row client-side, and the
+                values are copied in batches into a second temp table that is
+                joined in the insert. Defaults are only used for inserted rows;
+                auto_now columns are also set on updated rows.
+            resolve ([dict[str, tuple[str, models.Model, str]]]):
+                Foreign keys to resolve from natural keys during the merge, e.g.
+                {"customer_id": ("customer_code", Customer, "code")}. Keys are
+                columns of [model]; values are (data column, parent model,
+                name of a unique field of the parent model). The temp table is
+                joined to the parent model's table on the natural key, so every
+                foreign key is resolved in one hash join, and the column is
+                set to the value the foreign key references (the parent's
+                primary key unless the foreign key has a to_field). The data
+                column need not be a column of [model]. Natural keys with no
+                matching parent row are reported: if [on_error] is "abort",
+                then the load fails with a ValueError listing some of them;
+                otherwise, their rows are ignored or rejected. If provided,
+                then every data column is staged as text.
+            where ([str|Q]):
+                A condition that rows of the data must meet to be loaded, as a
+                SQL expression or a Django Q object, e.g.
+                Q(region="EU") & ~Q(status="test"). It is evaluated against
+                the temp table's columns (the data's columns after
+                [field_mapping] is applied), which have the types of their
+                model columns unless the data is staged as text (see
+                [on_error], [transforms], and [resolve]); data columns that are
+                not columns of [model] are always staged as text, and are
+                allowed if [where] is provided. The condition is added to the
+                SELECT of the insert, so rows are filtered inside the single
+                merge, and the number of rows filtered out is reported in
+                [self].stats after the load. Rows that cannot be loaded are
+                ignored or rejected (see [on_error]) before they are filtered.
+            include_columns ([list[str]]):
+                The columns of the data (as named in its header, or in
+                [columns]) to load. Unless [ignore_extra_columns] is also
+                True, every other column is skipped. If neither is provided
+                and [operation] is "delete", then only the columns of
+                [conflict_target] are loaded.
+            ignore_extra_columns (bool):
+                If True, then columns of the data that do not map to a column
+                of [model], are not the natural key of a foreign key in
+                [resolve], and are not in [include_columns] are skipped.
+                Columns used only by [transforms] or [where] must therefore be
+                listed in [include_columns].
+            projection (str):
+                How skipped columns are removed; only used if columns are
+                skipped, and only supported for CSV data:
+                    "stream":   Parse each record client-side and send COPY
+                                only the kept fields, so the server never sees
+                                the skipped ones.
+                    "stage":    Copy every column (skipped ones as text) and
+                                only read the kept columns in the insert, so
+                                nothing is parsed client-side.
+                    "auto":     "stream" if at most a quarter of the columns
+                                are kept (definitions.PROJECTION_STREAM_MAX_RATIO)
+                                and the data is read client-side, otherwise
+                                "stage" (the default). The benchmark suite
+                                measures both for several ratios.
+            batch_size ([int]):
+                The maximum number of staged rows whose matches are deleted by
+                a single statement. Only used if [operation] is "delete". If
+                the load runs outside a transaction, then each batch is
+                committed as soon as it completes, so row locks are only held
+                for one batch at a time (and batches already deleted stay
+                deleted if a later batch fails). If not provided, then every
+                match is deleted by one statement.
+            scope ([QuerySet]):
+                The rows of [model] that a sync makes match [data]. Only used
+                if [operation] is "sync"; if not provided, then the whole
+                table is synced. The upsert and the deletion of rows in
+                [scope] missing from the data (an anti-join against the staged
+                rows that are loaded, i.e. after [on_error] and [where] are
+                applied) run as a single statement, and the numbers of rows
+                inserted, updated, and deleted are reported in [self].stats
+                after the load.
+            hash_column ([str]):
+                A column of [model] (e.g. a CharField with max_length=32)
+                maintained by the loader to detect changed rows. Each loaded
+                row's hash, md5(ROW(<columns>)::text) over the columns that an
+                update replaces (other than those only set on insert), is
+                computed server-side in the insert and stored in the column,
+                and an existing row is only updated if its stored hash differs
+                from the new one, so unchanged rows are not rewritten. The
+                column must not be provided by the data. Only supported if
+                [operation] is "update", "upsert", or "sync" and every column
+                is updated with "replace" (other update operations must be
+                applied even when the data has not changed).
+            engine (str):
+                The statement used to merge the staged data into the model
+                table:
+                    "on_conflict":  INSERT ... ON CONFLICT (or UPDATE ...
+                                    FROM if updating, and DELETE ... USING if
+                                    deleting), which requires
+                                    [conflict_target] to have a unique
+                                    constraint unless updating or deleting
+                                    (the default).
+                    "merge":        A single MERGE INTO ... USING the staged
+                                    data, which matches rows on
+                                    [conflict_target] whether or not it is
+                                    unique. Only supported if [operation] is
+                                    "update", "upsert", or "delete" on
+                                    PostgreSQL 15 or higher, or "sync" on
+                                    PostgreSQL 17 or higher with an unfiltered
+                                    [scope].
+                    "auto":         "merge" if it is supported, otherwise
+                                    "on_conflict".
+                Unlike INSERT ... ON CONFLICT, a MERGE that inserts rows
+                concurrently inserted by another transaction fails with a
+                unique violation rather than updating them.
+            order_by ([bool|list[str]]):
+                Whether to read the staged rows in order when merging them,
+                so that the model table's index pages are visited in key
+                order and concurrent loads of overlapping keys lock rows in
+                the same order instead of deadlocking. If True, then the rows
+                are ordered by [conflict_target]; if a list, then by the given
+                columns of [model] (e.g. a clustering column), which must be
+                provided by the data. If not provided, then the rows are
+                ordered by [conflict_target] only if another transaction is
+                writing to the model table when the merge starts (see
+                pg_locks). Not supported if [operation] is "delete". The
+                order is always followed when inserting; an update (or a
+                MERGE) follows it whenever the staged rows drive the join,
+                but the planner may choose otherwise.
+            advisory_lock ([str]):
+                If provided, then the merge of the staged data (and only the
+                merge; staging stays fully concurrent) runs while holding
+                PostgreSQL advisory locks keyed on the model table, so that
+                concurrent loads into [model] do not deadlock:
+                    "model":    Take a single lock for the model, so merges
+                                into it run one at a time.
+                    "bucket":   Hash the [conflict_target] values of the
+                                loaded rows into [lock_buckets] buckets and
+                                take the lock of every bucket present, in
+                                ascending order, so merges of disjoint key
+                                sets run concurrently.
+                Every concurrent load must use the same mode and number of
+                buckets. Inside a transaction the locks are held until it
+                ends; otherwise they are released once the merge finishes.
+                The time spent waiting for them is reported as
+                "lock_wait_seconds" in [self].stats after the load.
+            lock_buckets (int):
+                The number of buckets used if [advisory_lock] is "bucket".
+            session_settings ([str|dict[str, str]]):
+                Server settings (e.g. {"work_mem": "256MB"}) applied to the
+                load, or the name of a profile of settings in
+                definitions.SESSION_PROFILES (e.g. "bulk_load"). If provided,
+                then [self].load runs the whole pipeline in a transaction (or
+                inside the caller's) and applies each setting with
+                set_config(..., true), the equivalent of SET LOCAL, so that no
+                setting outlives the load on the pooled connection.
+                temp_buffers is set before the temp table is created, in a
+                savepoint, and is skipped if the session has already used
+                temporary tables (PostgreSQL then refuses to change it) or the
+                staging table is shared; "temp_buffers_applied" in [self].stats
+                is 1 if it was set and 0 if it was skipped. Not
+                supported with [parallel_copies] or [batch_size], which
+                depend on running outside a transaction.
+            bulk_mode (bool):
+                If True, then the secondary indexes of the model table (those
+                that are neither unique nor back a constraint) are dropped
+                before the insert and rebuilt from their recorded definitions
+                after it, rather than being maintained row by row. Meant for
+                very large appends. Outside a transaction the indexes are
+                rebuilt concurrently, each on its own connection (at most
+                definitions.INDEX_REBUILD_MAX_WORKERS at a time); inside one,
+                they are rebuilt one after another on the caller's connection.
+                If the insert fails, then the indexes are rebuilt (or, inside
+                a transaction, restored by its rollback). Outside a
+                transaction, the definitions are first saved in the
+                definitions.SUSPENDED_INDEX_TABLE table, so that indexes left
+                dropped by an interrupted load (or one that failed to rebuild
+                them) can be restored with
+                core.bulk.restore_suspended_indexes. The number of indexes
+                rebuilt is reported as "indexes_rebuilt" in [self].stats after
+                the load. Other sessions writing to or reading from the table
+                during the load run without those indexes. Inside a
+                transaction (including the merge of a LoadGraph), DROP INDEX
+                holds an ACCESS EXCLUSIVE lock on the model table until the
+                transaction ends, blocking every other reader and writer;
+                outside one, the lock is only held while each index is
+                dropped.
+            disable_triggers (bool):
+                If True, then session_replication_role is set to "replica"
+                during the insert, so that user triggers, and also the
+                triggers that check foreign keys, do not fire; the previous
+                role is restored afterwards. This needs superuser rights (or,
+                on PostgreSQL 15 or higher, a grant to set the parameter); if
+                it is not permitted, then the triggers stay enabled.
+                Whether they were disabled is reported as "triggers_disabled"
+                (1 or 0) in [self].stats after the load. Only used if
+                [bulk_mode] is True.
         """
         # Step 1
         if issubclass(model, models.Model):
@@ -140,34 +513,34 @@ class CopyLoader:
             raise TypeError("Model must be a Django model.")
 
         # Step 2
-        self.db_connection = connections[router.db_for_write(self.model)]
+        self.db_alias = (
+            using if using is not None else router.db_for_write(self.model)
+        )
+        self.db_connection = connections[self.db_alias]
         if (self.db_connection.vendor != "postgresql") or (
             self.db_connection.pg_version < 90500
         ):
             raise NotSupportedError(
                 "Backend must be PostgreSQL version 9.5 or higher."
             )
+        self.model_metadata = registry.get_model_metadata(
+            self.model,
+            self.db_connection,
+        )
 
         # Step 3
-        if isinstance(data, io.StringIO):
-            self.data = data
-            data.seek(0)
-        elif isinstance(data, str):
-            if not os.path.isfile(data):
-                raise FileNotFoundError(f"File {data} does not exist.")
-
-            with open(file=data, mode="r") as file:
-                self.data = io.StringIO(file.read())
-                self.data.seek(0)
-        elif hasattr(data, "to_csv"):
-            string_io_data = io.StringIO()
-            data.to_csv(string_io_data, index=False)
-            string_io_data.seek(0)
-            self.data = string_io_data
-        else:
-            raise TypeError(
-                "Data must be a StringIO object or a path to a CSV file."
-            )
+        self.source = source
+        self.validate_source()
+        self.compression = compression
+        self.decompress_in_thread = decompress_in_thread
+        self.validate_compression()
+        self.parallel_copies = parallel_copies
+        self.validate_parallel_copies()
+        self.shared_staging = False
+        self.data_format = data_format
+        self.columns = columns
+        self.validate_data_format()
+        self.set_data(data)
 
         # Step 4
         if delimiter is None:
@@ -204,17 +577,29 @@ class CopyLoader:
             raise TypeError("Encoding method must be a string or None.")
 
         # Step 8
+        self.validate_data_sources()
         self.data_columns = self.get_data_columns()
         self.model_columns = self.get_model_columns()
 
         # Step 9
+        self.transforms = transforms if transforms is not None else dict()
+        self.resolve = resolve if resolve is not None else dict()
+        self.where = where
         self.field_mapping = (
             field_mapping if field_mapping is not None else dict()
         )
+        self.operation = operation
+        self.conflict_target = conflict_target
+        self.source_columns = list(self.data_columns)
+        self.include_columns = include_columns
+        self.ignore_extra_columns = ignore_extra_columns
+        self.projection = projection
+        self.validate_projection()
         self.validate_field_mapping()
         self.complete_field_mapping()
         self.validate_field_mapping()
         self.apply_field_mapping()
+        self.staged_columns = self.get_staged_columns()
 
         # Step 10
         self.force_null = force_null
@@ -225,6 +610,7 @@ class CopyLoader:
         self.validate_force_not_null()
 
         # Step 12
+        self.temp_table_name_given = temp_table_name is not None
         if temp_table_name is None:
             self.temp_table_name = self.generate_temp_table_name()
         elif isinstance(temp_table_name, str):
@@ -234,338 +620,1925 @@ class CopyLoader:
             raise TypeError("Temp table name must be a string.")
 
         # Step 13
-        self.operation = operation
         self.validate_operation()
+        self.batch_size = batch_size
+        self.validate_batch_size()
+        self.scope = scope
+        self.validate_scope()
+        self.engine = engine
+        self.validate_engine()
 
         # Step 14
-        self.conflict_target = conflict_target
         self.validate_conflict_target()
+        self.order_by = order_by
+        self.validate_order_by()
+        self.advisory_lock = advisory_lock
+        self.lock_buckets = lock_buckets
+        self.validate_advisory_lock()
+        self.session_settings = session_settings
+        self.validate_session_settings()
+        self.bulk_mode = bulk_mode
+        self.disable_triggers = disable_triggers
+        self.validate_bulk_mode()
 
         # Step 15
         self.update_operation = update_operation
         self.validate_update_operation()
+        self.hash_column = hash_column
+        self.validate_hash_column()
+
+        # Step 16
+        self.validate_transforms()
+        self.validate_resolve()
+        self.validate_where()
+
+        # Step 17
+        self.on_error = on_error
+        self.reject_table_name = reject_table_name
+        self.validate_on_error()
+
+        # Step 18
+        if isinstance(fill_defaults, bool):
+            self.fill_defaults = fill_defaults
+        else:
+            raise TypeError("Fill defaults flag must be a boolean.")
+        self.defaults_table_name = f"{self.temp_table_name}_defaults"
+        self.default_expressions = self.get_default_expressions()
+        self.client_default_columns = [
+            col
+            for col, expression in self.default_expressions.items()
+            if expression is None
+        ]
+
+        # Step 19
+        self.compiled_queries: Dict[str, str] = dict()
+        self.source_row_counts: List[int] = []
+        self.stats: Dict[str, Union[int, float]] = dict()
+
+    def acquire_advisory_locks(self, cursor) -> List[int]:
+        """Take the advisory locks of [self].advisory_lock.
+
+        Each lock is keyed on the OID of the model table and a bucket
+        (definitions.MODEL_LOCK_BUCKET for the model lock). The locks are taken
+        by a single statement, in ascending order of bucket, so two loads never
+        wait on each other's locks in opposite orders, and "lock_wait_seconds"
+        in [self].stats times that one round trip. Inside a transaction,
+        transaction-level locks are taken, which are released when it ends;
+        otherwise session-level locks are taken, which must be released with
+        [self].release_advisory_locks.
 
-    def apply_field_mapping(self) -> None:
-        """Apply [self].field_mapping to [self].data.
-
-        Steps:
-            1.  Extract the header row from [self].data
-            2.  Replace old header name with new header name using
-                [self].field_mapping.
-            3.  Rebuild [self].data using the updated header row.
+        Args:
+            cursor:
+                Cursor.
 
-        Returns:
-            None
+        Returns (list[int]):
+            The buckets locked.
         """
         # Step 1
-        data_rows = self.data.readlines()
-        header_row = data_rows[0]
+        if self.advisory_lock == "model":
+            buckets = [definitions.MODEL_LOCK_BUCKET]
+        else:
+            bucket_query = self.compiled_queries.get("buckets")
+            if bucket_query is None:
+                bucket_query = self.build_bucket_query()
+            cursor.execute(bucket_query)
+            buckets = [row[0] for row in cursor.fetchall()]
 
         # Step 2
-        n_updates = 0
-        for old, new in self.field_mapping.items():
-            if old != new:
-                header_row = header_row.replace(old, new)
-                n_updates += 1
+        lock_function = (
+            "pg_advisory_xact_lock"
+            if self.db_connection.in_atomic_block
+            else "pg_advisory_lock"
+        )
+        start = time.perf_counter()
+        cursor.execute(
+            f"SELECT {lock_function}(%s::regclass::oid::integer, bucket) "
+            "FROM unnest(%s::integer[]) AS bucket ORDER BY bucket",
+            [f'"{self.model_table}"', buckets],
+        )
+        self.stats["lock_wait_seconds"] = time.perf_counter() - start
 
         # Step 3
-        data_rows[0] = header_row
-        data = "".join(data_rows)
-        self.data = io.StringIO(data)
-        self.data.seek(0)
+        return buckets
 
-        # Step 4
-        if n_updates > 0:
-            self.data_columns = self.get_data_columns()
+    def apply_field_mapping(self) -> None:
+        """Apply [self].field_mapping to [self].data_columns.
 
-    def complete_field_mapping(self) -> None:
-        """Ensure that [self].field_mapping is complete.
+        The header row of [self].data is skipped by COPY and the target columns
+        are named explicitly in the COPY query, so the mapping only needs to be
+        applied to the column names; [self].data is left untouched.
 
         Returns:
             None
         """
         # Step 1
-        for col in self.data_columns:
-            if col not in self.field_mapping.keys():
-                self.field_mapping.update({col: col})
-
-    def generate_temp_table_name(self) -> str:
-        """Create a randomly-generated name for a PostgreSQL temp table.
+        self.data_columns = [
+            self.field_mapping[col] for col in self.data_columns
+        ]
 
-        Steps:
-            1.  Create the prefix for the temp table name (value is "tmp_").
-            2.  Create the suffix for the temp tabel name (value is 20 random
-                letters/digits).
-            3.  Combine the prefix and suffix to form the full table name.
+    def build_from_clause(self) -> str:
+        """Build the FROM clause reading staged data in the insert.
 
         Returns (str):
-            Randomly-generated name for a PostgreSQL temp table.
+            The temp table, joined (by row number) to the table of client-side
+            defaults if there is one, and (by natural key) to the table of each
+            parent model whose foreign keys are resolved.
         """
         # Step 1
-        prefix = "tmp_"
+        from_clause = f'"{self.temp_table_name}"'
 
         # Step 2
-        valid_characters = string.ascii_letters + string.digits
-        suffix = "".join(random.choices(valid_characters, k=20))
+        if len(self.client_default_columns) > 0:
+            row_number = definitions.ROW_NUMBER_COLUMN
+            from_clause += (
+                f'\n\tLEFT JOIN "{self.defaults_table_name}" ON '
+                f'"{self.defaults_table_name}"."{row_number}" = '
+                f'"{self.temp_table_name}"."{row_number}"'
+            )
 
         # Step 3
-        return prefix + suffix
+        for resolution in self.resolutions.values():
+            alias = resolution["alias"]
+            natural_key = self.build_natural_key_expression(resolution)
+            from_clause += (
+                f'\n\tLEFT JOIN "{resolution["parent_table"]}" AS "{alias}" ON '
+                f'"{alias}"."{resolution["parent_column"]}" = {natural_key}'
+            )
 
-    def get_data_columns(self) -> List[str]:
-        """Get column names from [self].data.
+        # Step 4
+        return from_clause
 
-        Steps:
-            1.  Create a CSV reader object.
-            2.  Extract the column names from [self].data.
-            3.  Return the cursor to the top of [self].data.
-            4.  Return.
+    def build_where_condition(self) -> Optional[str]:
+        """Build the condition that staged rows must meet to be loaded.
 
-        Returns (list[str]):
-            The names of the columns found in [self].data.
+        Returns ([str]):
+            [self].where as SQL (a Q object is compiled against a model
+            describing the temp table), or None if rows are not filtered.
         """
         # Step 1
-        reader = csv.reader(self.data, delimiter=self.delimiter)
+        if self.where is None:
+            return None
+        elif isinstance(self.where, str):
+            return self.where
 
         # Step 2
-        columns = next(reader)
+        typed_fields = dict()
+        if not self.stage_as_text:
+            typed_fields = {
+                column: self.model_metadata.fields_by_column[column]
+                for column in self.data_columns
+                if column in self.model_columns
+            }
+        staging_model = expressions.build_staging_model(
+            self.temp_table_name,
+            self.data_columns,
+            fields=typed_fields,
+        )
 
         # Step 3
-        self.data.seek(0)
-
-        # Step 4
-        return columns
+        return expressions.compile_expression(
+            self.where,
+            staging_model,
+            self.db_connection,
+        )
 
-    def get_model_columns(self) -> List[str]:
-        """Get column names from [self].model.
+    def apply_session_settings(self, cursor) -> None:
+        """Apply [self].session_settings to the current transaction.
 
         Steps:
-            1.  Extract column names from [self].model.
-            2.  Return.
+            1.  Set temp_buffers first, in a savepoint, unless the temp table
+                is not temporary (see [self].shared_staging). The server only
+                allows it to change before the session first uses temporary
+                tables, so a refusal does not fail the load; whether it was
+                applied is stored as "temp_buffers_applied" in [self].stats.
+            2.  Set every other setting for the rest of the transaction.
 
-        Returns (list[str]):
-            The names of the columns found in [self].model.
+        Args:
+            cursor:
+                Cursor.
+
+        Returns:
+            None
         """
         # Step 1
-        columns = [f.get_attname_column()[1] for f in self.model._meta.fields]
+        settings = dict(self.session_settings)
+        temp_buffers = settings.pop("temp_buffers", None)
+        if temp_buffers is not None:
+            applied = False
+            if not self.shared_staging:
+                with contextlib.suppress(DatabaseError):
+                    with transaction.atomic(using=self.db_alias):
+                        cursor.execute(
+                            "SELECT set_config('temp_buffers', %s, true)",
+                            [temp_buffers],
+                        )
+                    applied = True
+            self.stats["temp_buffers_applied"] = int(applied)
 
         # Step 2
-        return columns
-
-    def get_valid_conflict_targets(self) -> List[Set[str]]:
-        """Get a list of all permissible values of [self].conflict_target.
+        for name, value in settings.items():
+            cursor.execute("SELECT set_config(%s, %s, true)", [name, value])
 
-        A set of columns in a valid conflict target if the columns are required
-        to be unique within [self].model. This can be met in the following ways:
-            *   The column that serves as the model's primary key
-            *   Any column in the model for which unique=True
-            *   Any column(s) for which a UniqueConstraint is defined
-            *
+    def build_bucket_query(self) -> str:
+        """Build the query listing the lock buckets of the staged rows.
 
-        This function checks each of these conditions, returning list of all
-        columns and/or combinations of columns meeting at least one.
+        Each loaded row's bucket is a hash of its [self].conflict_target
+        values, as cast to their model types, modulo [self].lock_buckets, so
+        the same key falls into the same bucket whatever load stages it.
 
-        Returns (list[set[str]]:
-            All permissible values of [self].conflict_target.
+        Returns (str):
+            The query returning the distinct buckets in ascending order.
         """
         # Step 1
-        valid_conflict_targets = []
+        bucket_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            "lock__buckets.sql",
+        )
+        bucket_query = Path(bucket_query_path).read_text()
 
         # Step 2
-        primary_key_target = self.model._meta.pk.get_attname_column()[1]
-        valid_conflict_targets.append({primary_key_target})
+        select_expressions = self.get_select_expressions()
+        key_expressions = ", ".join(
+            select_expressions[col] for col in self.conflict_target
+        )
+        bucket_query = bucket_query.replace(
+            "{key_expressions}",
+            key_expressions,
+        )
+        bucket_query = bucket_query.replace(
+            "{n_buckets}",
+            str(self.lock_buckets),
+        )
 
         # Step 3
-        for f in self.model._meta.get_fields():
-            if (hasattr(f, "unique")) and (f.unique) and (not f.primary_key):
-                field_name = f.get_attname_column()[1]
-                valid_conflict_targets.append({field_name})
+        bucket_query = bucket_query.replace(
+            "{from_clause}",
+            self.build_from_clause(),
+        )
+        where_condition = self.build_where_condition()
+        where_clause = (
+            f"WHERE\n\t({where_condition})"
+            if where_condition is not None
+            else ""
+        )
+        bucket_query = bucket_query.replace("{where_clause}", where_clause)
 
         # Step 4
-        for c in self.model._meta.constraints:
-            if isinstance(c, models.UniqueConstraint):
-                valid_conflict_targets.append(set(c.fields))
+        return bucket_query
 
-        # Step 5
-        if self.model._meta.unique_together:
-            valid_conflict_targets.append(set(self.model._meta.unique_together))
+    def build_filter_query(self) -> str:
+        """Build the query counting the staged rows that do not meet [self].where.
 
-        # Step 5
-        return valid_conflict_targets
+        Returns (str):
+            The query counting the rows filtered out of the insert.
+        """
+        # Step 1
+        filter_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            "filter__count.sql",
+        )
+        filter_query = Path(filter_query_path).read_text()
 
-    def validate_conflict_target(self) -> None:
-        """Ensure that [self].conflict_target is valid.
+        # Step 2
+        filter_query = filter_query.replace(
+            "{temp_table_name}",
+            self.temp_table_name,
+        )
+        filter_query = filter_query.replace(
+            "{where_condition}",
+            self.build_where_condition(),
+        )
 
-        In order for a conflict target to be valid, it must meet the following
-        conditions:
-            *   Type is list of strings
-            *   Value(s) form subset of columns of [self].model
-            *   Value(s) form a unique constraint on [self].model
-                *   Primary key
-                *   unique_together
-                *   UniqueConstraint
+        # Step 3
+        return filter_query
 
-        Returns:
-            None
+    def build_order_by_clause(self) -> str:
+        """Build the ORDER BY clause of the staged rows read by the merge.
+
+        Returns (str):
+            The clause ordering the staged rows by [self].get_order_by_columns,
+            or an empty string if there are none.
         """
         # Step 1
-        if self.conflict_target is None:
-            pass
+        order_by_columns = self.get_order_by_columns()
+        if len(order_by_columns) == 0:
+            return ""
 
         # Step 2
-        elif isinstance(self.conflict_target, list):
-            # Step 2.1
-            is_valid = False
+        return "ORDER BY\n\t" + ", ".join(
+            f'"{col}"' for col in order_by_columns
+        )
 
-            # Step 2.1
-            valid_conflict_targets = self.get_valid_conflict_targets()
+    def build_natural_key_expression(self, resolution: Dict[str, str]) -> str:
+        """Build the expression reading a natural key from the temp table.
 
-            # Step 2.2
-            for ct in valid_conflict_targets:
-                if set(self.conflict_target) == ct:
-                    is_valid = True
-                    break
+        Args:
+            resolution (dict[str, str]):
+                One of [self].resolutions.
 
-            # Step 2.3
-            if not is_valid:
-                raise ValueError(
-                    "Column(s) in conflict target must have unique constraint."
-                )
+        Returns (str):
+            The natural key, cast to the type of the parent column it matches.
+        """
+        source_column = resolution["source_column"]
+        cast_type = sql.strip_length(resolution["parent_cast_type"])
+        return f'("{self.temp_table_name}"."{source_column}")::{cast_type}'
 
-        # Step 3
-        else:
-            raise TypeError("Conflict target must be a list or None.")
+    def complete_field_mapping(self) -> None:
+        """Ensure that [self].field_mapping is complete.
 
-    def validate_field_mapping(self) -> None:
-        """Ensure [self].field_mapping is a valid column mapping.
+        Returns:
+            None
+        """
+        # Step 1
+        for col in self.data_columns:
+            if col not in self.field_mapping.keys():
+                self.field_mapping.update({col: col})
 
-        Steps:
-            1.  If field mapping is None, then it is valid.
-            2.  If field mapping is dictionary, then validate it.
-                2.1.    Ensure that each key is the name of a column in
-                        [self].data.
-                2.2.    Ensure that each value is the name of a column in
-                        [self].model.
+    def check_resolutions(self, cursor) -> None:
+        """Confirm that every natural key in the temp table has a parent row.
+
+        Only used if [self].on_error is "abort"; otherwise, rows with
+        unresolved natural keys are ignored or rejected along with other rows
+        that cannot be loaded (see [self].reject).
+
+        Args:
+            cursor:
+                Cursor.
 
         Returns:
             None
         """
         # Step 1
-        if self.field_mapping is None:
-            pass
+        check_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            "resolve__check.sql",
+        )
+        check_template = Path(check_query_path).read_text()
 
         # Step 2
-        elif isinstance(self.field_mapping, dict):
+        for column, resolution in self.resolutions.items():
             # Step 2.1
-            for k in self.field_mapping.keys():
-                if not isinstance(k, str):
-                    raise TypeError(
-                        "All keys of field mapping must be strings."
-                    )
-                elif k not in self.data_columns:
-                    raise ValueError(f"Column {k} not found in CSV data.")
+            check_query = check_template
+            for placeholder, value in (
+                (
+                    "{natural_key}",
+                    self.build_natural_key_expression(resolution),
+                ),
+                ("{temp_table_name}", self.temp_table_name),
+                ("{source_column}", resolution["source_column"]),
+                ("{parent_table_name}", resolution["parent_table"]),
+                ("{parent_column}", resolution["parent_column"]),
+                ("{limit}", str(definitions.UNRESOLVED_KEYS_REPORTED)),
+            ):
+                check_query = check_query.replace(placeholder, value)
 
             # Step 2.2
-            if len(list(self.field_mapping.values())) != len(
-                set(self.field_mapping.values())
-            ):
+            cursor.execute(check_query)
+            unresolved = cursor.fetchall()
+            if len(unresolved) > 0:
+                n_unresolved = unresolved[0][1]
+                keys = ", ".join(repr(key) for key, _ in unresolved)
                 raise ValueError(
-                    "Each column in the field mapping must map to a unique model column."
+                    f"{n_unresolved} row(s) have a value of {resolution['source_column']} with no matching "
+                    f"{resolution['parent_model']}.{resolution['parent_column']} (e.g. {keys})."
                 )
-            for v in self.field_mapping.values():
-                if not isinstance(v, str):
-                    raise TypeError(
-                        "All values of field mapping must be strings."
-                    )
-                elif v not in self.model_columns:
-                    raise ValueError(f"Column {v} not found in model.")
 
-        else:
-            raise TypeError("Field mapping must be a dictionary or None.")
+    def compile(self) -> None:
+        """Render every query of the load pipeline once and store the results.
 
-    def validate_force_not_null(self) -> None:
-        """Confirm that [self].force_not_null is a valid list of columns.
+        Once compiled, the create, copy, insert, and drop steps execute the
+        stored queries instead of rebuilding them, so the same configuration can
+        be applied to many data sources cheaply (see LoadSpec). Compilation is
+        only valid while the configuration of the loader is unchanged. The query
+        that removes rows which cannot be loaded (see [self].on_error) depends
+        on the data, so it is always built during the load.
 
         Returns:
             None
         """
         # Step 1
-        if self.force_not_null is None:
-            pass
+        self.compiled_queries = {
+            "create": self.build_create_query(),
+            "copy": self.build_copy_query(),
+            "insert": self.build_insert_query(),
+            "drop": self.build_drop_query(),
+        }
+        if self.where is not None:
+            self.compiled_queries["filter"] = self.build_filter_query()
+        if self.advisory_lock == "bucket":
+            self.compiled_queries["buckets"] = self.build_bucket_query()
+
+    def count_filtered_rows(self, cursor) -> int:
+        """Count the staged rows that do not meet [self].where.
+
+        Args:
+            cursor:
+                Cursor.
+
+        Returns (int):
+            The number of rows that will be filtered out of the insert.
+        """
+        # Step 1
+        count_query = self.compiled_queries.get("filter")
+        if count_query is None:
+            count_query = self.build_filter_query()
 
         # Step 2
-        elif isinstance(self.force_not_null, list):
-            for column in self.force_not_null:
-                # Step 2.1
-                if not isinstance(column, str):
-                    raise TypeError(
-                        "FORCE NOT NULL column names must be strings."
-                    )
+        cursor.execute(count_query)
+        return cursor.fetchone()[0]
 
-                # Step 2.2
-                elif column not in self.model_columns:
-                    raise ValueError(
-                        f"FORCE NOT NULL column {column} not found in model."
-                    )
+    def count_row_numbers(self, cursor) -> int:
+        """Get the highest row number given to a staged row.
 
-        # Step 3
-        else:
-            raise TypeError(
-                f"FORCE NOT NULL must be a list of database columns."
-            )
+        The number is read from the temp table's row number sequence, without
+        scanning the temp table. Rows removed since they were staged (see
+        [self].on_error) keep their numbers, so it can exceed the number of
+        remaining rows.
 
-    def validate_force_null(self) -> None:
-        """Confirm that [self].force_null is a valid list of columns.
+        Args:
+            cursor:
+                Cursor.
 
-        Returns:
-            None
+        Returns (int):
+            The highest row number, or 0 if no row was staged.
         """
         # Step 1
-        if self.force_null is None:
-            pass
+        cursor.execute(
+            "SELECT pg_get_serial_sequence(%s, %s)",
+            [f'"{self.temp_table_name}"', definitions.ROW_NUMBER_COLUMN],
+        )
+        sequence_name = cursor.fetchone()[0]
 
         # Step 2
-        elif isinstance(self.force_null, list):
-            for column in self.force_null:
-                # Step 2.1
-                if not isinstance(column, str):
-                    raise TypeError("FORCE NULL column names must be strings.")
-
-                # Step 2.2
-                elif column not in self.model_columns:
-                    raise ValueError(
-                        f"FORCE NULL column {column} not found in model."
-                    )
+        cursor.execute(f"SELECT last_value, is_called FROM {sequence_name}")
+        last_value, is_called = cursor.fetchone()
+        return last_value if is_called else 0
 
-        # Step 3
-        else:
-            raise TypeError(f"FORCE NULL must be a list of database columns.")
+    def count_skipped_rows(self, notices: List[str]) -> int:
+        """Count the rows that COPY ... WITH (ON_ERROR ignore) skipped.
 
-    def validate_operation(self) -> None:
-        """Confirm that value of [self].operation is valid.
+        PostgreSQL reports the number of skipped rows in a notice at the end of
+        the COPY rather than in its row count.
 
-        Steps:
-            1.  If [self].operation is one of the permitted operations, then it
-                is valid.
-            2.  If [self].operation is a string but not one of the permitted
-                operations, then raise an error stating the permitted options.
-            3.  If [self].operations is not a string, then raise an error
-                stating that it must be a string.
+        Args:
+            notices (list[str]):
+                The notices received while running the COPY.
 
-        Returns:
-            None
+        Returns (int):
+            The number of rows skipped.
         """
         # Step 1
-        if self.operation in definitions.INCLUDED_OPERATIONS:
-            pass
+        n_skipped = 0
+        for notice in notices:
+            match = re.search(definitions.ON_ERROR_SKIPPED_PATTERN, notice)
+            if match is not None:
+                n_skipped += int(match.group(1))
 
         # Step 2
-        elif isinstance(self.operation, str):
-            raise ValueError(
-                "Operation must be one of: append, replace, safe_append, update, upsert"
-            )
+        return n_skipped
 
-        # Step 3
-        else:
+    def describe_source(self, index: int = 0) -> str:
+        """Describe one of [self].data_sources for error reports.
+
+        Args:
+            index (int):
+                The position of the source within [self].data_sources.
+
+        Returns (str):
+            The path of the source, the name of its file object, or its
+            position if it has no name.
+        """
+        # Step 1
+        source = self.data_sources[index]
+        if isinstance(source, sources.PrefixedReader):
+            source = source.stream
+
+        # Step 2
+        if isinstance(source, str):
+            return source
+        name = getattr(source, "name", None)
+        if isinstance(name, str):
+            return name
+        return f"<stream {index}>"
+
+    def detect_concurrent_writers(self, cursor) -> bool:
+        """Check whether another transaction is writing to the model table.
+
+        Args:
+            cursor:
+                Cursor.
+
+        Returns (bool):
+            True if another backend holds a granted write lock on the model
+            table (see pg_locks), otherwise False.
+        """
+        # Step 1
+        cursor.execute(
+            "SELECT EXISTS (\n"
+            "\tSELECT 1 FROM pg_locks\n"
+            "\tWHERE locktype = 'relation'\n"
+            "\t\tAND relation = %s::regclass\n"
+            "\t\tAND mode = 'RowExclusiveLock'\n"
+            "\t\tAND granted\n"
+            "\t\tAND pid <> pg_backend_pid()\n"
+            ")",
+            [f'"{self.model_table}"'],
+        )
+
+        # Step 2
+        return cursor.fetchone()[0]
+
+    def generate_temp_table_name(self) -> str:
+        """Create a randomly-generated name for a PostgreSQL temp table.
+
+        Steps:
+            1.  Create the prefix for the temp table name (value is "tmp_", or
+                "dpl_stage_" if the table is shared between connections; see
+                [self].shared_staging).
+            2.  Create the suffix for the temp tabel name (value is 20 random
+                letters/digits).
+            3.  Combine the prefix and suffix to form the full table name.
+
+        Returns (str):
+            Randomly-generated name for a PostgreSQL temp table.
+        """
+        # Step 1
+        if self.shared_staging:
+            prefix = definitions.SHARED_STAGING_PREFIX
+        else:
+            prefix = definitions.TEMP_TABLE_PREFIX
+
+        # Step 2
+        valid_characters = string.ascii_letters + string.digits
+        suffix = "".join(random.choices(valid_characters, k=20))
+
+        # Step 3
+        return prefix + suffix
+
+    def generate_reject_table_name(self) -> str:
+        """Create the default name of the table that rejected rows go to.
+
+        Steps:
+            1.  Append definitions.REJECT_TABLE_SUFFIX to the model table's
+                name.
+            2.  If the result is longer than PostgreSQL allows (which the
+                server would silently truncate), then shorten the model
+                table's name and follow it with the first 8 characters of its
+                MD5 hash, so that the name stays the same for every load into
+                the model and differs between models.
+
+        Returns (str):
+            The name of the reject table.
+        """
+        # Step 1
+        name = f"{self.model_table}{definitions.REJECT_TABLE_SUFFIX}"
+        if len(name) <= definitions.MAX_IDENTIFIER_LENGTH:
+            return name
+
+        # Step 2
+        digest = hashlib.md5(self.model_table.encode("utf-8")).hexdigest()[:8]
+        n_kept = (
+            definitions.MAX_IDENTIFIER_LENGTH
+            - len(definitions.REJECT_TABLE_SUFFIX)
+            - len(digest)
+            - 1
+        )
+        return (
+            f"{self.model_table[:n_kept]}_{digest}"
+            f"{definitions.REJECT_TABLE_SUFFIX}"
+        )
+
+    def get_data_columns(self, index: int = 0) -> List[str]:
+        """Get column names from one of [self].data_sources.
+
+        Steps:
+            1.  If [self].columns was provided, then the source has no header
+                row; return [self].columns.
+            2.  Read the header row from the source, decoding it using
+                [self].encoding if the source is binary. Files on the database
+                server are read server-side.
+            3.  Parse the column names from the header row.
+            4.  Return.
+
+        Args:
+            index (int):
+                The position of the source within [self].data_sources.
+
+        Returns (list[str]):
+            The names of the columns found in the source.
+        """
+        # Step 1
+        if self.columns is not None:
+            return list(self.columns)
+
+        # Step 2
+        if self.source == "server":
+            header_row = self.read_server_header_line(index)
+        else:
+            with self.open_data(index) as stream:
+                header_row = sources.read_header_line(stream, self.encoding)
+
+        # Step 3
+        reader = csv.reader(
+            [header_row],
+            delimiter=self.delimiter,
+            quotechar=self.quote_character or '"',
+        )
+        columns = next(reader)
+
+        # Step 4
+        return columns
+
+    def get_default_expressions(self) -> Dict[str, Optional[str]]:
+        """Get the default of each model column that must be filled in.
+
+        A column is filled if [self].fill_defaults is True, the load is not a
+        delete, it is not a data column and is neither transformed nor
+        resolved, and Django would fill it on save (see
+        core.defaults.has_default).
+
+        Returns (dict[str, [str]]):
+            The SQL expression (keyed by model column) giving each column's
+            default, or None if it must be generated client-side.
+        """
+        # Step 1
+        if (not self.fill_defaults) or (self.operation == "delete"):
+            return dict()
+
+        # Step 2
+        provided_columns = set(self.transforms).union(
+            self.resolve,
+            self.data_columns,
+            [self.hash_column] if self.hash_column is not None else [],
+        )
+
+        # Step 3
+        default_expressions = dict()
+        for column in self.model_columns:
+            field = self.model_metadata.fields_by_column[column]
+            if (column in provided_columns) or not defaults.has_default(field):
+                continue
+            default_expressions[column] = defaults.get_default_sql(
+                field,
+                self.db_connection,
+            )
+
+        # Step 4
+        return default_expressions
+
+    def get_order_by_columns(self) -> List[str]:
+        """Get the columns by which the merge reads the staged rows.
+
+        Returns (list[str]):
+            The columns of [self].order_by if it is a list, those of
+            [self].conflict_target if it is True or None (whether the order is
+            used when it is None is decided at load time), otherwise none.
+        """
+        # Step 1
+        if isinstance(self.order_by, list):
+            return self.order_by
+
+        # Step 2
+        elif (
+            (self.order_by is not False)
+            and (self.operation != "delete")
+            and (self.conflict_target is not None)
+        ):
+            return self.conflict_target
+
+        # Step 3
+        else:
+            return []
+
+    def get_model_columns(self) -> List[str]:
+        """Get column names from [self].model.
+
+        Column names are read from the model metadata registry, so the model is
+        only introspected once per database alias.
+
+        Returns (list[str]):
+            The names of the columns found in [self].model.
+        """
+        # Step 1
+        return list(self.model_metadata.columns)
+
+    def get_select_expressions(self) -> Dict[str, str]:
+        """Get the expression used to read each model column from the temp table.
+
+        If the temp table's columns are staged as text (see [self].on_error and
+        [self].transforms), then each value is cast to its model column's type
+        as it is read; client-side defaults are always staged as text, so they
+        are always cast. Length modifiers of character types are left out of the
+        cast (see core.sql.strip_length), so the length is enforced, with an
+        error, when the value is assigned to the column.
+
+        If [self].hash_column is provided, then it is computed from the other
+        columns' expressions (see [self].hash_column).
+
+        Returns (dict[str, str]):
+            The SQL expression (keyed by model column) that produces each
+            loaded column's value in the insert.
+        """
+        # Step 1
+        select_expressions = dict()
+        for column, expression in self.get_value_expressions().items():
+            if self.stage_as_text or (column in self.client_default_columns):
+                cast_type = sql.strip_length(
+                    self.model_metadata.cast_types[column]
+                )
+                expression = f"({expression})::{cast_type}"
+            select_expressions[column] = expression
+
+        # Step 2
+        if self.hash_column is not None:
+            hashed_columns = [
+                column
+                for column in select_expressions
+                if (column not in self.conflict_target)
+                and (column not in self.default_expressions)
+                and (
+                    (not isinstance(self.update_operation, dict))
+                    or (column in self.update_operation)
+                )
+            ]
+            row = ", ".join(select_expressions[col] for col in hashed_columns)
+            cast_type = sql.strip_length(
+                self.model_metadata.cast_types[self.hash_column]
+            )
+            select_expressions[
+                self.hash_column
+            ] = f"(md5(ROW({row})::text))::{cast_type}"
+
+        # Step 3
+        return select_expressions
+
+    def get_value_expressions(self) -> Dict[str, str]:
+        """Get the uncast expression producing each loaded model column.
+
+        Steps:
+            1.  Read each data column that is a column of [self].model and is
+                not transformed directly from the temp table.
+            2.  Compile each transform: SQL strings are used as-is and Django
+                expressions are compiled against a model describing the temp
+                table.
+            3.  Read each resolved foreign key from its parent table's join (see
+                [self].resolve).
+            4.  Add the default of each column that must be filled in (see
+                [self].get_default_expressions); client-side defaults are read
+                from the defaults table.
+            5.  Return.
+
+        Returns (dict[str, str]):
+            The SQL expression (keyed by model column) that produces each
+            loaded column's value, before any cast.
+        """
+        # Step 1
+        value_expressions = dict()
+        for column in self.data_columns:
+            if (column in self.model_columns) and (
+                column not in self.transforms
+            ):
+                value_expressions[
+                    column
+                ] = f'"{self.temp_table_name}"."{column}"'
+
+        # Step 2
+        staging_model = None
+        for column, transform in self.transforms.items():
+            if isinstance(transform, str):
+                value_expressions[column] = transform
+                continue
+            if staging_model is None:
+                staging_model = expressions.build_staging_model(
+                    self.temp_table_name,
+                    self.data_columns,
+                )
+            value_expressions[column] = expressions.compile_expression(
+                transform,
+                staging_model,
+                self.db_connection,
+            )
+
+        # Step 3
+        for column, resolution in self.resolutions.items():
+            value_expressions[
+                column
+            ] = f'"{resolution["alias"]}"."{resolution["target_column"]}"'
+
+        # Step 4
+        for column, expression in self.default_expressions.items():
+            if expression is None:
+                expression = f'"{self.defaults_table_name}"."{column}"'
+            value_expressions[column] = expression
+
+        # Step 5
+        return value_expressions
+
+    def get_staged_columns(self) -> List[str]:
+        """Get the columns of the temp table that data is copied into.
+
+        Returns (list[str]):
+            [self].data_columns, unless skipped columns are staged (see
+            [self].projection), in which case every column of the data in
+            order, with each skipped column given a placeholder name so that
+            it cannot clash with a loaded column.
+        """
+        # Step 1
+        if self.projection != "stage":
+            return list(self.data_columns)
+
+        # Step 2
+        loaded_columns = dict(zip(self.projected_indexes, self.data_columns))
+        return [
+            loaded_columns.get(
+                index,
+                f"{definitions.SKIPPED_COLUMN_PREFIX}{index}",
+            )
+            for index in range(len(self.source_columns))
+        ]
+
+    def get_valid_conflict_targets(self) -> List[Set[str]]:
+        """Get a list of all permissible values of [self].conflict_target.
+
+        See ModelMetadata.get_valid_conflict_targets for the conditions a set of
+        columns must meet. The result is read from the model metadata registry,
+        so the model is only introspected once per database alias.
+
+        Returns (list[set[str]]:
+            All permissible values of [self].conflict_target.
+        """
+        # Step 1
+        return self.model_metadata.valid_conflict_targets
+
+    @contextlib.contextmanager
+    def open_data(self, index: int = 0, threaded: bool = False) -> Iterator:
+        """Open one of [self].data_sources for reading from its start.
+
+        Steps:
+            1.  If the source is a path, then open the file in binary mode;
+                otherwise, rewind the stream (if possible).
+            2.  If the source is compressed, then wrap the stream in a
+                streaming decompressor.
+            3.  If requested, then read the (decompressed) stream on a
+                background thread.
+            4.  Yield the stream, closing anything opened in (1)-(3) on exit.
+                Streams provided by the caller are left open.
+
+        Args:
+            index (int):
+                The position of the source within [self].data_sources.
+            threaded (bool):
+                Whether to read compressed data on a background thread.
+
+        Returns (Iterator):
+            Context manager yielding a readable text or binary stream.
+        """
+        source = self.data_sources[index]
+        compression = self.data_compressions[index]
+        with contextlib.ExitStack() as stack:
+            # Step 1
+            if isinstance(source, str):
+                stream = stack.enter_context(open(file=source, mode="rb"))
+            else:
+                stream = source
+                if sources.is_rewindable(stream):
+                    stream.seek(0)
+
+            # Step 2
+            if compression is not None:
+                stream = stack.enter_context(
+                    sources.decompress(stream, compression)
+                )
+
+                # Step 3
+                if threaded:
+                    stream = stack.enter_context(streams.read_in_thread(stream))
+
+            # Step 4
+            yield stream
+
+    def prepare_data_source(self, data) -> Tuple[object, Optional[str]]:
+        """Validate a single data source and resolve its compression.
+
+        Paths are kept as-is and only opened (in binary mode) when needed, so
+        files are never read into memory. If [self].source is "server", then
+        [data] must be a path on the database server and is not checked here.
+        File-like objects, text or binary, are kept as-is and handed to COPY
+        unchanged. If [data] is a stream that cannot be rewound (and has a
+        header row), then its header row is read now and replayed when COPY
+        reads the stream.
+
+        Args:
+            data (StringIO|BytesIO|BinaryIO|str):
+                If a file-like object, then must be CSV-formatted data. If a
+                string, then must be a path to an existing CSV file.
+
+        Returns (tuple[object, [str]]):
+            The source to read from and its compression (see
+            [self].compression).
+        """
+        # Step 1
+        if self.source == "server":
+            if not isinstance(data, str):
+                raise TypeError(
+                    "If source is server, then data must be a path to a file on the database server."
+                )
+            if self.compression == "infer":
+                compression = sources.detect_compression_from_name(data)
+            else:
+                compression = self.compression
+            if compression is not None:
+                raise NotSupportedError(
+                    "Compressed files cannot be read by the database server."
+                )
+            return data, None
+
+        # Step 2
+        if isinstance(data, str):
+            if not os.path.isfile(data):
+                raise FileNotFoundError(f"File {data} does not exist.")
+            source = data
+
+        # Step 3
+        elif hasattr(data, "read") and hasattr(data, "readline"):
+            source = data
+
+        # Step 4
+        elif hasattr(data, "to_csv"):
+            source = io.StringIO()
+            data.to_csv(source, index=False)
+            source.seek(0)
+
+        # Step 5
+        else:
+            raise TypeError(
+                "Data must be a file-like object or a path to a CSV file."
+            )
+
+        # Step 6
+        if self.compression == "infer":
+            compression = sources.detect_compression(source)
+        else:
+            compression = self.compression
+
+        # Step 7
+        if (self.columns is None) and not (
+            isinstance(source, str) or sources.is_rewindable(source)
+        ):
+            if compression is not None:
+                source = sources.decompress(source, compression)
+                compression = None
+            source = sources.PrefixedReader(source.readline(), source)
+
+        # Step 8
+        return source, compression
+
+    def read_server_header_line(self, index: int = 0) -> str:
+        """Read the header row of a file on the database server.
+
+        Only the first block of the file is read (with pg_read_binary_file), so
+        this is cheap regardless of the size of the file.
+
+        Args:
+            index (int):
+                The position of the source within [self].data_sources.
+
+        Returns (str):
+            The decoded header row.
+        """
+        # Step 1
+        with self.db_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_read_binary_file(%s, 0, %s)",
+                [self.data_sources[index], definitions.SERVER_HEADER_READ_SIZE],
+            )
+            head = bytes(cursor.fetchone()[0])
+
+        # Step 2
+        return sources.read_header_line(io.BytesIO(head), self.encoding)
+
+    def release_advisory_locks(self, cursor, buckets: List[int]) -> None:
+        """Release session-level advisory locks taken outside a transaction.
+
+        If the connection was closed (see [self].bulk_insert), then the server
+        has already released the locks along with the session.
+
+        Args:
+            cursor:
+                Cursor.
+            buckets (list[int]):
+                The buckets locked by [self].acquire_advisory_locks.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.db_connection.in_atomic_block:
+            return
+        elif self.db_connection.connection is None:
+            return
+
+        # Step 2
+        cursor.execute(
+            "SELECT pg_advisory_unlock(%s::regclass::oid::integer, bucket) "
+            "FROM unnest(%s::integer[]) AS bucket ORDER BY bucket DESC",
+            [f'"{self.model_table}"', buckets],
+        )
+
+    def rename_temp_table(self, temp_table_name: Optional[str] = None) -> None:
+        """Give the staging tables of the load a new name.
+
+        The name is substituted into [self].compiled_queries (where it only
+        appears as a quoted identifier), so a compiled loader can stage each
+        load in a fresh table without rendering its queries again.
+
+        Steps:
+            1.  Store the new names of the temp table and the defaults table.
+            2.  Substitute the new names into the compiled queries.
+
+        Args:
+            temp_table_name ([str]):
+                The new name of the temp table. If not provided, then a name
+                will be randomly generated.
+
+        Returns:
+            None
+        """
+        # Step 1
+        old_names = (self.temp_table_name, self.defaults_table_name)
+        if temp_table_name is None:
+            self.temp_table_name = self.generate_temp_table_name()
+        else:
+            self.temp_table_name = temp_table_name
+            self.validate_temp_table_name()
+        self.defaults_table_name = f"{self.temp_table_name}_defaults"
+
+        # Step 2
+        new_names = (self.temp_table_name, self.defaults_table_name)
+        for key, query in self.compiled_queries.items():
+            for old_name, new_name in zip(old_names, new_names):
+                query = query.replace(f'"{old_name}"', f'"{new_name}"')
+            self.compiled_queries[key] = query
+
+    def set_shared_staging(self, shared_staging: bool) -> None:
+        """Choose whether the data is staged in a table shared by connections.
+
+        A temp table is only visible to the connection that created it, so data
+        copied over several connections is staged in an UNLOGGED table instead.
+        Unless [self].temp_table_name was provided, the staging table is
+        renamed to carry the prefix of its kind (see
+        [self].generate_temp_table_name).
+
+        Steps:
+            1.  Store the choice, stopping if it has not changed.
+            2.  Rename the staging table, unless its name was provided.
+            3.  Render the compiled create query, if any, again.
+
+        Args:
+            shared_staging (bool):
+                Whether the staging table is shared between connections.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if shared_staging == self.shared_staging:
+            return
+        self.shared_staging = shared_staging
+
+        # Step 2
+        if not self.temp_table_name_given:
+            self.rename_temp_table()
+
+        # Step 3
+        if "create" in self.compiled_queries:
+            self.compiled_queries["create"] = self.build_create_query()
+
+    def set_data(
+        self,
+        data: Union[
+            str,
+            io.StringIO,
+            io.BytesIO,
+            BinaryIO,
+            List[Union[str, io.StringIO, io.BytesIO, BinaryIO]],
+        ],
+    ) -> None:
+        """Validate [data] and store its sources as [self].data_sources.
+
+        Steps:
+            1.  Expand [data] into a list of sources: a list or tuple is used
+                as-is, a string containing glob wildcards that is not itself an
+                existing file is expanded to the matching paths (in sorted
+                order), and anything else is a single source.
+            2.  Validate each source and resolve its compression.
+            3.  Store the sources. [self].data is the first source.
+
+        Args:
+            data (StringIO|BytesIO|BinaryIO|str|list):
+                The data to load into [self].model. If a file-like object, then
+                must be CSV-formatted data. If a string, then must be a path to
+                an existing CSV file or a glob pattern matching at least one
+                file. If a list, then each element must be one of these (except
+                a glob pattern).
+
+        Returns:
+            None
+        """
+        # Step 1
+        if isinstance(data, (list, tuple)):
+            items = list(data)
+            if len(items) == 0:
+                raise ValueError("Data must include at least one source.")
+        elif (
+            isinstance(data, str)
+            and (self.source == "client")
+            and glob.has_magic(data)
+            and not os.path.isfile(data)
+        ):
+            items = sorted(glob.glob(data))
+            if len(items) == 0:
+                raise FileNotFoundError(f"No files match pattern {data}.")
+        else:
+            items = [data]
+
+        # Step 2
+        prepared = [self.prepare_data_source(item) for item in items]
+
+        # Step 3
+        self.data_sources = [source for source, _ in prepared]
+        self.data_compressions = [compression for _, compression in prepared]
+        self.data = self.data_sources[0]
+
+    def uses_row_numbers(self) -> bool:
+        """Check whether the temp table needs a row number column.
+
+        Row numbers give the line numbers of rejected rows (see
+        [self].on_error), match rows to their client-side defaults (see
+        [self].fill_defaults), and split deletes into batches (see
+        [self].batch_size).
+
+        Returns (bool):
+            True if the temp table needs a row number column.
+        """
+        return (
+            self.stage_as_text
+            or (len(self.client_default_columns) > 0)
+            or (self.batch_size is not None)
+        )
+
+    def validate_advisory_lock(self) -> None:
+        """Confirm that [self].advisory_lock and [self].lock_buckets are valid.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.advisory_lock is None:
+            pass
+        elif not isinstance(self.advisory_lock, str):
+            raise TypeError("Advisory lock must be a string or None.")
+        elif self.advisory_lock not in definitions.INCLUDED_ADVISORY_LOCKS:
+            raise ValueError(
+                f"Advisory lock must be one of: {', '.join(definitions.INCLUDED_ADVISORY_LOCKS)}."
+            )
+        elif (self.advisory_lock == "bucket") and (
+            self.conflict_target is None
+        ):
+            raise ValueError(
+                'If advisory lock is "bucket", then a conflict target must be provided.'
+            )
+
+        # Step 2
+        if isinstance(self.lock_buckets, bool) or not isinstance(
+            self.lock_buckets, int
+        ):
+            raise TypeError("Number of lock buckets must be an integer.")
+        elif self.lock_buckets < 1:
+            raise ValueError("Number of lock buckets must be at least 1.")
+
+    def validate_bulk_mode(self) -> None:
+        """Confirm that [self].bulk_mode and [self].disable_triggers are valid.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if not isinstance(self.bulk_mode, bool):
+            raise TypeError("Bulk mode flag must be a boolean.")
+        elif not isinstance(self.disable_triggers, bool):
+            raise TypeError("Disable triggers flag must be a boolean.")
+
+        # Step 2
+        if self.disable_triggers and (not self.bulk_mode):
+            raise ValueError("Triggers can only be disabled in bulk mode.")
+
+    def validate_compression(self) -> None:
+        """Confirm that [self].compression is valid.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if (self.compression is None) or (self.compression == "infer"):
+            pass
+
+        # Step 2
+        elif isinstance(self.compression, str):
+            if self.compression not in definitions.INCLUDED_COMPRESSIONS:
+                raise ValueError(
+                    f"Compression must be one of: infer, {', '.join(definitions.INCLUDED_COMPRESSIONS)}."
+                )
+
+        # Step 3
+        else:
+            raise TypeError("Compression must be a string or None.")
+
+        # Step 4
+        if not isinstance(self.decompress_in_thread, bool):
+            raise TypeError("Decompress in thread flag must be a boolean.")
+
+    def validate_data_sources(self) -> None:
+        """Confirm that every source in [self].data_sources has the same header.
+
+        All sources are copied into a single temp table using one COPY query, so
+        their columns must match those of the first source exactly.
+
+        Returns:
+            None
+        """
+        # Step 1
+        expected_columns = self.get_data_columns(0)
+
+        # Step 2
+        for index in range(1, len(self.data_sources)):
+            columns = self.get_data_columns(index)
+            if columns != expected_columns:
+                raise ValueError(
+                    f"Columns of data source {index} ({', '.join(columns)}) do not match those of the first data source ({', '.join(expected_columns)})."
+                )
+
+    def validate_data_format(self) -> None:
+        """Confirm that [self].data_format and [self].columns are valid.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.data_format not in definitions.INCLUDED_COPY_FORMATS:
+            if isinstance(self.data_format, str):
+                raise ValueError(
+                    f"Data format must be one of: {', '.join(definitions.INCLUDED_COPY_FORMATS)}."
+                )
+            else:
+                raise TypeError("Data format must be a string.")
+
+        # Step 2
+        if self.columns is None:
+            if self.data_format == "binary":
+                raise ValueError(
+                    "Columns must be provided if data format is binary."
+                )
+
+        # Step 3
+        elif isinstance(self.columns, list) and (len(self.columns) > 0):
+            for column in self.columns:
+                if not isinstance(column, str):
+                    raise TypeError("Columns must be a list of strings.")
+
+        # Step 4
+        else:
+            raise TypeError("Columns must be a non-empty list or None.")
+
+    def validate_resolve(self) -> None:
+        """Confirm that [self].resolve is valid and describe each resolution.
+
+        Steps:
+            1.  Confirm that [self].resolve is a dictionary.
+            2.  For each foreign key to resolve:
+                2.1.    Confirm that the key is a column of [self].model that
+                        is neither a data column nor transformed.
+                2.2.    Confirm that the value is a (data column, parent model,
+                        parent field) tuple.
+                2.3.    Confirm that the parent field is unique, so that the
+                        join matches at most one parent row.
+                2.4.    Find the parent column the foreign key references.
+                2.5.    Store the resolution in [self].resolutions.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if not isinstance(self.resolve, dict):
+            raise TypeError("Resolve must be a dictionary or None.")
+
+        # Step 2
+        self.resolutions: Dict[str, Dict[str, str]] = dict()
+        for column, resolution in self.resolve.items():
+            # Step 2.1
+            if not isinstance(column, str):
+                raise TypeError("All keys of resolve must be strings.")
+            elif column not in self.model_columns:
+                raise ValueError(
+                    f"Resolved column {column} not found in model."
+                )
+            elif (column in self.data_columns) or (column in self.transforms):
+                raise ValueError(
+                    f"Resolved column {column} must not also be a data column or transformed."
+                )
+
+            # Step 2.2
+            if (not isinstance(resolution, tuple)) or (len(resolution) != 3):
+                raise TypeError(
+                    f"Resolution of column {column} must be a tuple of (data column, parent model, parent field)."
+                )
+            source_column, parent, parent_field_name = resolution
+            if source_column not in self.data_columns:
+                raise ValueError(
+                    f"Column {source_column} not found in CSV data."
+                )
+            if not (
+                isinstance(parent, type) and issubclass(parent, models.Model)
+            ):
+                raise TypeError(
+                    f"Parent model for column {column} must be a Django model."
+                )
+            parent_field = parent._meta.get_field(parent_field_name)
+            parent_metadata = registry.get_model_metadata(
+                parent,
+                self.db_connection,
+            )
+
+            # Step 2.3
+            parent_column = parent_field.column
+            if {parent_column} not in parent_metadata.valid_conflict_targets:
+                raise ValueError(
+                    f"Field {parent_field_name} of {parent.__name__} must be unique to resolve column {column}."
+                )
+
+            # Step 2.4
+            field = self.model_metadata.fields_by_column[column]
+            target_field = getattr(field, "target_field", None)
+            if target_field is None:
+                target_column = parent_metadata.pk_column
+            elif issubclass(parent, field.related_model):
+                target_column = target_field.column
+            else:
+                raise ValueError(
+                    f"Column {column} does not reference model {parent.__name__}."
+                )
+
+            # Step 2.5
+            self.resolutions[column] = {
+                "source_column": source_column,
+                "parent_model": parent.__name__,
+                "parent_table": parent_metadata.db_table,
+                "parent_column": parent_column,
+                "parent_cast_type": parent_metadata.cast_types[parent_column],
+                "target_column": target_column,
+                "alias": f"__dpl_{column}",
+            }
+
+    def validate_session_settings(self) -> None:
+        """Confirm that [self].session_settings is valid, and resolve profiles.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.session_settings is None:
+            return
+        elif isinstance(self.session_settings, str):
+            if self.session_settings not in definitions.SESSION_PROFILES:
+                raise ValueError(
+                    f"Session profile must be one of: {', '.join(definitions.SESSION_PROFILES)}."
+                )
+            self.session_settings = dict(
+                definitions.SESSION_PROFILES[self.session_settings]
+            )
+        elif not isinstance(self.session_settings, dict):
+            raise TypeError(
+                "Session settings must be a dictionary, a profile name, or None."
+            )
+
+        # Step 2
+        for name, value in self.session_settings.items():
+            if (not isinstance(name, str)) or (
+                not re.match(definitions.SESSION_SETTING_PATTERN, name)
+            ):
+                raise ValueError(f"Invalid session setting name: {name}.")
+            elif not isinstance(value, str):
+                raise TypeError(
+                    f"Value of session setting {name} must be a string."
+                )
+
+        # Step 3
+        if self.parallel_copies > 1:
+            raise ValueError(
+                "Session settings cannot be used with parallel copies."
+            )
+        elif self.batch_size is not None:
+            raise ValueError(
+                "Session settings cannot be used with a batch size."
+            )
+
+    def validate_source(self) -> None:
+        """Confirm that [self].source is valid.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.source in definitions.INCLUDED_SOURCES:
+            pass
+
+        # Step 2
+        elif isinstance(self.source, str):
+            raise ValueError(
+                f"Source must be one of: {', '.join(definitions.INCLUDED_SOURCES)}."
+            )
+
+        # Step 3
+        else:
+            raise TypeError("Source must be a string.")
+
+    def validate_engine(self) -> None:
+        """Confirm that [self].engine is valid, and resolve "auto".
+
+        Steps:
+            1.  Confirm that [self].engine is one of the permitted engines.
+            2.  Determine whether MERGE can perform [self].operation on the
+                server: every operation but sync needs PostgreSQL 15, and sync
+                needs PostgreSQL 17 (for WHEN NOT MATCHED BY SOURCE and
+                RETURNING) and an unfiltered scope, since MERGE conditions
+                cannot contain subqueries.
+            3.  Resolve "auto", or raise an error if "merge" is not supported.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.engine in definitions.INCLUDED_ENGINES:
+            pass
+        elif isinstance(self.engine, str):
+            raise ValueError(
+                f"Engine must be one of: {', '.join(definitions.INCLUDED_ENGINES)}."
+            )
+        else:
+            raise TypeError("Engine must be a string.")
+
+        # Step 2
+        min_version = definitions.MERGE_ENGINE_MIN_VERSIONS.get(self.operation)
+        is_filtered = (self.scope is not None) and bool(self.scope.query.where)
+        is_supported = (
+            (min_version is not None)
+            and (self.db_connection.pg_version >= min_version)
+            and (not is_filtered)
+        )
+
+        # Step 3
+        if self.engine == "auto":
+            self.engine = "merge" if is_supported else "on_conflict"
+        elif (self.engine == "merge") and (not is_supported):
+            if min_version is None:
+                raise ValueError(
+                    f"The merge engine is only supported for the {', '.join(definitions.MERGE_ENGINE_MIN_VERSIONS)} operations."
+                )
+            elif self.db_connection.pg_version < min_version:
+                raise NotSupportedError(
+                    f"The merge engine requires PostgreSQL version {min_version // 10000} or higher for the {self.operation} operation."
+                )
+            else:
+                raise NotSupportedError(
+                    "The merge engine cannot sync a filtered scope."
+                )
+
+    def validate_hash_column(self) -> None:
+        """Confirm that [self].hash_column can be maintained by the loader.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.hash_column is None:
+            return
+        elif not isinstance(self.hash_column, str):
+            raise TypeError("Hash column must be a string or None.")
+        elif self.hash_column not in self.model_columns:
+            raise ValueError(
+                f"Hash column {self.hash_column} not found in model."
+            )
+        elif self.hash_column in (
+            set(self.data_columns).union(self.transforms).union(self.resolve)
+        ):
+            raise ValueError(
+                f"Hash column {self.hash_column} must not be provided by the data."
+            )
+
+        # Step 2
+        if self.operation not in ["update", "upsert", "sync"]:
+            raise ValueError(
+                "Hash column is only supported for the update, upsert, and sync operations."
+            )
+
+        # Step 3
+        if isinstance(self.update_operation, dict):
+            operations = set(self.update_operation.values())
+        else:
+            operations = {self.update_operation}
+        if operations != {"replace"}:
+            raise ValueError(
+                'Hash column requires every column to be updated with "replace".'
+            )
+
+    def validate_scope(self) -> None:
+        """Confirm that [self].scope is a QuerySet of [self].model or None.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.scope is None:
+            return
+        elif not isinstance(self.scope, models.QuerySet):
+            raise TypeError("Scope must be a QuerySet or None.")
+        elif self.operation != "sync":
+            raise ValueError("Scope is only supported for the sync operation.")
+
+        # Step 2
+        if (
+            self.scope.model._meta.concrete_model
+            != self.model._meta.concrete_model
+        ):
+            raise ValueError(
+                f"Scope must be a QuerySet of {self.model.__name__}."
+            )
+        elif (self.scope.query.low_mark != 0) or (
+            self.scope.query.high_mark is not None
+        ):
+            raise ValueError("Scope cannot be sliced.")
+
+    def validate_batch_size(self) -> None:
+        """Confirm that [self].batch_size is a positive integer or None.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.batch_size is None:
+            return
+        elif isinstance(self.batch_size, bool) or not isinstance(
+            self.batch_size, int
+        ):
+            raise TypeError("Batch size must be an integer or None.")
+        elif self.batch_size < 1:
+            raise ValueError("Batch size must be at least 1.")
+
+        # Step 2
+        if self.operation != "delete":
+            raise ValueError(
+                "Batch size is only supported for the delete operation."
+            )
+
+    def validate_order_by(self) -> None:
+        """Confirm that [self].order_by is valid.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if (self.order_by is None) or (self.order_by is False):
+            return
+        elif self.operation == "delete":
+            raise ValueError(
+                "Order by is not supported for the delete operation."
+            )
+
+        # Step 2
+        if self.order_by is True:
+            if self.conflict_target is None:
+                raise ValueError(
+                    "If order by is True, then a conflict target must be provided."
+                )
+
+        # Step 3
+        elif isinstance(self.order_by, list) and (len(self.order_by) > 0):
+            for column in self.order_by:
+                if not isinstance(column, str):
+                    raise TypeError("Order by columns must be strings.")
+                elif column not in self.model_columns:
+                    raise ValueError(
+                        f"Order by column {column} not found in model."
+                    )
+                elif column not in (
+                    set(self.data_columns)
+                    .union(self.transforms)
+                    .union(self.resolve)
+                ):
+                    raise ValueError(
+                        f"Order by column {column} not found in data."
+                    )
+
+        # Step 4
+        else:
+            raise TypeError(
+                "Order by must be a boolean, a non-empty list, or None."
+            )
+
+    def validate_parallel_copies(self) -> None:
+        """Confirm that [self].parallel_copies is a positive integer.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if isinstance(self.parallel_copies, bool) or not isinstance(
+            self.parallel_copies, int
+        ):
+            raise TypeError("Number of parallel copies must be an integer.")
+
+        # Step 2
+        elif self.parallel_copies < 1:
+            raise ValueError("Number of parallel copies must be at least 1.")
+
+    def validate_conflict_target(self) -> None:
+        """Ensure that [self].conflict_target is valid.
+
+        In order for a conflict target to be valid, it must meet the following
+        conditions:
+            *   Type is list of strings
+            *   Value(s) form subset of columns of [self].model
+            *   Value(s) form a unique constraint on [self].model
+                *   Primary key
+                *   unique_together
+                *   UniqueConstraint
+              (not required if updating, deleting, or using the merge
+              engine, where the values need only be columns of
+              [self].model provided by the data)
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.conflict_target is None:
+            if (self.operation in ["update", "delete", "sync"]) or (
+                self.engine == "merge"
+            ):
+                raise ValueError(
+                    f"If performing load operation {self.operation}, then a conflict target must be provided."
+                )
+
+        # Step 2
+        elif isinstance(self.conflict_target, list) and (
+            (self.operation in ["update", "delete"]) or (self.engine == "merge")
+        ):
+            for column in self.conflict_target:
+                if column not in self.model_columns:
+                    raise ValueError(
+                        f"Conflict target column {column} not found in model."
+                    )
+                elif column not in (
+                    set(self.data_columns)
+                    .union(self.transforms)
+                    .union(self.resolve)
+                ):
+                    raise ValueError(
+                        f"Conflict target column {column} not found in data."
+                    )
+
+        # Step 3
+        elif isinstance(self.conflict_target, list):
+            # Step 3.1
+            is_valid = False
+
+            # Step 3.1
+            valid_conflict_targets = self.get_valid_conflict_targets()
+
+            # Step 3.2
+            for ct in valid_conflict_targets:
+                if set(self.conflict_target) == ct:
+                    is_valid = True
+                    break
+
+            # Step 3.3
+            if not is_valid:
+                raise ValueError(
+                    "Column(s) in conflict target must have unique constraint."
+                )
+
+        # Step 4
+        else:
+            raise TypeError("Conflict target must be a list or None.")
+
+    def validate_field_mapping(self) -> None:
+        """Ensure [self].field_mapping is a valid column mapping.
+
+        Steps:
+            1.  If field mapping is None, then it is valid.
+            2.  If field mapping is dictionary, then validate it.
+                2.1.    Ensure that each key is the name of a column in
+                        [self].data.
+                2.2.    Ensure that each value is the name of a column in
+                        [self].model.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.field_mapping is None:
+            pass
+
+        # Step 2
+        elif isinstance(self.field_mapping, dict):
+            # Step 2.1
+            for k in self.field_mapping.keys():
+                if not isinstance(k, str):
+                    raise TypeError(
+                        "All keys of field mapping must be strings."
+                    )
+                elif k not in self.data_columns:
+                    raise ValueError(f"Column {k} not found in CSV data.")
+
+            # Step 2.2
+            if len(list(self.field_mapping.values())) != len(
+                set(self.field_mapping.values())
+            ):
+                raise ValueError(
+                    "Each column in the field mapping must map to a unique model column."
+                )
+            for v in self.field_mapping.values():
+                if not isinstance(v, str):
+                    raise TypeError(
+                        "All values of field mapping must be strings."
+                    )
+                elif (v not in self.model_columns) and not (
+                    self.transforms or self.resolve or (self.where is not None)
+                ):
+                    raise ValueError(f"Column {v} not found in model.")
+
+        else:
+            raise TypeError("Field mapping must be a dictionary or None.")
+
+    def validate_force_not_null(self) -> None:
+        """Confirm that [self].force_not_null is a valid list of columns.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.force_not_null is None:
+            pass
+
+        # Step 2
+        elif isinstance(self.force_not_null, list):
+            for column in self.force_not_null:
+                # Step 2.1
+                if not isinstance(column, str):
+                    raise TypeError(
+                        "FORCE NOT NULL column names must be strings."
+                    )
+
+                # Step 2.2
+                elif column not in self.model_columns:
+                    raise ValueError(
+                        f"FORCE NOT NULL column {column} not found in model."
+                    )
+
+        # Step 3
+        else:
+            raise TypeError(
+                f"FORCE NOT NULL must be a list of database columns."
+            )
+
+    def validate_force_null(self) -> None:
+        """Confirm that [self].force_null is a valid list of columns.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.force_null is None:
+            pass
+
+        # Step 2
+        elif isinstance(self.force_null, list):
+            for column in self.force_null:
+                # Step 2.1
+                if not isinstance(column, str):
+                    raise TypeError("FORCE NULL column names must be strings.")
+
+                # Step 2.2
+                elif column not in self.model_columns:
+                    raise ValueError(
+                        f"FORCE NULL column {column} not found in model."
+                    )
+
+        # Step 3
+        else:
+            raise TypeError(f"FORCE NULL must be a list of database columns.")
+
+    def validate_on_error(self) -> None:
+        """Confirm that [self].on_error and [self].reject_table_name are valid.
+
+        Steps:
+            1.  Confirm that [self].on_error is one of the permitted values.
+            2.  Confirm that tolerant loading is possible for this load: the
+                data must be CSV and must be copied sequentially.
+            3.  Resolve the name of the reject table (see
+                [self].generate_reject_table_name) and confirm that it is a
+                valid PostgreSQL table name.
+            4.  Decide how errors are caught: by COPY itself (PostgreSQL 17+,
+                "ignore" only, and only if there are no transforms or foreign
+                keys to resolve, as these stage the data as text), or by
+                staging every column as text and checking it server-side.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.on_error in definitions.INCLUDED_ON_ERROR:
+            pass
+        elif isinstance(self.on_error, str):
+            raise ValueError(
+                f"On error must be one of: {', '.join(definitions.INCLUDED_ON_ERROR)}."
+            )
+        else:
+            raise TypeError("On error must be a string.")
+
+        # Step 2
+        if self.on_error != "abort":
+            if self.data_format != "csv":
+                raise NotSupportedError(
+                    "Rows can only be ignored or rejected if data format is csv."
+                )
+            if self.parallel_copies > 1:
+                raise NotSupportedError(
+                    "Rows can only be ignored or rejected if data sources are copied sequentially."
+                )
+
+        # Step 3
+        if (self.reject_table_name is None) and (self.on_error == "reject"):
+            self.reject_table_name = self.generate_reject_table_name()
+        if self.reject_table_name is None:
+            pass
+        elif not isinstance(self.reject_table_name, str):
+            raise TypeError("Reject table name must be a string.")
+        elif len(self.reject_table_name) == 0:
+            raise ValueError(
+                "Reject table name must contain at least one character."
+            )
+        elif len(self.reject_table_name) > definitions.MAX_IDENTIFIER_LENGTH:
+            raise ValueError(
+                f"Reject table name must be no longer than {definitions.MAX_IDENTIFIER_LENGTH} characters."
+            )
+        elif self.reject_table_name[0] not in string.ascii_letters + "_":
+            raise ValueError(
+                "Reject table name must begin with a letter or underscore."
+            )
+        elif not set(self.reject_table_name).issubset(
+            string.ascii_letters + string.digits + "_"
+        ):
+            raise ValueError(
+                "Reject table name must only contain letters, digits, and underscores."
+            )
+
+        # Step 4
+        self.copy_on_error = (
+            (self.on_error == "ignore")
+            and (self.db_connection.pg_version >= 170000)
+            and (not self.transforms)
+            and (not self.resolve)
+        )
+        self.stage_as_text = bool(self.transforms or self.resolve) or (
+            (self.on_error != "abort") and (not self.copy_on_error)
+        )
+
+    def validate_operation(self) -> None:
+        """Confirm that value of [self].operation is valid.
+
+        Steps:
+            1.  If [self].operation is one of the permitted operations, then it
+                is valid.
+            2.  If [self].operation is a string but not one of the permitted
+                operations, then raise an error stating the permitted options.
+            3.  If [self].operations is not a string, then raise an error
+                stating that it must be a string.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.operation in definitions.INCLUDED_OPERATIONS:
+            pass
+
+        # Step 2
+        elif isinstance(self.operation, str):
+            raise ValueError(
+                f"Operation must be one of: {', '.join(definitions.INCLUDED_OPERATIONS)}"
+            )
+
+        # Step 3
+        else:
             raise TypeError("Operation must be a string.")
 
     def validate_temp_table_name(self) -> None:
@@ -614,6 +2587,37 @@ class CopyLoader:
         else:
             raise TypeError("Temp table name must be a string.")
 
+    def validate_transforms(self) -> None:
+        """Confirm that [self].transforms is a valid mapping of expressions.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if not isinstance(self.transforms, dict):
+            raise TypeError("Transforms must be a dictionary or None.")
+
+        # Step 2
+        for column, expression in self.transforms.items():
+            # Step 2.1
+            if not isinstance(column, str):
+                raise TypeError("All keys of transforms must be strings.")
+            elif column not in self.model_columns:
+                raise ValueError(
+                    f"Transformed column {column} not found in model."
+                )
+
+            # Step 2.2
+            if isinstance(expression, str):
+                if len(expression.strip()) == 0:
+                    raise ValueError(
+                        f"Transform for column {column} must not be empty."
+                    )
+            elif not hasattr(expression, "resolve_expression"):
+                raise TypeError(
+                    f"Transform for column {column} must be a SQL string or a Django expression."
+                )
+
     def validate_update_operation(self) -> None:
         """Confirm that [self].update_operation is valid.
 
@@ -685,7 +2689,7 @@ class CopyLoader:
 
         # Step 4
         elif self.update_operation is None:
-            if self.operation in ["update", "upsert"]:
+            if self.operation in ["update", "upsert", "sync"]:
                 raise ValueError(
                     f"If performing load operation {self.operation}, then an update operation must be provided."
                 )
@@ -696,6 +2700,147 @@ class CopyLoader:
                 "Update operation definition must be a string or dictionary."
             )
 
+    def validate_projection(self) -> None:
+        """Decide which columns of the data are loaded, and how others are skipped.
+
+        Steps:
+            1.  Validate [self].include_columns, [self].ignore_extra_columns,
+                and [self].projection.
+            2.  Find the positions of the columns to load: those in
+                [self].include_columns and, if ignoring extra columns, those
+                that map to a column of [self].model or are resolved natural
+                keys. If deleting, then unless told otherwise only the columns
+                of the conflict target (or their natural keys) are loaded.
+            3.  If no column is skipped, then there is nothing to project.
+            4.  Otherwise, resolve "auto" to "stream" or "stage" and confirm
+                that the projection is supported for the data.
+            5.  Keep only the loaded columns in [self].data_columns.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.include_columns is not None:
+            if (not isinstance(self.include_columns, list)) or (
+                len(self.include_columns) == 0
+            ):
+                raise TypeError(
+                    "Include columns must be a non-empty list of strings."
+                )
+            for column in self.include_columns:
+                if not isinstance(column, str):
+                    raise TypeError(
+                        "Include columns must be a non-empty list of strings."
+                    )
+                elif column not in self.source_columns:
+                    raise ValueError(
+                        f"Included column {column} not found in data."
+                    )
+        if not isinstance(self.ignore_extra_columns, bool):
+            raise TypeError("Ignore extra columns flag must be a boolean.")
+        if self.projection not in definitions.INCLUDED_PROJECTIONS:
+            if isinstance(self.projection, str):
+                raise ValueError(
+                    f"Projection must be one of: {', '.join(definitions.INCLUDED_PROJECTIONS)}."
+                )
+            else:
+                raise TypeError("Projection must be a string.")
+
+        # Step 2
+        loaded_columns = set(self.include_columns or [])
+        if self.ignore_extra_columns:
+            wanted_columns = set(self.model_columns)
+        elif (
+            (self.operation == "delete")
+            and (self.include_columns is None)
+            and isinstance(self.conflict_target, list)
+        ):
+            wanted_columns = set(self.conflict_target)
+        else:
+            wanted_columns = None
+        if wanted_columns is not None:
+            mapping = (
+                self.field_mapping
+                if isinstance(self.field_mapping, dict)
+                else dict()
+            )
+            natural_keys = {
+                value[0]
+                for column, value in self.resolve.items()
+                if (column in wanted_columns)
+                and isinstance(value, tuple)
+                and (len(value) > 0)
+            }
+            loaded_columns.update(
+                column
+                for column in self.source_columns
+                if (mapping.get(column, column) in wanted_columns)
+                or (mapping.get(column, column) in natural_keys)
+            )
+        elif self.include_columns is None:
+            loaded_columns = set(self.source_columns)
+        self.projected_indexes = [
+            index
+            for index, column in enumerate(self.source_columns)
+            if column in loaded_columns
+        ]
+
+        # Step 3
+        if len(self.projected_indexes) == len(self.source_columns):
+            self.projection = None
+            return
+        elif len(self.projected_indexes) == 0:
+            raise ValueError("No column of the data would be loaded.")
+
+        # Step 4
+        if self.data_format != "csv":
+            raise NotSupportedError("Columns can only be skipped in CSV data.")
+        if self.projection == "auto":
+            ratio = len(self.projected_indexes) / len(self.source_columns)
+            if (self.source == "client") and (
+                ratio <= definitions.PROJECTION_STREAM_MAX_RATIO
+            ):
+                self.projection = "stream"
+            else:
+                self.projection = "stage"
+        elif (self.projection == "stream") and (self.source == "server"):
+            raise NotSupportedError(
+                "Columns of files read server-side can only be skipped by "
+                "staging them."
+            )
+
+        # Step 5
+        self.data_columns = [
+            self.source_columns[index] for index in self.projected_indexes
+        ]
+
+    def validate_where(self) -> None:
+        """Confirm that [self].where is a valid row filter.
+
+        Returns:
+            None
+        """
+        # Step 1
+        if self.where is None:
+            return
+
+        # Step 2
+        elif isinstance(self.where, str):
+            if len(self.where.strip()) == 0:
+                raise ValueError("Where condition must not be empty.")
+        elif not isinstance(self.where, Q):
+            raise TypeError(
+                "Where condition must be a SQL string or a Q object."
+            )
+
+        # Step 3
+        if (self.data_format == "binary") and (
+            set(self.data_columns) - set(self.model_columns)
+        ):
+            raise NotSupportedError(
+                "Binary data cannot include columns that are not in the model."
+            )
+
     def pre_create(self, cursor) -> None:
         """Pre-create hook.
 
@@ -713,57 +2858,367 @@ class CopyLoader:
         """
         pass
 
-    def build_create_query(self) -> str:
-        """Build the query used to create a temp table on the database.
+    def build_create_query(self) -> str:
+        """Build the query used to create a temp table on the database.
+
+        Steps:
+            1.  Use template to build the create query.
+            2.  Dynamically populate the temp table name and type (UNLOGGED if
+                the table is shared with other connections, e.g. when copying
+                in parallel, since a temp table is only visible to the
+                connection that created it).
+            3.  Generate list of field definitions based on the data's columns.
+                If rows are checked server-side (see [self].on_error) or
+                transformed, then every column is staged as text; columns that
+                are not columns of [self].model (including skipped columns; see
+                [self].projection) always are. If needed (see
+                [self].uses_row_numbers), then a row number column records the
+                order in which rows were copied.
+            4.  Format (3) for inclusion in the template and update the template
+                to include field definitions.
+            5.  Return.
+
+        Returns (str):
+            The query used to create a temp table on the database.
+        """
+        # Step 1
+        create_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            "create.sql",
+        )
+        create_query = Path(create_query_path).read_text()
+
+        # Step 2
+        create_query = create_query.replace(
+            "{temp_table_name}",
+            self.temp_table_name,
+        )
+        table_type = "UNLOGGED" if self.shared_staging else "TEMPORARY"
+        create_query = create_query.replace("{table_type}", table_type)
+
+        # Step 3
+        field_definitions = []
+        for field in self.staged_columns:
+            if self.stage_as_text or (field not in self.model_columns):
+                field_type = "text"
+            else:
+                field_type = self.model_metadata.cast_types[field]
+            field_definition = f'"{field}" {field_type.upper()}'
+            field_definitions.append(field_definition)
+        if self.uses_row_numbers():
+            field_definitions.append(
+                f'"{definitions.ROW_NUMBER_COLUMN}" BIGSERIAL'
+            )
+
+        # Step 4
+        field_definitions = ",\n\t".join(field_definitions)
+        create_query = create_query.replace(
+            "{field_definitions}",
+            field_definitions,
+        )
+
+        # Step 5
+        return create_query
+
+    def post_create(self, cursor) -> None:
+        """Post-create hook.
+
+        This function does nothing, but serves as a placeholder in case users wish
+        to use a custom post-create hook.
+
+        Args:
+            self:
+                CopyLoader instance.
+            cursor:
+                Cursor.
+
+        Returns:
+            None
+        """
+        pass
+
+    def create(self, cursor) -> None:
+        """Create a temp table to store new data.
+
+        Steps:
+            1.  Run the pre-create hook.
+            2.  Build the query used to create the temp table.
+            3.  Execute the query and create the temp table.
+            4.  Run the post-create hook.
+
+        Args:
+            cursor:
+                Cursor.
+
+        Returns:
+            None
+        """
+        # Step 1
+        self.pre_create(cursor)
+
+        # Step 2
+        create_query = self.compiled_queries.get("create")
+        if create_query is None:
+            create_query = self.build_create_query()
+
+        # Step 3
+        cursor.execute(create_query)
+
+        # Step 4
+        self.post_create(cursor)
+
+    def pre_copy(self, cursor) -> None:
+        """Pre-copy hook.
+
+        This function does nothing, but serves as a placeholder in case users wish
+        to use a custom pre-copy hook.
+
+        Args:
+            self:
+                CopyLoader instance.
+            cursor:
+                Cursor.
+
+        Returns:
+            None
+        """
+        pass
+
+    def build_copy_query(self, index: int = 0) -> str:
+        """Build the query used to copy data into the temp table.
+
+        Args:
+            index (int):
+                The position of the data source within [self].data_sources.
+                Only used if [self].source is "server", in which case the path
+                of the source is rendered into the query; otherwise, data is
+                read from STDIN and the query is the same for every source.
+
+        Returns (str):
+            The query used to copy data into the temp table.
+        """
+        # Step 1
+        copy_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            "copy.sql",
+        )
+        copy_query = Path(copy_query_path).read_text()
+
+        # Step 2
+        copy_query = copy_query.replace(
+            "{temp_table_name}",
+            self.temp_table_name,
+        )
+
+        # Step 3
+        columns = ",\n\t".join(f'"{col}"' for col in self.staged_columns)
+        copy_query = copy_query.replace("{columns}", columns)
+
+        # Step 4
+        if self.source == "server":
+            source = sql.quote_literal(self.data_sources[index])
+        else:
+            source = "STDIN"
+        copy_query = copy_query.replace("{source}", source)
+
+        # Step 5
+        header_options = [f"FORMAT {self.data_format}"]
+        if self.data_format == "csv":
+            if self.columns is None:
+                header_options.append("HEADER true")
+            if self.quote_character is not None:
+                header_options.append(
+                    f"QUOTE {sql.quote_literal(self.quote_character)}"
+                )
+            header_options.append(
+                f"DELIMITER {sql.quote_literal(self.delimiter)}"
+            )
+            if self.null_string is not None:
+                header_options.append(
+                    f"NULL {sql.quote_literal(self.null_string)}"
+                )
+            if self.force_null is not None:
+                force_null = ", ".join(f'"{col}"' for col in self.force_null)
+                header_options.append(f"FORCE_NULL ({force_null})")
+            if self.force_not_null is not None:
+                force_not_null = ", ".join(
+                    f'"{col}"' for col in self.force_not_null
+                )
+                header_options.append(f"FORCE_NOT_NULL ({force_not_null})")
+            if self.copy_on_error:
+                header_options.append("ON_ERROR ignore")
+        if self.encoding is not None:
+            header_options.append(
+                f"ENCODING {sql.quote_literal(self.encoding)}"
+            )
+
+        # Step 6
+        header_options = ",\n\t".join(header_options)
+        copy_query = copy_query.replace("{header_options}", header_options)
+
+        # Step 7
+        return copy_query
+
+    def post_copy(self, cursor) -> None:
+        """Post-copy hook.
+
+        This function does nothing, but serves as a placeholder in case users wish
+        to use a custom post-copy hook.
+
+        Args:
+            self:
+                CopyLoader instance.
+            cursor:
+                Cursor.
+
+        Returns:
+            None
+        """
+        pass
+
+    def copy(self, cursor) -> None:
+        """Populate the temp table with data from STDIN or server-side files.
 
         Steps:
-            1.  Use template to build the create query.
-            2.  Dynamically populate the temp table name.
-            3.  Generate list of field definitions based on the data's columns.
-            4.  Format (3) for inclusion in the template and update the template
-                to include field definitions.
-            5.  Return.
+            1.  Run the pre-copy hook.
+            2.  Build the query used to populate the temp table.
+            3.  Execute the query once per data source and populate the temp
+                table, over several connections if copying in parallel.
+            4.  Record the number of rows copied from (and skipped in) each
+                source.
+            5.  Run the post-copy hook.
 
-        Returns (str):
-            The query used to create a temp table on the database.
+        Args:
+            cursor:
+                Cursor.
+
+        Returns:
+            None
         """
         # Step 1
-        create_query_path = os.path.join(
-            definitions.SQL_TEMPLATE_DIR,
-            "create.sql",
-        )
-        create_query = Path(create_query_path).read_text()
+        self.pre_copy(cursor)
 
         # Step 2
-        create_query = create_query.replace(
-            "{temp_table_name}",
-            self.temp_table_name,
-        )
+        copy_query = self.compiled_queries.get("copy")
+        if copy_query is None:
+            copy_query = self.build_copy_query()
 
         # Step 3
-        field_definitions = []
-        for field in self.data_columns:
-            field_type = self.model._meta.get_field(field).db_type(
-                self.db_connection
-            )
-            field_definition = f'"{field}" {field_type.upper()}'
-            field_definitions.append(field_definition)
+        if self.shared_staging and (len(self.data_sources) > 1):
+            row_counts = self.copy_in_parallel(copy_query)
+        else:
+            row_counts = [
+                self.copy_source(cursor, index, copy_query)
+                for index in range(len(self.data_sources))
+            ]
 
         # Step 4
-        field_definitions = ",\n\t".join(field_definitions)
-        create_query = create_query.replace(
-            "{field_definitions}",
-            field_definitions,
+        self.source_row_counts = [n_copied for n_copied, _ in row_counts]
+        self.stats["rows_copied"] = sum(self.source_row_counts)
+        self.stats["rows_rejected"] = sum(
+            n_skipped for _, n_skipped in row_counts
         )
 
         # Step 5
-        return create_query
+        self.post_copy(cursor)
 
-    def post_create(self, cursor) -> None:
-        """Post-create hook.
+    def copy_source(
+        self,
+        cursor,
+        index: int,
+        copy_query: str,
+    ) -> Tuple[int, int]:
+        """Copy a single data source into the temp table.
+
+        Args:
+            cursor:
+                Cursor.
+            index (int):
+                The position of the source within [self].data_sources.
+            copy_query (str):
+                The query used to populate the temp table from STDIN. Not used
+                if [self].source is "server", as the query then includes the
+                path of the source.
+
+        Returns (tuple[int, int]):
+            The number of rows copied and the number of rows skipped by COPY
+            (only ever non-zero if COPY is run with ON_ERROR ignore).
+        """
+        # Step 1
+        notices = getattr(cursor.connection, "notices", None)
+        if self.copy_on_error and (notices is not None):
+            del notices[:]
+
+        # Step 2
+        if self.source == "server":
+            cursor.execute(self.build_copy_query(index))
+
+        # Step 3
+        else:
+            with self.open_data(
+                index,
+                threaded=self.decompress_in_thread,
+            ) as stream:
+                if self.projection == "stream":
+                    stream = sources.ColumnProjector(
+                        stream,
+                        self.projected_indexes,
+                        len(self.source_columns),
+                        delimiter=self.delimiter,
+                        quote_character=self.quote_character,
+                        encoding=self.encoding,
+                    )
+                cursor.copy_expert(copy_query, stream)
+
+        # Step 4
+        n_skipped = 0
+        if self.copy_on_error and (notices is not None):
+            n_skipped = self.count_skipped_rows(notices)
+
+        # Step 5
+        return cursor.rowcount, n_skipped
+
+    def copy_in_parallel(self, copy_query: str) -> List[Tuple[int, int]]:
+        """Copy every data source into the staging table concurrently.
+
+        Each worker thread uses its own connection to [self].db_alias (Django
+        connections are thread-local), which is closed once its copy is done.
+        The staging table must be UNLOGGED and already committed so that it is
+        visible to the workers' connections.
+
+        Args:
+            copy_query (str):
+                The query used to populate the staging table.
+
+        Returns (list[tuple[int, int]]):
+            The number of rows copied and skipped for each data source (see
+            [self].copy_source).
+        """
+
+        # Step 1
+        def copy_source(index: int) -> Tuple[int, int]:
+            connection = connections[self.db_alias]
+            try:
+                with connection.cursor() as cursor:
+                    return self.copy_source(cursor, index, copy_query)
+            finally:
+                connection.close()
+
+        # Step 2
+        with ThreadPoolExecutor(max_workers=self.parallel_copies) as executor:
+            futures = [
+                executor.submit(copy_source, index)
+                for index in range(len(self.data_sources))
+            ]
+
+        # Step 3
+        return [future.result() for future in futures]
+
+    def pre_reject(self, cursor) -> None:
+        """Pre-reject hook.
 
         This function does nothing, but serves as a placeholder in case users wish
-        to use a custom post-create hook.
+        to use a custom pre-reject hook.
 
         Args:
             self:
@@ -776,102 +3231,426 @@ class CopyLoader:
         """
         pass
 
-    def create(self, cursor) -> None:
-        """Create a temp table to store new data.
+    def build_error_expression(
+        self,
+        invalid_rows: Optional[List[int]] = None,
+    ) -> Optional[str]:
+        """Build the expression giving the error (if any) of a temp table row.
 
         Steps:
-            1.  Run the pre-create hook.
-            2.  Build the query used to create the temp table.
-            3.  Execute the query and create the temp table.
-            4.  Run the post-create hook.
+            1.  For each loaded model column (other than those filled with
+                defaults or resolved), check that its value (after any
+                transform) is not null if the column is NOT NULL.
+            2.  For each foreign key to resolve, check that its natural key is
+                not null if the column is NOT NULL.
+            3.  If the data is staged as text, then check that each value is
+                valid input for its type (see [self].get_input_checks and
+                [self].build_input_checks).
+            4.  For each foreign key to resolve, check that a parent row
+                matches its natural key.
+            5.  Combine the checks so that the first failure is reported.
+            6.  Return.
 
         Args:
-            cursor:
-                Cursor.
+            invalid_rows ([list[int]]):
+                The row numbers of the rows with invalid input, if found in
+                advance (see [self].find_invalid_input_rows).
+
+        Returns ([str]):
+            An expression that is NULL if a temp table row can be loaded and
+            otherwise describes why it cannot, or None if there is nothing to
+            check.
+        """
+        # Step 1
+        checks = []
+        for column, value in self.get_value_expressions().items():
+            if (column in self.default_expressions) or (
+                column in self.resolutions
+            ):
+                continue
+            elif column in self.transforms:
+                value = f"({value})"
+            if column in self.model_metadata.not_null_columns:
+                message = sql.quote_literal(
+                    f'null value in column "{column}" violates not-null constraint'
+                )
+                checks.append(f"CASE WHEN {value} IS NULL THEN {message} END")
 
-        Returns:
-            None
+        # Step 2
+        for column, resolution in self.resolutions.items():
+            source_column = resolution["source_column"]
+            value = f'"{self.temp_table_name}"."{source_column}"'
+            if column in self.model_metadata.not_null_columns:
+                message = sql.quote_literal(
+                    f'null value in column "{column}" violates not-null constraint'
+                )
+                checks.append(f"CASE WHEN {value} IS NULL THEN {message} END")
+
+        # Step 3
+        for label, value, cast_type, max_length in self.get_input_checks():
+            checks.extend(
+                self.build_input_checks(
+                    label,
+                    value,
+                    cast_type,
+                    max_length,
+                    invalid_rows=invalid_rows,
+                )
+            )
+
+        # Step 4
+        for column, resolution in self.resolutions.items():
+            source_column = resolution["source_column"]
+            value = f'"{self.temp_table_name}"."{source_column}"'
+            parent_table = resolution["parent_table"]
+            parent_column = resolution["parent_column"]
+            natural_key = self.build_natural_key_expression(resolution)
+            prefix = sql.quote_literal(
+                f"{source_column}: no {resolution['parent_model']} with "
+                f"{parent_column} = "
+            )
+            checks.append(
+                f"CASE WHEN {value} IS NOT NULL AND NOT EXISTS ("
+                f'SELECT 1 FROM "{parent_table}" '
+                f'WHERE "{parent_table}"."{parent_column}" = {natural_key}'
+                f") THEN {prefix} || {value} END"
+            )
+
+        # Step 5
+        if len(checks) == 0:
+            return None
+        error_expression = "COALESCE(\n\t\t" + ",\n\t\t".join(checks) + "\n\t)"
+
+        # Step 6
+        return error_expression
+
+    def get_input_checks(self) -> List[Tuple[str, str, str, Optional[int]]]:
+        """List the staged text values that must be valid input for a type.
+
+        Nothing needs checking unless the data is staged as text. Then every
+        loaded model column (other than those filled with defaults or resolved;
+        after any transform) must be valid input for the column's type, and
+        the natural key of every foreign key to resolve must be valid input for
+        the type of the parent column.
+
+        Returns (list[tuple[str, str, str, [int]]]):
+            The name reported in error messages, the SQL expression of the
+            text value, the type, and the maximum length (of character types)
+            of each value to check.
         """
         # Step 1
-        self.pre_create(cursor)
+        input_checks = []
+        if not self.stage_as_text:
+            return input_checks
 
         # Step 2
-        create_query = self.build_create_query()
+        for column, value in self.get_value_expressions().items():
+            if (column in self.default_expressions) or (
+                column in self.resolutions
+            ):
+                continue
+            elif column in self.transforms:
+                value = f"({value})::text"
+            field = self.model_metadata.fields_by_column[column]
+            input_checks.append(
+                (
+                    column,
+                    value,
+                    self.model_metadata.cast_types[column],
+                    getattr(field, "max_length", None),
+                )
+            )
 
         # Step 3
-        cursor.execute(create_query)
+        for resolution in self.resolutions.values():
+            source_column = resolution["source_column"]
+            input_checks.append(
+                (
+                    source_column,
+                    f'"{self.temp_table_name}"."{source_column}"',
+                    resolution["parent_cast_type"],
+                    None,
+                )
+            )
 
         # Step 4
-        self.post_create(cursor)
+        return input_checks
 
-    def pre_copy(self, cursor) -> None:
-        """Pre-copy hook.
+    def build_input_checks(
+        self,
+        label: str,
+        value: str,
+        cast_type: str,
+        max_length: Optional[int] = None,
+        invalid_rows: Optional[List[int]] = None,
+    ) -> List[str]:
+        """Build the checks that a text value is valid input for a type.
+
+        On PostgreSQL 16+, type input is checked with pg_input_is_valid. On
+        older versions, the rows with invalid input are found in advance (see
+        [self].find_invalid_input_rows), and only their values are passed to a
+        function that attempts the cast to get its error message; every other
+        row is known to be valid. Casts truncate character values rather than
+        failing, so the maximum length of character types is checked
+        explicitly.
 
-        This function does nothing, but serves as a placeholder in case users wish
-        to use a custom pre-copy hook.
+        Args:
+            label (str):
+                The name of the column reported in error messages.
+            value (str):
+                The SQL expression of the text value.
+            cast_type (str):
+                The type the value must be valid input for.
+            max_length ([int]):
+                The maximum length of the value, if the type is a character
+                type with a length.
+            invalid_rows ([list[int]]):
+                The row numbers of the rows with invalid input (before
+                PostgreSQL 16). If not provided, then every row is checked with
+                the function.
+
+        Returns (list[str]):
+            Expressions that are NULL if the value is valid and otherwise
+            describe why it is not.
+        """
+        # Step 1
+        checks = []
+        type_name = sql.quote_literal(cast_type)
+        prefix = sql.quote_literal(f"{label}: ")
+
+        # Step 2
+        if self.db_connection.pg_version >= 160000:
+            checks.append(
+                f"CASE WHEN NOT pg_input_is_valid({value}, {type_name}) "
+                f"THEN {prefix} || (pg_input_error_info({value}, {type_name})).message END"
+            )
+
+        # Step 3
+        else:
+            function_check = (
+                f"{prefix} || pg_temp.dpl_input_error({value}, {type_name})"
+            )
+            if invalid_rows is None:
+                checks.append(function_check)
+            elif len(invalid_rows) > 0:
+                row_number = f'"{self.temp_table_name}"."{definitions.ROW_NUMBER_COLUMN}"'
+                rows = ", ".join(str(int(row)) for row in invalid_rows)
+                checks.append(
+                    f"CASE WHEN {row_number} IN ({rows}) "
+                    f"THEN {function_check} END"
+                )
+            if (max_length is not None) and cast_type.lower().startswith(
+                ("varchar", "char")
+            ):
+                message = sql.quote_literal(
+                    f"{label}: value too long for type {cast_type}"
+                )
+                checks.append(
+                    f"CASE WHEN char_length({value}) > {int(max_length)} THEN {message} END"
+                )
+
+        # Step 4
+        return checks
+
+    def index_row_numbers(self, cursor) -> None:
+        """Index the row numbers of the temp table, unless already indexed.
+
+        Used before reading ranges of row numbers (see
+        [self].find_invalid_input_rows and [self].batch_size), which would
+        otherwise each scan the whole temp table. The table is analyzed, so
+        that the planner uses the index.
 
         Args:
-            self:
-                CopyLoader instance.
             cursor:
                 Cursor.
 
         Returns:
             None
         """
-        pass
+        # Step 1
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS "
+            f'"{self.temp_table_name}_rows" ON "{self.temp_table_name}" '
+            f'("{definitions.ROW_NUMBER_COLUMN}");\n'
+            f'ANALYZE "{self.temp_table_name}";'
+        )
 
-    def build_copy_query(self) -> str:
-        """Build the query used to copy data into the temp table.
+    def find_invalid_input_rows(self, cursor) -> List[int]:
+        """Find the rows whose staged text is not valid input for its type.
 
-        Returns (str):
-            The query used to copy data into the temp table.
+        Used before PostgreSQL 16, which lacks pg_input_is_valid. Every value
+        of a range of rows is cast to its type in one statement, inside a
+        savepoint; if any cast fails, then the range is split in two and each
+        half is tried again, down to single rows. A load with k invalid rows
+        out of n therefore needs about 1 + 2k*log2(n) statements (and
+        savepoints), rather than a subtransaction per value. The row numbers
+        are indexed first (see [self].index_row_numbers), so that each probe
+        only reads its own range: the probes read about n rows in total for
+        the first statement plus 2k*log2(n) ranges whose sizes halve at each
+        level, rather than n rows per probe.
+
+        Args:
+            cursor:
+                Cursor.
+
+        Returns (list[int]):
+            The row numbers of the rows with invalid input, in order.
         """
         # Step 1
-        copy_query_path = os.path.join(
-            definitions.SQL_TEMPLATE_DIR,
-            "copy.sql",
+        input_checks = self.get_input_checks()
+        if len(input_checks) == 0:
+            return []
+        row_number = f'"{definitions.ROW_NUMBER_COLUMN}"'
+        casts = ", ".join(
+            f"count(({value})::{cast_type})"
+            for _, value, cast_type, _ in input_checks
+        )
+        probe_query = (
+            f'SELECT {casts} FROM "{self.temp_table_name}" '
+            f"WHERE {row_number} BETWEEN %s AND %s"
         )
-        copy_query = Path(copy_query_path).read_text()
 
         # Step 2
-        copy_query = copy_query.replace(
-            "{temp_table_name}",
-            self.temp_table_name,
+        cursor.execute(
+            f'SELECT min({row_number}), max({row_number}) FROM "{self.temp_table_name}"'
         )
+        first, last = cursor.fetchone()
+        if first is None:
+            return []
+        self.index_row_numbers(cursor)
 
         # Step 3
-        columns = ",\n\t".join(self.data_columns)
-        copy_query = copy_query.replace("{columns}", columns)
+        invalid_rows = []
+        ranges = [(first, last)]
+        while len(ranges) > 0:
+            start, end = ranges.pop()
+            try:
+                with transaction.atomic(using=self.db_alias):
+                    cursor.execute(probe_query, [start, end])
+            except DatabaseError:
+                if start == end:
+                    invalid_rows.append(start)
+                else:
+                    middle = (start + end) // 2
+                    ranges.append((middle + 1, end))
+                    ranges.append((start, middle))
 
         # Step 4
-        header_options = []
-        if self.quote_character is not None:
-            header_options.append(f"QUOTE {self.quote_character}")
-        header_options.append(f"DELIMITER '{self.delimiter}'")
-        if self.null_string is not None:
-            header_options.append(f"NULL '{self.null_string}'")
-        if self.force_null is not None:
-            force_null = ", ".join(f'"{col}' for col in self.force_null)
-            header_options.append(f"FORCE_NULL {force_null}")
-        if self.force_not_null is not None:
-            force_not_null = ", ".join(f'"{col}' for col in self.force_not_null)
-            header_options.append(f"FORCE_NOT_NULL {force_not_null}")
-        if self.encoding is not None:
-            header_options.append(f"ENCODING {self.encoding}")
+        return invalid_rows
+
+    def build_reject_query(
+        self,
+        invalid_rows: Optional[List[int]] = None,
+    ) -> Optional[str]:
+        """Build the query used to remove rows that cannot be loaded.
+
+        Rows whose error expression (see [self].build_error_expression) is not
+        NULL are deleted from the temp table. If [self].on_error is "reject",
+        then they are written to [self].reject_table_name in the same statement,
+        along with their error, source, and line number. The line number is
+        derived from the row's position in the temp table and the number of rows
+        copied from each source, so the query depends on the data and cannot be
+        compiled ahead of time.
+
+        Args:
+            invalid_rows ([list[int]]):
+                The row numbers of the rows with invalid input, if found in
+                advance (see [self].find_invalid_input_rows).
+
+        Returns ([str]):
+            The query used to remove rows that cannot be loaded, or None if
+            there is nothing to check.
+        """
+        # Step 1
+        error_expression = self.build_error_expression(invalid_rows)
+        if error_expression is None:
+            return None
+
+        # Step 2
+        reject_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            f"reject__{self.on_error}.sql",
+        )
+        reject_query = Path(reject_query_path).read_text()
+
+        # Step 3
+        reject_query = reject_query.replace(
+            "{temp_table_name}",
+            self.temp_table_name,
+        )
+        reject_query = reject_query.replace(
+            "{error_expression}",
+            error_expression,
+        )
+
+        # Step 4
+        if self.on_error == "reject":
+            # Step 4.1
+            row_number = f'"{definitions.ROW_NUMBER_COLUMN}"'
+            header_lines = 1 if self.columns is None else 0
+            source_cases = []
+            line_number_cases = []
+            offset = 0
+            for index, n_rows in enumerate(self.source_row_counts):
+                condition = f"WHEN {row_number} <= {offset + n_rows}"
+                source = sql.quote_literal(self.describe_source(index))
+                source_cases.append(f"{condition} THEN {source}")
+                line_number_cases.append(
+                    f"{condition} THEN {row_number} - {offset} + {header_lines}"
+                )
+                offset += n_rows
+
+            # Step 4.2
+            if len(source_cases) > 0:
+                source_expression = f"CASE {' '.join(source_cases)} END"
+                line_number_expression = (
+                    f"CASE {' '.join(line_number_cases)} END"
+                )
+            else:
+                source_expression = "NULL"
+                line_number_expression = "NULL"
+
+            # Step 4.3
+            for placeholder, value in (
+                ("{reject_table_name}", self.reject_table_name),
+                ("{model_table_name}", sql.quote_literal(self.model_table)),
+                ("{source_expression}", source_expression),
+                ("{line_number_expression}", line_number_expression),
+                ("{row_number_column}", definitions.ROW_NUMBER_COLUMN),
+                ("{error_column}", definitions.ERROR_COLUMN),
+            ):
+                reject_query = reject_query.replace(placeholder, value)
 
         # Step 5
-        header_options = "\n\t".join(header_options)
-        copy_query = copy_query.replace("{header_options}", header_options)
+        return reject_query
 
-        # Step 6
-        return copy_query
+    def build_reject_table_query(self) -> str:
+        """Build the query used to create the reject table if it is missing.
 
-    def post_copy(self, cursor) -> None:
-        """Post-copy hook.
+        Returns (str):
+            The query used to create [self].reject_table_name.
+        """
+        # Step 1
+        create_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            "reject__create.sql",
+        )
+        create_query = Path(create_query_path).read_text()
+
+        # Step 2
+        create_query = create_query.replace(
+            "{reject_table_name}",
+            self.reject_table_name,
+        )
+
+        # Step 3
+        return create_query
+
+    def post_reject(self, cursor) -> None:
+        """Post-reject hook.
 
         This function does nothing, but serves as a placeholder in case users wish
-        to use a custom post-copy hook.
+        to use a custom post-reject hook.
 
         Args:
             self:
@@ -884,33 +3663,152 @@ class CopyLoader:
         """
         pass
 
-    def copy(self, cursor) -> None:
-        """Populate the temp table with data from STDIN.
+    def reject(self, cursor) -> int:
+        """Remove rows that cannot be loaded from the temp table.
 
         Steps:
-            1.  Run the pre-copy hook.
-            2.  Build the query used to populate the temp table.
-            3.  Execute the query and populate the temp table.
-            4.  Run the post-copy hook.
+            1.  Run the pre-reject hook.
+            2.  Create the reject table (if rejecting). Before PostgreSQL 16,
+                find the rows with invalid input and, if there are any, create
+                the function that gets their error messages.
+            3.  Build the query used to remove rows that cannot be loaded.
+            4.  Execute the query and add the number of rows removed to
+                [self].stats.
+            5.  Run the post-reject hook.
+            6.  Return.
 
         Args:
             cursor:
                 Cursor.
 
-        Returns:
-            None
+        Returns (int):
+            The number of rows removed.
         """
         # Step 1
-        self.pre_copy(cursor)
+        self.pre_reject(cursor)
 
         # Step 2
-        copy_query = self.build_copy_query()
+        if self.on_error == "reject":
+            cursor.execute(self.build_reject_table_query())
+        invalid_rows = None
+        if self.stage_as_text and (self.db_connection.pg_version < 160000):
+            invalid_rows = self.find_invalid_input_rows(cursor)
+            if len(invalid_rows) > 0:
+                function_query_path = os.path.join(
+                    definitions.SQL_TEMPLATE_DIR,
+                    "reject__function.sql",
+                )
+                cursor.execute(Path(function_query_path).read_text())
 
         # Step 3
-        cursor.copy_expert(copy_query, self.data)
+        reject_query = self.build_reject_query(invalid_rows)
 
         # Step 4
-        self.post_copy(cursor)
+        n_rows_rejected = 0
+        if reject_query is not None:
+            cursor.execute(reject_query)
+            n_rows_rejected = cursor.rowcount
+        self.stats["rows_rejected"] = (
+            self.stats.get("rows_rejected", 0) + n_rows_rejected
+        )
+
+        # Step 5
+        self.post_reject(cursor)
+
+        # Step 6
+        return n_rows_rejected
+
+    def build_defaults_queries(self) -> Tuple[str, str]:
+        """Build the queries used to create and populate the defaults table.
+
+        Returns (tuple[str, str]):
+            The query used to create the defaults table and the query used to
+            copy generated defaults into it from STDIN.
+        """
+        # Step 1
+        columns = [definitions.ROW_NUMBER_COLUMN] + self.client_default_columns
+        queries = []
+        for template in ("defaults__create.sql", "defaults__copy.sql"):
+            query_path = os.path.join(definitions.SQL_TEMPLATE_DIR, template)
+            query = Path(query_path).read_text()
+            query = query.replace(
+                "{defaults_table_name}",
+                self.defaults_table_name,
+            )
+            queries.append(query)
+        create_query, copy_query = queries
+
+        # Step 2
+        field_definitions = [f'"{columns[0]}" BIGINT'] + [
+            f'"{col}" TEXT' for col in columns[1:]
+        ]
+        create_query = create_query.replace(
+            "{field_definitions}",
+            ",\n\t".join(field_definitions),
+        )
+
+        # Step 3
+        copy_query = copy_query.replace(
+            "{columns}",
+            ",\n\t".join(f'"{col}"' for col in columns),
+        )
+
+        # Step 4
+        return create_query, copy_query
+
+    def generate_defaults(self, cursor) -> None:
+        """Generate client-side defaults for every staged row.
+
+        Only used for callable defaults with no server-side equivalent (see
+        [self].fill_defaults). The defaults are generated in batches on a
+        background thread while they are copied into the defaults table, so
+        memory use does not grow with the number of rows.
+
+        Steps:
+            1.  Create the defaults table.
+            2.  Read the number of rows staged from the temp table's row number
+                sequence (without scanning the temp table).
+            3.  Copy one row of generated defaults per staged row.
+
+        Args:
+            cursor:
+                Cursor.
+
+        Returns:
+            None
+        """
+        # Step 1
+        create_query, copy_query = self.build_defaults_queries()
+        cursor.execute(create_query)
+
+        # Step 2
+        n_rows = self.count_row_numbers(cursor)
+
+        # Step 3
+        fields = [
+            self.model_metadata.fields_by_column[col]
+            for col in self.client_default_columns
+        ]
+
+        def producer(pipe: streams.Pipe) -> None:
+            batch_size = definitions.DEFAULTS_BATCH_SIZE
+            for start in range(1, n_rows + 1, batch_size):
+                lines = [
+                    defaults.format_csv_row(
+                        [str(row_number)]
+                        + [
+                            defaults.to_copy_text(f, f.get_default())
+                            for f in fields
+                        ]
+                    )
+                    for row_number in range(
+                        start, min(start + batch_size, n_rows + 1)
+                    )
+                ]
+                pipe.write("".join(lines))
+
+        with streams.produce_in_thread(producer) as pipe:
+            cursor.copy_expert(copy_query, pipe)
 
     def pre_insert(self, cursor) -> None:
         """Pre-insert hook.
@@ -932,10 +3830,19 @@ class CopyLoader:
     def build_insert_query(self) -> str:
         """Build the query used to insert temp table data into model table.
 
+        Columns filled with their defaults (see [self].fill_defaults) are only
+        set when rows are inserted, except auto_now columns, which are also
+        replaced whenever a row is updated.
+
         Returns (str):
-            The query used to insert temp table data into model table.
+            The query used to insert temp table data into model table (or, if
+            deleting, to delete the matching rows of the model table).
         """
         # Step 1
+        if self.engine == "merge":
+            return self.build_merge_query()
+        elif self.operation == "delete":
+            return self.build_delete_query()
         insert_query_path = os.path.join(
             definitions.SQL_TEMPLATE_DIR,
             f"insert__{self.operation}.sql",
@@ -950,13 +3857,36 @@ class CopyLoader:
         )
 
         # Step 3
+        insert_query = insert_query.replace(
+            "{from_clause}",
+            self.build_from_clause(),
+        )
         insert_query = insert_query.replace(
             "{temp_table_name}",
             self.temp_table_name,
         )
+        where_condition = self.build_where_condition()
+        where_clause = (
+            f"WHERE\n\t({where_condition})"
+            if where_condition is not None
+            else ""
+        )
+        insert_query = insert_query.replace("{where_clause}", where_clause)
+        if self.order_by is not None:
+            insert_query = insert_query.replace(
+                "{order_by_clause}",
+                self.build_order_by_clause(),
+            )
 
         # Step 4
-        columns = ",\n\t".join(f'"{col}"' for col in self.data_columns)
+        select_expressions = self.get_select_expressions()
+        select_columns = ",\n\t".join(
+            f'{expression} AS "{col}"'
+            for col, expression in select_expressions.items()
+        )
+        insert_query = insert_query.replace("{select_columns}", select_columns)
+        insert_columns = list(select_expressions)
+        columns = ",\n\t".join(f'"{col}"' for col in insert_columns)
         insert_query = insert_query.replace("{columns}", columns)
 
         # Step 5
@@ -971,64 +3901,20 @@ class CopyLoader:
 
         # Step 6
         if self.update_operation is not None:
-            # Step 6.1
-            update_operations = []
-
-            # Step 6.2
-            if isinstance(self.update_operation, str):
-                # Step 6.2.1
-                data_column_set = set(self.data_columns)
-                conflict_target_set = set(self.conflict_target)
-                non_conflict_target = list(
-                    data_column_set.difference(conflict_target_set)
-                )
-                updater = getattr(field_updaters, self.update_operation)
-
-                # Step 6.2.2
-                for field in non_conflict_target:
-                    update_snippet = updater(field, model_table_name)
-                    update_operations.append(update_snippet)
-
-                # Step 6.2.3
-                update_operations = ",\n\t".join(update_operations)
-
-            # Step 6.3
-            elif isinstance(self.update_operation, Callable):
-                # Step 6.3.1
-                data_column_set = set(self.data_columns)
-                conflict_target_set = set(self.conflict_target)
-                non_conflict_target = list(
-                    data_column_set.difference(conflict_target_set)
-                )
-                updater = self.update_operation
-
-                # Step 6.3.2
-                for field in non_conflict_target:
-                    update_snippet = updater(field, model_table_name)
-                    update_operations.append(update_snippet)
-
-                # Step 6.3.3
-                update_operations = ",\n\t".join(update_operations)
-
-            # Step 6.4
-            else:
-                # Step 6.4.1
-                for field, operation in self.update_operation.items():
-                    if isinstance(operation, str):
-                        updater = getattr(field_updaters, operation)
-                    else:
-                        updater = operation
-
-                    update_snippet = updater(field, model_table_name)
-                    update_operations.append(update_snippet)
-
-                # Step 6.4.2
-                update_operations = ",\n\t".join(update_operations)
-
-            # Step 6.5
             insert_query = insert_query.replace(
                 "{update_operations}",
-                update_operations,
+                self.build_update_operations(insert_columns),
+            )
+            hash_condition = self.build_hash_condition()
+            if hash_condition is None:
+                update_condition = ""
+            elif self.operation == "update":
+                update_condition = f"AND {hash_condition}"
+            else:
+                update_condition = f"WHERE {hash_condition}"
+            insert_query = insert_query.replace(
+                "{update_condition}",
+                update_condition,
             )
 
         # Step 7
@@ -1039,20 +3925,329 @@ class CopyLoader:
             # Step 7.2
             for field in self.conflict_target:
                 old_field = f'"{model_table_name}"."{field}"'
-                new_field = f'"{self.temp_table_name}"."{field}"'
+                new_field = f'excluded."{field}"'
                 join_condition = f"""{old_field} = {new_field}"""
                 update_join_conditions.append(join_condition)
 
             # Step 7.3
-            update_join_conditions = "\n\t\t\tAND ".join(update_join_conditions)
+            update_join_conditions = "\n\tAND ".join(update_join_conditions)
             insert_query = insert_query.replace(
                 "{update_join_conditions}",
                 update_join_conditions,
             )
 
         # Step 8
+        if self.operation == "sync":
+            # Step 8.1
+            sync_join_conditions = [
+                f'"{model_table_name}"."{col}" = {select_expressions[col]}'
+                for col in self.conflict_target
+            ]
+            if where_condition is not None:
+                sync_join_conditions.append(f"({where_condition})")
+
+            # Step 8.2
+            sync_join_conditions = "\n\t\t\t\tAND ".join(sync_join_conditions)
+            insert_query = insert_query.replace(
+                "{sync_join_conditions}",
+                sync_join_conditions,
+            )
+            insert_query = insert_query.replace(
+                "{scope_condition}",
+                self.build_scope_condition(),
+            )
+
+        # Step 9
         return insert_query
 
+    def build_update_operations(self, insert_columns: List[str]) -> str:
+        """Build the assignments applied to existing rows by an update.
+
+        Columns filled with their defaults (see [self].fill_defaults) are only
+        updated if they are auto_now columns. The assignments use the field
+        updaters, so the new values must be readable as EXCLUDED."<column>"
+        and the existing ones as "<model table>"."<column>".
+
+        Args:
+            insert_columns (list[str]):
+                The columns of the model table set by the load.
+
+        Returns (str):
+            The comma-separated assignments of [self].update_operation.
+        """
+        # Step 1
+        model_table_name = self.model_table
+        updatable_columns = [
+            col
+            for col in insert_columns
+            if (col not in self.default_expressions)
+            or (col in self.model_metadata.auto_now_columns)
+        ]
+        update_operations = []
+
+        # Step 2
+        if isinstance(self.update_operation, str):
+            # Step 2.1
+            data_column_set = set(updatable_columns)
+            conflict_target_set = set(self.conflict_target)
+            non_conflict_target = list(
+                data_column_set.difference(conflict_target_set)
+            )
+            updater = getattr(field_updaters, self.update_operation)
+
+            # Step 2.2
+            for field in non_conflict_target:
+                update_snippet = updater(field, model_table_name)
+                update_operations.append(update_snippet)
+
+            # Step 2.3
+            update_operations = ",\n\t".join(update_operations)
+
+        # Step 3
+        elif isinstance(self.update_operation, Callable):
+            # Step 3.1
+            data_column_set = set(updatable_columns)
+            conflict_target_set = set(self.conflict_target)
+            non_conflict_target = list(
+                data_column_set.difference(conflict_target_set)
+            )
+            updater = self.update_operation
+
+            # Step 3.2
+            for field in non_conflict_target:
+                update_snippet = updater(field, model_table_name)
+                update_operations.append(update_snippet)
+
+            # Step 3.3
+            update_operations = ",\n\t".join(update_operations)
+
+        # Step 4
+        else:
+            # Step 4.1
+            for field, operation in self.update_operation.items():
+                if isinstance(operation, str):
+                    updater = getattr(field_updaters, operation)
+                else:
+                    updater = operation
+
+                update_snippet = updater(field, model_table_name)
+                update_operations.append(update_snippet)
+
+            # Step 4.2
+            for field in updatable_columns:
+                if (
+                    (field in self.default_expressions)
+                    or (field == self.hash_column)
+                ) and (field not in self.update_operation):
+                    update_snippet = field_updaters.replace(
+                        field,
+                        model_table_name,
+                    )
+                    update_operations.append(update_snippet)
+
+            # Step 4.3
+            update_operations = ",\n\t".join(update_operations)
+
+        # Step 5
+        return update_operations
+
+    def build_hash_condition(self) -> Optional[str]:
+        """Build the condition under which an existing row is updated.
+
+        Returns ([str]):
+            If [self].hash_column is provided, then a condition that is true
+            when the stored hash of a row differs from its new hash, otherwise
+            None.
+        """
+        # Step 1
+        if self.hash_column is None:
+            return None
+
+        # Step 2
+        return (
+            f'"{self.model_table}"."{self.hash_column}" '
+            f'IS DISTINCT FROM EXCLUDED."{self.hash_column}"'
+        )
+
+    def build_merge_query(self) -> str:
+        """Build the MERGE query used to apply temp table data to model table.
+
+        The staged rows are read by a subquery aliased as excluded, so the
+        field updaters and the hash condition are the same as for INSERT ...
+        ON CONFLICT. If deleting, then only the distinct keys are read, since
+        MERGE cannot affect a row twice, and if [self].batch_size is provided
+        they are limited to the row numbers between the {batch_start} and
+        {batch_end} placeholders (see [self].build_delete_query).
+
+        Returns (str):
+            The MERGE query used to apply the load to the model table.
+        """
+        # Step 1
+        merge_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            f"merge__{self.operation}.sql",
+        )
+        merge_query = Path(merge_query_path).read_text()
+
+        # Step 2
+        model_table_name = self.model_table
+        merge_query = merge_query.replace(
+            "{model_table_name}",
+            model_table_name,
+        )
+        merge_query = merge_query.replace(
+            "{from_clause}",
+            self.build_from_clause(),
+        )
+
+        # Step 3
+        select_expressions = self.get_select_expressions()
+        if self.operation == "delete":
+            select_expressions = {
+                col: select_expressions[col] for col in self.conflict_target
+            }
+        select_columns = ",\n\t".join(
+            f'{expression} AS "{col}"'
+            for col, expression in select_expressions.items()
+        )
+        merge_query = merge_query.replace("{select_columns}", select_columns)
+
+        # Step 4
+        where_conditions = []
+        where_condition = self.build_where_condition()
+        if where_condition is not None:
+            where_conditions.append(f"({where_condition})")
+        if self.batch_size is not None:
+            where_conditions.append(
+                f'"{self.temp_table_name}"."{definitions.ROW_NUMBER_COLUMN}" '
+                "BETWEEN {batch_start} AND {batch_end}"
+            )
+        where_clause = (
+            "WHERE\n\t" + "\n\tAND ".join(where_conditions)
+            if len(where_conditions) > 0
+            else ""
+        )
+        merge_query = merge_query.replace("{where_clause}", where_clause)
+        if self.order_by is not None:
+            merge_query = merge_query.replace(
+                "{order_by_clause}",
+                self.build_order_by_clause(),
+            )
+
+        # Step 5
+        merge_join_conditions = "\n\tAND ".join(
+            f'"{model_table_name}"."{col}" = excluded."{col}"'
+            for col in self.conflict_target
+        )
+        merge_query = merge_query.replace(
+            "{merge_join_conditions}",
+            merge_join_conditions,
+        )
+
+        # Step 6
+        insert_columns = list(select_expressions)
+        columns = ",\n\t".join(f'"{col}"' for col in insert_columns)
+        merge_query = merge_query.replace("{columns}", columns)
+        insert_values = ",\n\t".join(
+            f'excluded."{col}"' for col in insert_columns
+        )
+        merge_query = merge_query.replace("{insert_values}", insert_values)
+
+        # Step 7
+        if self.update_operation is not None:
+            merge_query = merge_query.replace(
+                "{update_operations}",
+                self.build_update_operations(insert_columns),
+            )
+            hash_condition = self.build_hash_condition()
+            matched_condition = (
+                f"AND {hash_condition} " if hash_condition is not None else ""
+            )
+            merge_query = merge_query.replace(
+                "{matched_condition}",
+                matched_condition,
+            )
+
+        # Step 8
+        return merge_query
+
+    def build_scope_condition(self) -> str:
+        """Build the condition selecting the rows of the model table in scope.
+
+        Returns (str):
+            A condition on the model table that is true for the rows of
+            [self].scope (always true if the scope is not filtered, and always
+            false if it can match no rows, e.g. QuerySet.none()).
+        """
+        # Step 1
+        if (self.scope is None) or (not self.scope.query.where):
+            return "TRUE"
+
+        # Step 2
+        pk_query = self.scope.order_by().values_list("pk", flat=True)
+        compiler = pk_query.query.get_compiler(using=self.db_alias)
+        try:
+            select_query, params = compiler.as_sql()
+        except EmptyResultSet:
+            return "FALSE"
+        select_query = sql.interpolate(self.db_connection, select_query, params)
+
+        # Step 3
+        pk_column = self.model_metadata.pk_column
+        return f'"{self.model_table}"."{pk_column}" IN ({select_query})'
+
+    def build_delete_query(self) -> str:
+        """Build the query used to delete the model rows matching staged rows.
+
+        If [self].batch_size is provided, then the query only reads the staged
+        rows whose row numbers lie between the {batch_start} and {batch_end}
+        placeholders, which are filled in for each batch (see [self].insert).
+
+        Returns (str):
+            The query used to delete rows from the model table.
+        """
+        # Step 1
+        delete_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            "delete.sql",
+        )
+        delete_query = Path(delete_query_path).read_text()
+
+        # Step 2
+        delete_query = delete_query.replace(
+            "{model_table_name}",
+            self.model_table,
+        )
+        delete_query = delete_query.replace(
+            "{from_clause}",
+            self.build_from_clause(),
+        )
+
+        # Step 3
+        select_expressions = self.get_select_expressions()
+        delete_conditions = [
+            f'"{self.model_table}"."{col}" = {select_expressions[col]}'
+            for col in self.conflict_target
+        ]
+        where_condition = self.build_where_condition()
+        if where_condition is not None:
+            delete_conditions.append(f"({where_condition})")
+        if self.batch_size is not None:
+            delete_conditions.append(
+                f'"{self.temp_table_name}"."{definitions.ROW_NUMBER_COLUMN}" '
+                "BETWEEN {batch_start} AND {batch_end}"
+            )
+
+        # Step 4
+        delete_conditions = "\n\tAND ".join(delete_conditions)
+        delete_query = delete_query.replace(
+            "{delete_conditions}",
+            delete_conditions,
+        )
+
+        # Step 5
+        return delete_query
+
     def post_insert(self, cursor) -> None:
         """Post-insert hook.
 
@@ -1075,8 +4270,14 @@ class CopyLoader:
 
         Steps:
             1.  Run the pre-insert hook.
-            2.  Build the query used to perform the update.
-            3.  Execute the query and perform the update and get row count.
+            2.  Build the query used to perform the update. If
+                [self].order_by is not provided, then order the staged rows
+                only if another transaction is writing to the model table.
+            3.  Execute the query and perform the update and get row count. If
+                syncing, then read the numbers of rows inserted, updated, and
+                deleted instead. If deleting in batches, then index the row
+                numbers of the temp table and execute the query once per
+                batch of row numbers.
             4.  Run the post-insert hook.
             5.  Return.
 
@@ -1091,11 +4292,41 @@ class CopyLoader:
         self.pre_insert(cursor)
 
         # Step 2
-        insert_query = self.build_insert_query()
+        insert_query = self.compiled_queries.get("insert")
+        if insert_query is None:
+            insert_query = self.build_insert_query()
+        if self.order_by is None:
+            order_by_clause = ""
+            if (len(self.get_order_by_columns()) > 0) and (
+                self.detect_concurrent_writers(cursor)
+            ):
+                order_by_clause = self.build_order_by_clause()
+            insert_query = insert_query.replace(
+                "{order_by_clause}",
+                order_by_clause,
+            )
 
         # Step 3
-        cursor.execute(insert_query)
-        n_rows_affected = cursor.rowcount
+        if self.operation == "sync":
+            cursor.execute(insert_query)
+            n_inserted, n_updated, n_deleted = cursor.fetchone()
+            self.stats["rows_inserted"] = n_inserted
+            self.stats["rows_updated"] = n_updated
+            self.stats["rows_deleted"] = n_deleted
+            n_rows_affected = n_inserted + n_updated + n_deleted
+        elif self.batch_size is None:
+            cursor.execute(insert_query)
+            n_rows_affected = cursor.rowcount
+        else:
+            n_rows_affected = 0
+            n_row_numbers = self.count_row_numbers(cursor)
+            self.index_row_numbers(cursor)
+            for start in range(1, n_row_numbers + 1, self.batch_size):
+                end = min(start + self.batch_size - 1, n_row_numbers)
+                batch_query = insert_query.replace("{batch_start}", str(start))
+                batch_query = batch_query.replace("{batch_end}", str(end))
+                cursor.execute(batch_query)
+                n_rows_affected += cursor.rowcount
 
         # Step 4
         self.post_insert(cursor)
@@ -1103,6 +4334,217 @@ class CopyLoader:
         # Step 5
         return n_rows_affected
 
+    def get_secondary_indexes(self, cursor) -> List[Tuple[str, str]]:
+        """Get the indexes of the model table that bulk mode suspends.
+
+        Unique indexes and indexes backing a constraint are kept, since the
+        insert relies on them (e.g. as the arbiter of ON CONFLICT).
+
+        Args:
+            cursor:
+                Cursor.
+
+        Returns (list[tuple[str, str]]):
+            The (name, definition) of each non-unique index that backs no
+            constraint, where the name is quoted and schema-qualified as needed
+            and the definition is its CREATE INDEX statement.
+        """
+        # Step 1
+        index_query_path = os.path.join(
+            definitions.SQL_TEMPLATE_DIR,
+            "bulk__indexes.sql",
+        )
+        index_query = Path(index_query_path).read_text()
+        index_query = index_query.replace(
+            "{model_table_name}",
+            self.model_table,
+        )
+
+        # Step 2
+        cursor.execute(index_query)
+        return [(name, definition) for name, definition in cursor.fetchall()]
+
+    def disable_user_triggers(self, cursor) -> Optional[str]:
+        """Set session_replication_role to "replica", if permitted.
+
+        The role is set in a savepoint (or its own transaction), so a refusal
+        does not abort the caller's transaction.
+
+        Args:
+            cursor:
+                Cursor.
+
+        Returns ([str]):
+            The previous role, or None if setting the role was not permitted.
+        """
+        # Step 1
+        cursor.execute("SELECT current_setting('session_replication_role')")
+        previous_role = cursor.fetchone()[0]
+
+        # Step 2
+        try:
+            with transaction.atomic(using=self.db_alias):
+                cursor.execute(
+                    "SELECT set_config('session_replication_role', "
+                    "'replica', false)"
+                )
+        except DatabaseError:
+            return None
+
+        # Step 3
+        return previous_role
+
+    def rebuild_indexes(
+        self,
+        cursor,
+        indexes: List[Tuple[str, str]],
+    ) -> List[Exception]:
+        """Recreate [indexes] from their definitions.
+
+        Outside a transaction, the indexes are built concurrently, each on its
+        own connection to [self].db_alias (which is closed afterwards), so the
+        server can build several at once. Each build is independent, so one
+        failing does not stop the others, and each index is removed from the
+        record of suspended indexes (see core.bulk) once it is built. Inside a
+        transaction, other connections could not see the loaded rows and would
+        wait on its locks, so the indexes are built one after another with
+        [cursor], and a failure is raised (the transaction's rollback then
+        restores every dropped index).
+
+        Args:
+            cursor:
+                Cursor.
+            indexes (list[tuple[str, str]]):
+                The (name, definition) of each index to build (see
+                [self].get_secondary_indexes).
+
+        Returns (list[Exception]):
+            The error of each index that could not be built outside a
+            transaction; such indexes stay recorded, so that
+            core.bulk.restore_suspended_indexes can rebuild them.
+        """
+        # Step 1
+        if len(indexes) == 0:
+            return []
+        elif self.db_connection.in_atomic_block:
+            for _, definition in indexes:
+                cursor.execute(definition)
+            return []
+
+        # Step 2
+        def build(name: str, definition: str) -> None:
+            connection = connections[self.db_alias]
+            try:
+                with connection.cursor() as build_cursor:
+                    build_cursor.execute(definition)
+                    bulk.forget_suspended_index(build_cursor, name)
+            finally:
+                connection.close()
+
+        # Step 3
+        max_workers = min(len(indexes), definitions.INDEX_REBUILD_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(build, name, definition)
+                for name, definition in indexes
+            ]
+
+        # Step 4
+        errors = [future.exception() for future in futures]
+        return [error for error in errors if error is not None]
+
+    def restore_replication_role(self, cursor, previous_role: str) -> None:
+        """Set session_replication_role back to its value before the insert.
+
+        Args:
+            cursor:
+                Cursor.
+            previous_role (str):
+                The role returned by [self].disable_user_triggers.
+
+        Returns:
+            None
+        """
+        # Step 1
+        cursor.execute(
+            "SELECT set_config('session_replication_role', %s, false)",
+            [previous_role],
+        )
+
+    def bulk_insert(self, cursor) -> int:
+        """Perform the insert with secondary indexes (and triggers) suspended.
+
+        Steps:
+            1.  Record the secondary indexes of the model table. Outside a
+                transaction, their definitions are also saved in the database
+                (see core.bulk.record_suspended_indexes) before any is dropped,
+                so that they can be restored if the process dies mid-load.
+            2.  Disable user triggers, if requested and permitted.
+            3.  Drop the secondary indexes and perform the insert.
+            4.  If the insert fails outside a transaction, then restore the
+                previous replication role and rebuild the dropped indexes
+                without letting an error in doing so hide that of the insert,
+                which is raised (inside a transaction, its rollback restores
+                both). If the role cannot be restored, then the connection is
+                closed, so that it is not reused with triggers disabled, and
+                the errors of indexes that could not be rebuilt are attached
+                to the raised error as its index_rebuild_errors.
+            5.  Otherwise, restore the previous replication role and rebuild
+                the dropped indexes, raising the first error of an index that
+                could not be rebuilt.
+            6.  Return.
+
+        Args:
+            cursor:
+                Cursor.
+
+        Returns (int):
+            The number of rows affected by the insert.
+        """
+        # Step 1
+        indexes = self.get_secondary_indexes(cursor)
+        in_transaction = self.db_connection.in_atomic_block
+        if (len(indexes) > 0) and (not in_transaction):
+            bulk.record_suspended_indexes(cursor, self.model_table, indexes)
+
+        # Step 2
+        previous_role = None
+        if self.disable_triggers:
+            previous_role = self.disable_user_triggers(cursor)
+        self.stats["triggers_disabled"] = int(previous_role is not None)
+
+        # Step 3
+        dropped = []
+        try:
+            for name, definition in indexes:
+                cursor.execute(f"DROP INDEX {name}")
+                dropped.append((name, definition))
+            n_rows_affected = self.insert(cursor=cursor)
+
+        # Step 4
+        except Exception as error:
+            if not in_transaction:
+                if previous_role is not None:
+                    try:
+                        self.restore_replication_role(cursor, previous_role)
+                    except DatabaseError:
+                        self.db_connection.close()
+                error.index_rebuild_errors = self.rebuild_indexes(
+                    cursor, dropped
+                )
+            raise
+
+        # Step 5
+        if previous_role is not None:
+            self.restore_replication_role(cursor, previous_role)
+        errors = self.rebuild_indexes(cursor, dropped)
+        self.stats["indexes_rebuilt"] = len(dropped) - len(errors)
+        if len(errors) > 0:
+            raise errors[0]
+
+        # Step 6
+        return n_rows_affected
+
     def pre_drop(self, cursor) -> None:
         """Pre-drop hook.
 
@@ -1126,7 +4568,9 @@ class CopyLoader:
         Steps:
             1.  Use template to build the drop query.
             2.  Dynamically populate the temp table name.
-            3.  Return.
+            3.  If client-side defaults are generated, then also drop the
+                defaults table.
+            4.  Return.
 
         Returns (str):
             The query used to drop the temp table from the database.
@@ -1136,15 +4580,22 @@ class CopyLoader:
             definitions.SQL_TEMPLATE_DIR,
             "drop.sql",
         )
-        drop_query = Path(drop_query_path).read_text()
+        drop_template = Path(drop_query_path).read_text()
 
         # Step 2
-        drop_query = drop_query.replace(
+        drop_query = drop_template.replace(
             "{temp_table_name}",
             self.temp_table_name,
         )
 
         # Step 3
+        if len(self.client_default_columns) > 0:
+            drop_query += drop_template.replace(
+                "{temp_table_name}",
+                self.defaults_table_name,
+            )
+
+        # Step 4
         return drop_query
 
     def post_drop(self, cursor) -> None:
@@ -1184,7 +4635,9 @@ class CopyLoader:
         self.pre_drop(cursor)
 
         # Step 2
-        drop_query = self.build_drop_query()
+        drop_query = self.compiled_queries.get("drop")
+        if drop_query is None:
+            drop_query = self.build_drop_query()
 
         # Step 3
         cursor.execute(drop_query)
@@ -1195,15 +4648,111 @@ class CopyLoader:
     def load(self) -> int:
         """Perform the full update pipeline.
 
+        Counts from the load are stored in [self].stats: "rows_copied" (rows
+        staged from the data), "rows_rejected" (rows ignored or rejected; see
+        [self].on_error), "rows_filtered" (rows not meeting [self].where), and
+        "rows_affected"; a sync also stores "rows_inserted", "rows_updated",
+        and "rows_deleted", a load with [self].advisory_lock stores
+        "lock_wait_seconds", a load in [self].bulk_mode stores
+        "indexes_rebuilt" and "triggers_disabled", and a load whose
+        [self].session_settings include temp_buffers stores
+        "temp_buffers_applied".
+
+        If [self].session_settings is provided, then the pipeline runs in a
+        transaction with the settings applied (see
+        [self].apply_session_settings).
+
+        If the load fails outside a transaction, then the staging table is
+        dropped (with a new cursor, as the connection may have been closed; see
+        [self].bulk_insert) before the error is raised; inside a transaction,
+        it is removed when the transaction is rolled back.
+
         Returns (int):
             The number of rows affected by the update.
         """
         # Step 1
-        with self.db_connection.cursor() as cursor:
+        if (self.parallel_copies > 1) and self.db_connection.in_atomic_block:
+            raise NotSupportedError(
+                "Parallel copies cannot be used inside a transaction."
+            )
+        self.set_shared_staging(
+            (self.parallel_copies > 1) and (len(self.data_sources) > 1)
+        )
+        self.stats = {
+            "rows_copied": 0,
+            "rows_rejected": 0,
+            "rows_filtered": 0,
+            "rows_affected": 0,
+        }
+
+        # Step 2
+        with contextlib.ExitStack() as stack:
+            if self.session_settings is not None:
+                stack.enter_context(transaction.atomic(using=self.db_alias))
+            cursor = stack.enter_context(self.db_connection.cursor())
+            if self.session_settings is not None:
+                self.apply_session_settings(cursor=cursor)
             self.create(cursor=cursor)
-            self.copy(cursor=cursor)
-            n_rows_affected = self.insert(cursor=cursor)
+            try:
+                self.copy(cursor=cursor)
+                n_rows_affected = self.merge(cursor=cursor)
+            except Exception:
+                if not self.db_connection.in_atomic_block:
+                    with contextlib.suppress(DatabaseError):
+                        with self.db_connection.cursor() as drop_cursor:
+                            self.drop(cursor=drop_cursor)
+                raise
             self.drop(cursor=cursor)
 
+        # Step 3
+        return n_rows_affected
+
+    def merge(self, cursor) -> int:
+        """Merge the populated temp table into [self].model's table.
+
+        Steps:
+            1.  Remove rows that cannot be loaded (see [self].on_error) or,
+                when aborting on errors, confirm that every natural key can be
+                resolved (see [self].resolve).
+            2.  Generate client-side defaults, if any.
+            3.  Count the rows that do not meet [self].where, if provided.
+            4.  Perform the insert (in bulk mode, if [self].bulk_mode),
+                holding the advisory locks of [self].advisory_lock, if
+                provided.
+            5.  Return.
+
+        Args:
+            cursor:
+                Cursor.
+
+        Returns (int):
+            The number of rows affected by the insert.
+        """
+        # Step 1
+        if self.on_error != "abort":
+            self.reject(cursor=cursor)
+        elif len(self.resolutions) > 0:
+            self.check_resolutions(cursor=cursor)
+
         # Step 2
+        if len(self.client_default_columns) > 0:
+            self.generate_defaults(cursor=cursor)
+
+        # Step 3
+        if self.where is not None:
+            self.stats["rows_filtered"] = self.count_filtered_rows(cursor)
+
+        # Step 4
+        insert = self.bulk_insert if self.bulk_mode else self.insert
+        if self.advisory_lock is None:
+            n_rows_affected = insert(cursor=cursor)
+        else:
+            buckets = self.acquire_advisory_locks(cursor=cursor)
+            try:
+                n_rows_affected = insert(cursor=cursor)
+            finally:
+                self.release_advisory_locks(cursor=cursor, buckets=buckets)
+        self.stats["rows_affected"] = n_rows_affected
+
+        # Step 5
         return n_rows_affected
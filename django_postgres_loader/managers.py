@@ -2,21 +2,95 @@
 
 # standard library imports
 import io
-from typing import Callable, Dict, List, Optional, Union
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 # third-party imports
-from django.db import models
+from django.db import connections, models
 
 # local imports
 from . import CopyLoader
+from .core import definitions, registry, sql, streams
+from .dump import CopyDumper
 
 
 class CopyLoadQuerySet(models.QuerySet):
-    """Custom QuerySet supporting COPY-based load."""
+    """Custom QuerySet supporting COPY-based load and export."""
+
+    def dump(
+        self,
+        target: Optional[Union[str, BinaryIO]] = None,
+        data_format: str = "csv",
+        compression: Optional[str] = None,
+        header: bool = True,
+        delimiter: Optional[str] = None,
+        null_string: Optional[str] = None,
+        quote_character: Optional[str] = None,
+        encoding: Optional[str] = None,
+    ) -> Union[int, Iterator[bytes]]:
+        """Export the QuerySet's rows with COPY ... TO STDOUT.
+
+        The QuerySet's SQL is compiled and run inside COPY on the server, and
+        the output is streamed to [target], so memory use stays flat and no
+        Python objects are built per row.
+
+        Args:
+            target ([str|BinaryIO]):
+                If a string, then the path of the file to write. If a file-like
+                object, then a writable binary stream. If not provided, then an
+                iterator of byte chunks is returned.
+            data_format (str):
+                The output format: "csv" or "binary".
+            compression ([str]):
+                If provided, then the output is compressed while it is streamed
+                ("gzip", "bz2", or "xz").
+            header (bool):
+                Whether to write a header row (CSV only).
+            delimiter ([str]):
+                The character used to separate columns (CSV only).
+            null_string ([str]):
+                The string that represents a null value (CSV only).
+            quote_character ([str]):
+                The quoting character (CSV only).
+            encoding ([str]):
+                The encoding of the output.
+
+        Returns (int|Iterator[bytes]):
+            The number of rows exported, or an iterator of byte chunks if
+            [target] is not provided.
+        """
+        # Step 1
+        dumper = CopyDumper(
+            queryset=self,
+            data_format=data_format,
+            compression=compression,
+            header=header,
+            delimiter=delimiter,
+            null_string=null_string,
+            quote_character=quote_character,
+            encoding=encoding,
+        )
+
+        # Step 2
+        return dumper.dump(target)
 
     def load(
         self,
-        data: Union[io.StringIO, str],
+        data: Union[
+            io.StringIO,
+            io.BytesIO,
+            BinaryIO,
+            str,
+            List[Union[io.StringIO, io.BytesIO, BinaryIO, str]],
+        ],
         operation: str = "append",
         truncate: Union[bool, models.QuerySet] = False,
         conflict_target: Optional[List[str]] = None,
@@ -31,6 +105,7 @@ class CopyLoadQuerySet(models.QuerySet):
         force_null: Optional[List[str]] = None,
         encoding: Optional[str] = None,
         temp_table_name: Optional[str] = None,
+        **options,
     ) -> int:
         """Load data into database via manager.
 
@@ -42,12 +117,18 @@ class CopyLoadQuerySet(models.QuerySet):
             4.  Return.
 
         Args:
-            data (StringIO|str):
-                The data to load. If a StringIO object, then must be
-                CSV-formatted data. If a string, then must be a path to an
-                existing CSV file.
+            data (StringIO|BytesIO|BinaryIO|str|list):
+                The data to load. If a file-like object (text or binary), then
+                must be CSV-formatted data. If a string, then must be a path to
+                an existing CSV file or a glob pattern. If a list, then each
+                element must be a file-like object or a path; all sources must
+                share a header and are merged into the model once. Binary data
+                is passed to COPY without being decoded.
             operation (str):
-                The type of load to perform.
+                The type of load to perform. If "sync", then the rows of this
+                QuerySet are made to match the data: the data is upserted and
+                rows of the QuerySet missing from it are deleted (see
+                CopyLoader).
             truncate ([bool|QuerySet]):
                 If provided as a boolean, then a flag indicating whether data
                 should be deleted from the model before performing the load. If
@@ -102,6 +183,11 @@ class CopyLoadQuerySet(models.QuerySet):
                 The name to give the temporary table storing [data] before it
                 is loaded into [model]'s database table. If not provided, then
                 a name will be randomly generated.
+            **options:
+                Any other keyword arguments of CopyLoader (e.g. compression,
+                on_error, or where), which are passed to it unchanged. If
+                [operation] is "sync", then the QuerySet is the scope of the
+                load.
 
         Returns (int):
             The number of rows affected by the load pipeline.
@@ -133,6 +219,9 @@ class CopyLoadQuerySet(models.QuerySet):
             force_null=force_null,
             encoding=encoding,
             temp_table_name=temp_table_name,
+            using=self._db,
+            scope=self if operation == "sync" else None,
+            **options,
         )
 
         # Step 3
@@ -141,5 +230,150 @@ class CopyLoadQuerySet(models.QuerySet):
         # Step 4
         return n_rows_affected
 
+    def transfer_to(
+        self,
+        using: str,
+        operation: str = "append",
+        conflict_target: Optional[List[str]] = None,
+        update_operation: Optional[
+            Union[str, Callable, Dict[str, Optional[Union[str, Callable]]]]
+        ] = None,
+        field_mapping: Optional[Dict[str, str]] = None,
+        model: Optional[Type[models.Model]] = None,
+        data_format: str = "auto",
+        temp_table_name: Optional[str] = None,
+        **options,
+    ) -> int:
+        """Copy the QuerySet's rows into another database.
+
+        The rows are exported with COPY (<query>) TO STDOUT on the QuerySet's
+        database and piped, through a bounded in-memory buffer, into the staging
+        COPY of a CopyLoader on the destination database, which then merges them
+        using [operation]. No intermediate file or full in-memory copy of the
+        data is made.
+
+        Steps:
+            1.  Resolve the source and destination databases and models.
+            2.  Choose the transfer format: binary if every column's type (as
+                formatted by the server, including modifiers) is the same on
+                both sides, otherwise CSV. CSV is written and read with the
+                explicit NULL marker and encoding of
+                definitions.TRANSFER_CSV_OPTIONS, so that neither side relies
+                on server defaults (COPY's default NULL, the empty string,
+                would turn empty strings into NULLs).
+            3.  Build a dumper selecting the model's concrete columns, and the
+                loader (which validates the load options) before any data is
+                exported.
+            4.  Load the output of the export (see CopyDumper.iterate, which
+                runs it on a background thread sharing the source connection).
+                If the load fails or stops reading early, then closing the
+                export stops its COPY before the source connection is handed
+                back.
+            5.  Return.
+
+        Args:
+            using (str):
+                The alias of the destination database. Must differ from the
+                QuerySet's database.
+            operation (str):
+                The type of load to perform on the destination. See CopyLoader
+                for permissible values.
+            conflict_target ([list[str]]):
+                The conflict target for the load. See CopyLoader.
+            update_operation ([str|Callable|dict[str, [str|Callable]]):
+                The update operation for the load. See CopyLoader.
+            field_mapping ([dict]):
+                The mapping of the QuerySet model's columns (keys) to columns of
+                the destination model (values). See CopyLoader.
+            model ([models.Model]):
+                The destination model. If not provided, then the QuerySet's
+                model is used.
+            data_format (str):
+                The transfer format: "binary", "csv", or "auto" (the default),
+                which uses binary if the column types match.
+            temp_table_name ([str]):
+                The name of the staging table on the destination database.
+            **options:
+                Other CopyLoader arguments for the load (e.g. where, on_error,
+                or engine). Arguments describing the data (e.g. data_format,
+                columns, or compression) are set by the transfer.
+
+        Returns (int):
+            The number of rows affected on the destination database.
+        """
+        # Step 1
+        source_connection = connections[self.db]
+        destination_connection = connections[using]
+        if using == self.db:
+            raise ValueError(
+                "Destination database must differ from the QuerySet's database."
+            )
+        destination_model = model if model is not None else self.model
+        source_metadata = registry.get_model_metadata(
+            self.model,
+            source_connection,
+        )
+        columns = list(source_metadata.columns)
+        mapping = field_mapping if field_mapping is not None else dict()
+
+        # Step 2
+        if data_format == "auto":
+            source_types = sql.get_column_types(
+                source_connection,
+                self.model._meta.db_table,
+            )
+            destination_types = sql.get_column_types(
+                destination_connection,
+                destination_model._meta.db_table,
+            )
+            types_match = all(
+                source_types.get(col)
+                == destination_types.get(mapping.get(col, col))
+                for col in columns
+            )
+            data_format = "binary" if types_match else "csv"
+        csv_options = (
+            dict(definitions.TRANSFER_CSV_OPTIONS)
+            if data_format == "csv"
+            else dict()
+        )
+
+        # Step 3
+        queryset = self.values(
+            *[source_metadata.column_to_attname[col] for col in columns]
+        )
+        dumper = CopyDumper(
+            queryset=queryset,
+            data_format=data_format,
+            header=False,
+            **csv_options,
+        )
+        loader = CopyLoader(
+            model=destination_model,
+            data=io.BytesIO(),
+            operation=operation,
+            conflict_target=conflict_target,
+            update_operation=update_operation,
+            field_mapping=field_mapping,
+            temp_table_name=temp_table_name,
+            compression=None,
+            using=using,
+            data_format=data_format,
+            columns=columns,
+            **csv_options,
+            **options,
+        )
+
+        # Step 4
+        chunks = dumper.iterate()
+        try:
+            loader.set_data(streams.ChunkReader(chunks))
+            n_rows_affected = loader.load()
+        finally:
+            chunks.close()
+
+        # Step 5
+        return n_rows_affected
+
 
 CopyLoadManager = models.Manager.from_queryset(CopyLoadQuerySet)
@@ -0,0 +1,139 @@
+"""Reusable, pre-compiled load configurations."""
+
+# standard library imports
+import csv
+import io
+from typing import BinaryIO, List, Type, Union
+
+# third-party imports
+from django.db import models
+
+# local imports
+from .load import CopyLoader
+
+
+class LoadSpec:
+    """Validated, compiled load configuration that can be applied repeatedly.
+
+    A CopyLoader validates its configuration and renders its queries every time
+    it is constructed. A LoadSpec does this once, for a fixed set of data
+    columns, and can then load any number of data sources with the same header:
+
+        spec = LoadSpec(
+            model=MyModel,
+            columns=["id", "value"],
+            operation="upsert",
+            conflict_target=["id"],
+            update_operation="replace",
+        )
+        for batch in batches:
+            spec.load(batch)
+
+    The only per-call work before the COPY is reading the header row of the
+    data and checking it against the compiled column list. Unless a temp table
+    name is given, each load stages its data in a freshly-named table. A
+    LoadSpec is not safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        model: Type[models.Model],
+        columns: List[str],
+        operation: str,
+        **options,
+    ):
+        """Validate and compile a load configuration.
+
+        Steps:
+            1.  Validate [columns].
+            2.  Build a header-only CSV document from [columns].
+            3.  Create (and thereby validate) a CopyLoader using the header-only
+                document.
+            4.  Render all of the loader's queries.
+
+        Args:
+            model (models.Model):
+                The model into which data will be loaded.
+            columns (list[str]):
+                The columns of the header row of every data source that will be
+                loaded with this spec, in order.
+            operation (str):
+                The type of load to perform.
+            **options:
+                Any other keyword arguments of CopyLoader except [data], which
+                are passed to it unchanged (and validated by it).
+        """
+        # Step 1
+        if (not isinstance(columns, list)) or (len(columns) == 0):
+            raise TypeError("Columns must be a non-empty list of strings.")
+        for column in columns:
+            if not isinstance(column, str):
+                raise TypeError("Columns must be a non-empty list of strings.")
+        self.columns = list(columns)
+
+        # Step 2
+        header = io.StringIO()
+        writer = csv.writer(
+            header,
+            delimiter=options.get("delimiter") or ",",
+        )
+        writer.writerow(self.columns)
+        header.seek(0)
+
+        # Step 3
+        self.loader = CopyLoader(
+            model=model,
+            data=header,
+            operation=operation,
+            **options,
+        )
+        self.renew_temp_table_name = options.get("temp_table_name") is None
+
+        # Step 4
+        self.loader.compile()
+
+    def load(
+        self,
+        data: Union[
+            io.StringIO,
+            io.BytesIO,
+            BinaryIO,
+            str,
+            List[Union[io.StringIO, io.BytesIO, BinaryIO, str]],
+        ],
+    ) -> int:
+        """Load [data] using the compiled configuration.
+
+        Steps:
+            1.  Attach [data] to the loader and, unless a temp table name was
+                given, rename the loader's staging tables.
+            2.  Confirm that the header row of each source in [data] matches the
+                compiled column list.
+            3.  Perform the load.
+
+        Args:
+            data (StringIO|BytesIO|BinaryIO|str|list):
+                The data to load. If a file-like object, then must be
+                CSV-formatted data. If a string, then must be a path to an
+                existing CSV file or a glob pattern. If a list, then each
+                element must be a file-like object or a path.
+
+        Returns (int):
+            The number of rows affected by the load pipeline.
+        """
+        # Step 1
+        self.loader.set_data(data)
+        if self.renew_temp_table_name:
+            self.loader.rename_temp_table()
+
+        # Step 2
+        for index in range(len(self.loader.data_sources)):
+            data_columns = self.loader.get_data_columns(index)
+            if data_columns != self.columns:
+                raise ValueError(
+                    f"Data columns {', '.join(data_columns)} do not match the "
+                    f"columns of the load spec: {', '.join(self.columns)}."
+                )
+
+        # Step 3
+        return self.loader.load()
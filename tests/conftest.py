@@ -0,0 +1,187 @@
+"""Shared configuration and fixtures for the test suite.
+
+The tests run against a real PostgreSQL server, located with the standard libpq
+environment variables (PGHOST, PGPORT, PGUSER, PGPASSWORD, and PGDATABASE).
+Django creates a throwaway test database for each of the "default" and "other"
+aliases and destroys them afterwards. If Django or psycopg2 is not installed,
+then the tests are not collected; if the server cannot be reached, then they
+are skipped.
+"""
+
+# standard library imports
+import importlib.util
+import os
+
+# third-party imports
+import pytest
+
+if (importlib.util.find_spec("django") is None) or (
+    importlib.util.find_spec("psycopg2") is None
+):
+    collect_ignore_glob = ["test_*.py"]
+else:
+    # third-party imports
+    import django
+    from django.conf import settings
+
+    def database_settings(alias: str) -> dict:
+        """Build the settings of a test database alias.
+
+        Args:
+            alias (str):
+                The database alias.
+
+        Returns (dict):
+            The Django database settings.
+        """
+        return {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get("PGDATABASE", "postgres"),
+            "USER": os.environ.get("PGUSER", ""),
+            "PASSWORD": os.environ.get("PGPASSWORD", ""),
+            "HOST": os.environ.get("PGHOST", ""),
+            "PORT": os.environ.get("PGPORT", ""),
+            "TEST": {"NAME": f"test_dpl_{alias}"},
+        }
+
+    if not settings.configured:
+        settings.configure(
+            DATABASES={
+                "default": database_settings("default"),
+                "other": database_settings("other"),
+            },
+            INSTALLED_APPS=["tests"],
+            DEFAULT_AUTO_FIELD="django.db.models.AutoField",
+            USE_TZ=True,
+        )
+        django.setup()
+
+
+def pytest_configure(config):
+    """Register the markers of the test suite.
+
+    Returns:
+        None
+    """
+    config.addinivalue_line(
+        "markers",
+        "pg_version(at_least=None, below=None, reason=None): skip the test "
+        "unless the server's version (as in connection.pg_version) is in "
+        "range",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def databases():
+    """Create the test databases (and their tables) for the session.
+
+    Yields:
+        None
+    """
+    # third-party imports
+    from django.db import connections, OperationalError
+
+    try:
+        connections["default"].ensure_connection()
+    except OperationalError as error:
+        pytest.skip(f"PostgreSQL is not available: {error}")
+
+    old_names = []
+    for alias in ["default", "other"]:
+        connection = connections[alias]
+        old_names.append((connection, connection.settings_dict["NAME"]))
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+    yield
+
+    for connection, old_name in old_names:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+@pytest.fixture(autouse=True)
+def pg_version(request, databases):
+    """Skip tests whose pg_version markers exclude the server's version.
+
+    The version is read here rather than in the markers' arguments, so that
+    collecting the tests never connects to the server.
+
+    Returns:
+        None
+    """
+    # third-party imports
+    from django.db import connection
+
+    for marker in request.node.iter_markers("pg_version"):
+        at_least = marker.kwargs.get("at_least")
+        below = marker.kwargs.get("below")
+        if ((at_least is not None) and (connection.pg_version < at_least)) or (
+            (below is not None) and (connection.pg_version >= below)
+        ):
+            pytest.skip(marker.kwargs.get("reason", "Unsupported PostgreSQL."))
+
+
+@pytest.fixture(autouse=True)
+def clean_tables(databases):
+    """Empty every test table after each test.
+
+    Yields:
+        None
+    """
+    yield
+
+    # third-party imports
+    from django.apps import apps
+    from django.db import connections
+
+    tables = ", ".join(
+        f'"{model._meta.db_table}"'
+        for model in apps.get_app_config("tests").get_models()
+    )
+    for alias in ["default", "other"]:
+        connection = connections[alias]
+        connection.close()
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+
+
+@pytest.fixture
+def csv_data():
+    """Build in-memory CSV documents from rows.
+
+    Returns (Callable):
+        A function taking a header and rows and returning a StringIO.
+    """
+    # standard library imports
+    import csv
+    import io
+
+    def build(header, rows):
+        document = io.StringIO()
+        writer = csv.writer(document)
+        writer.writerow(header)
+        writer.writerows(rows)
+        document.seek(0)
+        return document
+
+    return build
+
+
+@pytest.fixture
+def books(csv_data):
+    """Load three books.
+
+    Returns:
+        None
+    """
+    # local imports
+    from django_postgres_loader import CopyLoader
+    from tests.models import Book
+
+    CopyLoader(
+        model=Book,
+        data=csv_data(
+            ["isbn", "title", "price"],
+            [["1", "a", "1.50"], ["2", "b", "2.00"], ["3", "c", "3.00"]],
+        ),
+        operation="append",
+    ).load()
@@ -0,0 +1,85 @@
+"""Models used by the test suite."""
+
+# standard library imports
+import itertools
+import uuid
+
+# third-party imports
+from django.db import models
+
+# local imports
+from django_postgres_loader import CopyLoadManager
+
+
+class FixedCharField(models.CharField):
+    """A CharField stored as char(n) rather than varchar(n)."""
+
+    def db_type(self, connection) -> str:
+        """Get the database column type.
+
+        Args:
+            connection:
+                The database connection.
+
+        Returns (str):
+            The column type.
+        """
+        return f"char({self.max_length})"
+
+
+_slugs = itertools.count()
+
+
+def next_slug() -> str:
+    """Generate a unique slug; a default with no server-side equivalent.
+
+    Returns (str):
+        The slug.
+    """
+    return f"slug-{next(_slugs)}"
+
+
+class Author(models.Model):
+    """An author, identified by name."""
+
+    name = models.CharField(max_length=100, unique=True)
+    country = models.CharField(max_length=2, null=True)
+    key = models.UUIDField(default=uuid.uuid4)
+    slug = models.CharField(max_length=20, default=next_slug)
+    active = models.BooleanField(default=True)
+
+    objects = CopyLoadManager()
+
+    class Meta:
+        app_label = "tests"
+
+
+class Book(models.Model):
+    """A book, identified by ISBN."""
+
+    isbn = models.CharField(max_length=13, unique=True)
+    title = models.CharField(max_length=200)
+    price = models.DecimalField(max_digits=8, decimal_places=2, null=True)
+    stock = models.IntegerField(default=0)
+    author = models.ForeignKey(Author, null=True, on_delete=models.CASCADE)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+    row_hash = models.CharField(max_length=32, null=True)
+
+    objects = CopyLoadManager()
+
+    class Meta:
+        app_label = "tests"
+
+
+class Reading(models.Model):
+    """A sensor reading; sensors are not unique, and are indexed."""
+
+    sensor = models.IntegerField(db_index=True)
+    value = models.FloatField()
+    code = FixedCharField(max_length=3, null=True)
+
+    objects = CopyLoadManager()
+
+    class Meta:
+        app_label = "tests"
@@ -0,0 +1,247 @@
+"""Tests of bulk mode, which suspends indexes and triggers during the insert."""
+
+# standard library imports
+import contextlib
+
+# third-party imports
+import pytest
+from django.db import connection, DatabaseError, transaction
+
+# local imports
+from django_postgres_loader import CopyLoader
+from django_postgres_loader.core import bulk, definitions
+from tests.models import Reading
+
+
+@pytest.fixture(autouse=True)
+def suspended_index_table():
+    """Drop the record of suspended indexes after each test.
+
+    Returns:
+        None
+    """
+    yield
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DROP TABLE IF EXISTS "{definitions.SUSPENDED_INDEX_TABLE}"'
+        )
+
+
+def reading_indexes() -> list:
+    """Get the secondary indexes of the Reading table.
+
+    Returns (list[str]):
+        The names of the indexes.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE (tablename = 'tests_reading') "
+            "AND (indexname <> 'tests_reading_pkey') "
+            "ORDER BY indexname"
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def replication_role() -> str:
+    """Get the session_replication_role of the default connection.
+
+    Returns (str):
+        The role.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT current_setting('session_replication_role')")
+        return cursor.fetchone()[0]
+
+
+def backend_pid() -> int:
+    """Get the server process of the default connection.
+
+    Returns (int):
+        The process ID.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_backend_pid()")
+        return cursor.fetchone()[0]
+
+
+def build_loader(csv_data, **options) -> CopyLoader:
+    """Build a bulk-mode loader of three readings.
+
+    Args:
+        csv_data (Callable):
+            The csv_data fixture.
+        **options:
+            Other options of the loader.
+
+    Returns (CopyLoader):
+        The loader.
+    """
+    return CopyLoader(
+        model=Reading,
+        data=csv_data(["sensor", "value"], [[1, 1.0], [2, 2.0], [3, 3.0]]),
+        operation="append",
+        bulk_mode=True,
+        **options,
+    )
+
+
+def fail_after_insert(loader, monkeypatch, error=None, clash=False) -> None:
+    """Make the insert of a loader fail, or the rebuild of its index.
+
+    Args:
+        loader (CopyLoader):
+            The loader.
+        monkeypatch:
+            The monkeypatch fixture.
+        error ([Exception]):
+            The error raised by the insert, if any.
+        clash (bool):
+            If True, then the insert creates a table with the name of the
+            index, so that the index cannot be rebuilt.
+
+    Returns:
+        None
+    """
+    insert = loader.insert
+    (index_name,) = reading_indexes()
+
+    def failing_insert(cursor):
+        n_rows_affected = insert(cursor=cursor)
+        if clash:
+            cursor.execute(f'CREATE TABLE "{index_name}" (id integer)')
+        if error is not None:
+            raise error
+        return n_rows_affected
+
+    monkeypatch.setattr(loader, "insert", failing_insert)
+
+
+@pytest.mark.parametrize("atomic", [False, True])
+def test_bulk_mode(csv_data, atomic):
+    indexes = reading_indexes()
+    assert len(indexes) == 1
+    loader = build_loader(csv_data)
+    with transaction.atomic() if atomic else contextlib.nullcontext():
+        assert loader.load() == 3
+    assert loader.stats["indexes_rebuilt"] == 1
+    assert loader.stats["triggers_disabled"] == 0
+    assert reading_indexes() == indexes
+    assert bulk.list_suspended_indexes() == []
+    assert Reading.objects.count() == 3
+
+
+def test_bulk_mode_restores_indexes_on_failure(csv_data, monkeypatch):
+    indexes = reading_indexes()
+    loader = build_loader(csv_data)
+    fail_after_insert(loader, monkeypatch, error=RuntimeError("insert"))
+    with pytest.raises(RuntimeError, match="insert"):
+        loader.load()
+    assert reading_indexes() == indexes
+    assert bulk.list_suspended_indexes() == []
+
+
+def test_bulk_mode_restores_indexes_on_rollback(csv_data, monkeypatch):
+    indexes = reading_indexes()
+    loader = build_loader(csv_data)
+    fail_after_insert(loader, monkeypatch, error=RuntimeError("insert"))
+    with pytest.raises(RuntimeError, match="insert"):
+        with transaction.atomic():
+            loader.load()
+    assert reading_indexes() == indexes
+    assert Reading.objects.count() == 0
+
+
+@pytest.mark.parametrize("error", [None, RuntimeError("insert")])
+def test_bulk_mode_records_unbuilt_indexes(csv_data, monkeypatch, error):
+    (index_name,) = reading_indexes()
+    loader = build_loader(csv_data)
+    fail_after_insert(loader, monkeypatch, error=error, clash=True)
+    if error is None:
+        with pytest.raises(DatabaseError, match="already exists"):
+            loader.load()
+        assert loader.stats["indexes_rebuilt"] == 0
+    else:
+        with pytest.raises(RuntimeError, match="insert") as excinfo:
+            loader.load()
+        (rebuild_error,) = excinfo.value.index_rebuild_errors
+        assert "already exists" in str(rebuild_error)
+    assert reading_indexes() == []
+    assert [name for name, _ in bulk.list_suspended_indexes()] == [index_name]
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE "{index_name}"')
+    assert bulk.restore_suspended_indexes() == [index_name]
+    assert reading_indexes() == [index_name]
+    assert bulk.list_suspended_indexes() == []
+
+
+def test_restore_suspended_indexes_skips_existing():
+    assert bulk.restore_suspended_indexes() == []
+    (index_name,) = reading_indexes()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_get_indexdef(%s::regclass)", [f'"{index_name}"']
+        )
+        definition = cursor.fetchone()[0]
+        bulk.record_suspended_indexes(
+            cursor, "tests_reading", [(index_name, definition)]
+        )
+    assert bulk.restore_suspended_indexes() == []
+    assert bulk.list_suspended_indexes() == []
+
+
+@pytest.mark.parametrize("error", [None, RuntimeError("insert")])
+def test_bulk_mode_disables_triggers(csv_data, monkeypatch, error):
+    role = replication_role()
+    loader = build_loader(csv_data, disable_triggers=True)
+    roles = []
+    insert = loader.insert
+
+    def recording_insert(cursor):
+        roles.append(replication_role())
+        n_rows_affected = insert(cursor=cursor)
+        if error is not None:
+            raise error
+        return n_rows_affected
+
+    monkeypatch.setattr(loader, "insert", recording_insert)
+    if error is None:
+        loader.load()
+        assert loader.stats["triggers_disabled"] == 1
+    else:
+        with pytest.raises(RuntimeError):
+            loader.load()
+    assert roles == ["replica"]
+    assert replication_role() == role
+
+
+def test_failed_role_restore_closes_connection(csv_data, monkeypatch):
+    indexes = reading_indexes()
+    role = replication_role()
+    loader = build_loader(
+        csv_data, disable_triggers=True, advisory_lock="model"
+    )
+    fail_after_insert(loader, monkeypatch, error=RuntimeError("insert"))
+
+    def failing_restore(cursor, previous_role):
+        raise DatabaseError("restore")
+
+    monkeypatch.setattr(loader, "restore_replication_role", failing_restore)
+    pid = backend_pid()
+    with pytest.raises(RuntimeError, match="insert") as excinfo:
+        loader.load()
+    assert excinfo.value.index_rebuild_errors == []
+    assert backend_pid() != pid
+    assert replication_role() == role
+    assert reading_indexes() == indexes
+
+
+def test_disable_triggers_requires_bulk_mode(csv_data):
+    with pytest.raises(ValueError, match="bulk mode"):
+        CopyLoader(
+            model=Reading,
+            data=csv_data(["sensor", "value"], [[1, 1.0]]),
+            operation="append",
+            disable_triggers=True,
+        )
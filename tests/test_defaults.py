@@ -0,0 +1,119 @@
+"""Tests of server-side defaults and casts of staged text."""
+
+# standard library imports
+import datetime
+
+# third-party imports
+import pytest
+from django.db.models.functions import Upper
+from django.utils import timezone
+
+# local imports
+from django_postgres_loader import CopyLoader
+from django_postgres_loader.core import sql
+from tests.models import Author, Book, Reading
+
+
+def test_static_and_auto_now_defaults(csv_data):
+    before = timezone.now()
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(["isbn", "title"], [["1", "a"], ["2", "b"]]),
+        operation="append",
+    )
+    assert loader.load() == 2
+    assert set(loader.client_default_columns) == set()
+    for book in Book.objects.all():
+        assert book.stock == 0
+        assert book.created >= before
+        assert book.updated >= before
+
+
+def test_client_side_defaults(csv_data):
+    loader = CopyLoader(
+        model=Author,
+        data=csv_data(["name"], [["a"], ["b"], ["c"]]),
+        operation="append",
+    )
+    assert loader.client_default_columns == ["slug"]
+    assert loader.load() == 3
+    authors = list(Author.objects.values_list("name", "key", "slug", "active"))
+    assert len({key for _, key, _, _ in authors}) == 3
+    assert len({slug for _, _, slug, _ in authors}) == 3
+    assert all(slug.startswith("slug-") for _, _, slug, _ in authors)
+    assert all(active for _, _, _, active in authors)
+
+
+def test_auto_now_on_update(csv_data):
+    CopyLoader(
+        model=Book,
+        data=csv_data(["isbn", "title"], [["1", "a"]]),
+        operation="append",
+    ).load()
+    Book.objects.update(
+        created=timezone.now() - datetime.timedelta(days=1),
+        updated=timezone.now() - datetime.timedelta(days=1),
+    )
+    old = Book.objects.get()
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(["isbn", "title"], [["1", "b"]]),
+        operation="upsert",
+        conflict_target=["isbn"],
+        update_operation="replace",
+    )
+    assert loader.load() == 1
+    new = Book.objects.get()
+    assert new.title == "b"
+    assert new.created == old.created
+    assert new.updated > old.updated
+
+
+def test_fill_defaults_disabled(csv_data):
+    loader = CopyLoader(
+        model=Reading,
+        data=csv_data(["sensor", "value"], [[1, 1.0]]),
+        operation="append",
+        fill_defaults=False,
+    )
+    assert loader.default_expressions == {}
+    assert loader.load() == 1
+
+
+@pytest.mark.parametrize(
+    "cast_type, stripped",
+    [
+        ("varchar(20)", "varchar"),
+        ("character varying(20)", "character varying"),
+        ("char(3)", "bpchar"),
+        ("character(3)", "bpchar"),
+        ("numeric(8, 2)", "numeric(8, 2)"),
+        ("integer", "integer"),
+    ],
+)
+def test_strip_length(cast_type, stripped):
+    assert sql.strip_length(cast_type) == stripped
+
+
+def test_fixed_length_values_are_not_truncated(csv_data):
+    loader = CopyLoader(
+        model=Reading,
+        data=csv_data(["sensor", "value", "code"], [[1, 1.0, "abc"]]),
+        operation="append",
+        transforms={"code": Upper("code")},
+    )
+    assert loader.load() == 1
+    assert list(Reading.objects.values_list("code", flat=True)) == ["ABC"]
+
+
+def test_fixed_length_values_too_long_are_rejected(csv_data):
+    loader = CopyLoader(
+        model=Reading,
+        data=csv_data(
+            ["sensor", "value", "code"], [[1, 1.0, "abc"], [2, 2.0, "abcd"]]
+        ),
+        operation="append",
+        on_error="ignore",
+    )
+    assert loader.load() == 1
+    assert list(Reading.objects.values_list("sensor", "code")) == [(1, "abc")]
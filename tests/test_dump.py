@@ -0,0 +1,227 @@
+"""Tests of CopyDumper and the QuerySet export methods."""
+
+# standard library imports
+import contextlib
+import gzip
+import io
+
+# third-party imports
+import pytest
+from django.db import connection, connections, transaction
+from django.db.models import Q
+
+# local imports
+from django_postgres_loader import CopyDumper, CopyLoader
+from django_postgres_loader.core import streams
+from tests.models import Author, Reading
+
+
+def load_readings(n_rows: int) -> None:
+    """Load readings with sensors 0 to [n_rows] - 1.
+
+    Args:
+        n_rows (int):
+            The number of readings.
+
+    Returns:
+        None
+    """
+    data = io.StringIO(
+        "sensor,value\n" + "".join(f"{i},{i}.5\n" for i in range(n_rows))
+    )
+    CopyLoader(model=Reading, data=data, operation="append").load()
+
+
+def test_dump_to_stream():
+    load_readings(3)
+    target = io.BytesIO()
+    queryset = Reading.objects.filter(sensor__gte=1).order_by("sensor")
+    assert queryset.values_list("sensor", "value").dump(target) == 2
+    assert target.getvalue() == b"sensor,value\n1,1.5\n2,2.5\n"
+
+
+def test_dump_to_file(tmp_path):
+    load_readings(3)
+    path = tmp_path / "readings.csv.gz"
+    queryset = Reading.objects.order_by("sensor").values_list("sensor")
+    assert queryset.dump(str(path), compression="gzip", header=False) == 3
+    assert gzip.decompress(path.read_bytes()) == b"0\n1\n2\n"
+
+
+def test_dump_options():
+    load_readings(1)
+    target = io.BytesIO()
+    Reading.objects.values_list("sensor", "value", "code").dump(
+        target, delimiter="|", null_string="NULL"
+    )
+    assert target.getvalue() == b"sensor|value|code\n0|0.5|NULL\n"
+
+
+def test_dump_binary_round_trip():
+    load_readings(3)
+    target = io.BytesIO()
+    queryset = Reading.objects.values_list("sensor", "value")
+    assert queryset.dump(target, data_format="binary") == 3
+    assert target.getvalue().startswith(b"PGCOPY\n")
+
+
+def test_dump_iterator():
+    load_readings(1000)
+    chunks = Reading.objects.order_by("sensor").values_list("sensor").dump()
+    lines = b"".join(chunks).splitlines()
+    assert lines[0] == b"sensor"
+    assert lines[1:] == [str(i).encode() for i in range(1000)]
+
+
+def test_dump_rejects_invalid_format():
+    with pytest.raises(ValueError):
+        CopyDumper(queryset=Reading.objects.all(), data_format="json")
+
+
+@pytest.mark.parametrize("atomic", [False, True])
+def test_abandoned_iterator_leaves_connection_usable(atomic):
+    load_readings(200000)
+    with transaction.atomic() if atomic else contextlib.nullcontext():
+        chunks = Reading.objects.values_list("sensor", "value").dump()
+        assert next(chunks).startswith(b"sensor,value\n")
+        chunks.close()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            assert cursor.fetchone() == (1,)
+        assert Reading.objects.count() == 200000
+
+
+def test_abandoned_iterator_in_transaction_is_drained(monkeypatch):
+    load_readings(200000)
+    drained = []
+    close = streams.Pipe.close
+
+    def record_close(pipe):
+        drained.append(pipe._eof)
+        close(pipe)
+
+    monkeypatch.setattr(streams.Pipe, "close", record_close)
+    with transaction.atomic():
+        chunks = Reading.objects.values_list("sensor", "value").dump()
+        next(chunks)
+        chunks.close()
+        Reading.objects.filter(sensor=0).delete()
+    assert drained == [True]
+    assert Reading.objects.count() == 199999
+
+
+def test_transfer_to():
+    load_readings(1000)
+    n_rows_affected = Reading.objects.filter(sensor__lt=500).transfer_to(
+        "other"
+    )
+    assert n_rows_affected == 500
+    assert sorted(
+        Reading.objects.using("other").values_list("sensor", flat=True)
+    ) == list(range(500))
+
+
+@pytest.mark.parametrize("atomic", [False, True])
+def test_failed_transfer_stops_export(monkeypatch, atomic):
+    load_readings(200000)
+
+    def failing_copy(self, cursor):
+        self.data.read(100)
+        raise RuntimeError("copy")
+
+    monkeypatch.setattr(CopyLoader, "copy", failing_copy)
+    with transaction.atomic() if atomic else contextlib.nullcontext():
+        with pytest.raises(RuntimeError, match="copy"):
+            Reading.objects.transfer_to("other")
+        assert not connection.allow_thread_sharing
+        assert Reading.objects.count() == 200000
+    assert Reading.objects.using("other").count() == 0
+
+
+def test_transfer_to_options():
+    load_readings(5)
+    n_rows_affected = Reading.objects.transfer_to(
+        "other",
+        where=Q(sensor__lt=2),
+        order_by=["sensor"],
+    )
+    assert n_rows_affected == 2
+    assert sorted(
+        Reading.objects.using("other").values_list("sensor", flat=True)
+    ) == [0, 1]
+
+
+def test_transfer_to_csv_keeps_empty_strings():
+    Author.objects.create(name="ann", country="")
+    Author.objects.create(name="bob", country=None)
+    Author.objects.create(name="\\N", country="\\N")
+    assert Author.objects.transfer_to("other", data_format="csv") == 3
+    assert sorted(
+        Author.objects.using("other").values_list("name", "country")
+    ) == [("\\N", "\\N"), ("ann", ""), ("bob", None)]
+
+
+def test_transfer_to_upsert():
+    load_readings(3)
+    Reading.objects.transfer_to("other")
+    Reading.objects.filter(sensor=1).update(value=10.0)
+    n_rows_affected = Reading.objects.transfer_to(
+        "other",
+        operation="upsert",
+        conflict_target=["id"],
+        update_operation="replace",
+    )
+    assert n_rows_affected == 3
+    assert sorted(
+        Reading.objects.using("other").values_list("sensor", "value")
+    ) == [(0, 0.5), (1, 10.0), (2, 2.5)]
+
+
+@pytest.mark.parametrize(
+    "column, destination_type, data_format",
+    [
+        ("sensor", "integer", "binary"),
+        ("sensor", "bigint", "csv"),
+        ("code", "char(5)", "csv"),
+    ],
+)
+def test_transfer_to_chooses_format(
+    monkeypatch, column, destination_type, data_format
+):
+    load_readings(3)
+    formats = []
+    original = CopyDumper.__init__
+
+    def record(self, *args, **kwargs):
+        formats.append(kwargs["data_format"])
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(CopyDumper, "__init__", record)
+    source_type = {"sensor": "integer", "code": "char(3)"}[column]
+    with connections["other"].cursor() as cursor:
+        cursor.execute(
+            "ALTER TABLE tests_reading "
+            f"ALTER COLUMN {column} TYPE {destination_type}"
+        )
+    try:
+        assert Reading.objects.transfer_to("other") == 3
+    finally:
+        with connections["other"].cursor() as cursor:
+            cursor.execute(
+                "ALTER TABLE tests_reading "
+                f"ALTER COLUMN {column} TYPE {source_type}"
+            )
+    assert formats == [data_format]
+    assert sorted(
+        Reading.objects.using("other").values_list("sensor", "value")
+    ) == [(0, 0.5), (1, 1.5), (2, 2.5)]
+
+
+def test_transfer_to_validates_before_export(monkeypatch):
+    load_readings(3)
+    exports = []
+    monkeypatch.setattr(CopyDumper, "write", lambda self, s: exports.append(s))
+    with pytest.raises(ValueError):
+        Reading.objects.transfer_to("other", operation="replace_all")
+    assert exports == []
+    assert Reading.objects.using("other").count() == 0
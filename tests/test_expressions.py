@@ -0,0 +1,107 @@
+"""Tests of server-side transforms and the staging model behind them."""
+
+# third-party imports
+import pytest
+from django.core.exceptions import FieldError
+from django.db import connection, models
+from django.db.models import F, Q, Value
+from django.db.models.functions import Concat, Lower, Upper
+
+# local imports
+from django_postgres_loader import CopyLoader
+from django_postgres_loader.core import expressions
+from tests.models import Book
+
+
+def test_sql_transform(csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(["isbn", "title"], [["1", " a "]]),
+        operation="append",
+        transforms={"title": 'upper(trim("title"))'},
+    )
+    assert loader.load() == 1
+    assert list(Book.objects.values_list("title", flat=True)) == ["A"]
+
+
+def test_expression_transform_from_extra_columns(csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(["isbn", "first", "last"], [["1", "Ada", "Lovelace"]]),
+        operation="append",
+        transforms={
+            "title": Concat(Upper("last"), Value(", "), F("first")),
+            "price": "10",
+        },
+    )
+    assert loader.load() == 1
+    assert list(Book.objects.values_list("title", "price")) == [
+        ("LOVELACE, Ada", 10)
+    ]
+
+
+@pytest.mark.parametrize(
+    "column",
+    ["pk", "objects", "save", "delete", "Meta", "a__b", "check", "x y"],
+)
+def test_clashing_column_names(csv_data, column):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(["isbn", "title", column], [["1", "Title", "x"]]),
+        operation="append",
+        transforms={"title": Lower("title")},
+        where=Q(title="Title"),
+    )
+    assert loader.load() == 1
+    assert list(Book.objects.values_list("title", flat=True)) == ["title"]
+
+
+def test_clashing_column_names_in_sql_transform(csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(["isbn", "pk", "a__b"], [["1", "x", "y"]]),
+        operation="append",
+        transforms={"title": '"pk" || "a__b"'},
+    )
+    assert loader.load() == 1
+    assert list(Book.objects.values_list("title", flat=True)) == ["xy"]
+
+
+def test_staging_field_names():
+    model = expressions.build_staging_model(
+        "tmp_names", ["id", "pk", "title", "a__b", "dpl_column_9"]
+    )
+    names = {
+        f.column: f.name
+        for f in model._meta.concrete_fields
+        if not f.primary_key
+    }
+    assert names == {
+        "id": "id",
+        "pk": "dpl_column_1",
+        "title": "title",
+        "a__b": "dpl_column_3",
+        "dpl_column_9": "dpl_column_4",
+    }
+    assert model._meta.pk.name == "dpl_staging_pk"
+    assert model._meta.get_field("id").column == "id"
+    assert not model._meta.get_field("id").primary_key
+
+
+def test_staging_model_is_cached():
+    first = expressions.build_staging_model("tmp_cached", ["a", "b"])
+    second = expressions.build_staging_model("tmp_cached", ["a", "b"])
+    assert first is second
+    typed = expressions.build_staging_model(
+        "tmp_cached", ["a", "b"], fields={"a": Book._meta.get_field("stock")}
+    )
+    assert typed is not first
+    assert isinstance(typed._meta.get_field("a"), models.IntegerField)
+
+
+def test_staging_model_compiles_expressions():
+    model = expressions.build_staging_model("tmp_compile", ["pk", "title"])
+    snippet = expressions.compile_expression(Upper("title"), model, connection)
+    assert snippet == 'UPPER("tmp_compile"."title")'
+    with pytest.raises(FieldError):
+        expressions.compile_expression(Upper("a__b"), model, connection)
@@ -0,0 +1,132 @@
+"""Tests of LoadGraph."""
+
+# third-party imports
+import pytest
+from django.db import connection, IntegrityError, transaction
+
+# local imports
+from django_postgres_loader import LoadGraph
+from tests.models import Author, Book
+
+
+def build_graph(csv_data, books, **kwargs) -> LoadGraph:
+    """Build a graph loading books and the authors they reference.
+
+    The books are added first, so the graph must reorder the loads.
+
+    Args:
+        csv_data (Callable):
+            The csv_data fixture.
+        books (list[list[str]]):
+            The ISBN, title, and author name of each book.
+        **kwargs:
+            Arguments of LoadGraph.
+
+    Returns (LoadGraph):
+        The graph.
+    """
+    return LoadGraph(
+        [
+            (
+                Book,
+                csv_data(["isbn", "title", "author_name"], books),
+                {
+                    "operation": "append",
+                    "resolve": {"author_id": ("author_name", Author, "name")},
+                },
+            ),
+            (Author, csv_data(["name"], [["ann"], ["bob"]])),
+        ],
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("max_workers", [None, 1])
+def test_graph_orders_loads(csv_data, max_workers):
+    graph = build_graph(
+        csv_data,
+        [["1", "a", "ann"], ["2", "b", "bob"]],
+        max_workers=max_workers,
+    )
+    assert [loader.model for loader in graph.get_load_order()] == [
+        Author,
+        Book,
+    ]
+    assert graph.load() == {Author: 2, Book: 2}
+    assert sorted(Book.objects.values_list("isbn", "author__name")) == [
+        ("1", "ann"),
+        ("2", "bob"),
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [None, 1])
+def test_graph_is_atomic(csv_data, max_workers):
+    graph = build_graph(
+        csv_data,
+        [["1", "a", "ann"], ["1", "b", "bob"]],
+        max_workers=max_workers,
+    )
+    with pytest.raises(IntegrityError):
+        graph.load()
+    assert Author.objects.count() == 0
+    assert Book.objects.count() == 0
+    for loader in graph.loaders.values():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT to_regclass(%s) IS NULL",
+                [f'"{loader.temp_table_name}"'],
+            )
+            assert cursor.fetchone()[0]
+
+
+def test_graph_in_transaction(csv_data):
+    with transaction.atomic():
+        graph = build_graph(csv_data, [["1", "a", "ann"]])
+        assert graph.load() == {Author: 2, Book: 1}
+    assert Book.objects.get().author.name == "ann"
+
+
+def test_graph_rejects_duplicate_models(csv_data):
+    graph = LoadGraph()
+    graph.add(Author, csv_data(["name"], [["ann"]]), operation="append")
+    with pytest.raises(ValueError):
+        graph.add(Author, csv_data(["name"], [["bob"]]), operation="append")
+
+
+def test_graph_rejects_mixed_databases(csv_data):
+    graph = LoadGraph(using="default")
+    with pytest.raises(ValueError):
+        graph.add(Author, csv_data(["name"], [["ann"]]), using="other")
+
+
+@pytest.mark.parametrize("max_workers", [None, 1])
+def test_graph_session_settings(csv_data, max_workers, monkeypatch):
+    graph = LoadGraph(
+        [
+            (
+                Author,
+                csv_data(["name"], [["ann"], ["bob"]]),
+                {
+                    "session_settings": {"work_mem": "7MB"},
+                    "where": "current_setting('work_mem') = '7MB'",
+                },
+            ),
+        ],
+        max_workers=max_workers,
+    )
+    loader = graph.loaders[Author]
+    staging_settings = []
+    copy = loader.copy
+
+    def copy_with_settings(cursor):
+        cursor.execute("SELECT current_setting('work_mem')")
+        staging_settings.append(cursor.fetchone()[0])
+        return copy(cursor=cursor)
+
+    monkeypatch.setattr(loader, "copy", copy_with_settings)
+    assert graph.load() == {Author: 2}
+    assert loader.stats["rows_filtered"] == 0
+    assert staging_settings == ["7MB"]
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT current_setting('work_mem')")
+        assert cursor.fetchone()[0] != "7MB"
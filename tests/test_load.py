@@ -0,0 +1,750 @@
+"""Tests of CopyLoader against a real PostgreSQL server."""
+
+# standard library imports
+import io
+
+# third-party imports
+import pytest
+from django.db import connection
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
+
+# local imports
+from django_postgres_loader import CopyLoader
+from tests.models import Author, Book, Reading
+
+BOOK_COLUMNS = ["isbn", "title", "price"]
+
+
+def book_rows() -> dict:
+    """Get the rows of the Book table.
+
+    Returns (dict):
+        (title, price) pairs keyed on ISBN.
+    """
+    return {
+        isbn: (title, None if price is None else str(price))
+        for isbn, title, price in Book.objects.values_list(
+            "isbn", "title", "price"
+        )
+    }
+
+
+def test_append(csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "a", "1.50"], ["2", "b", ""]]),
+        operation="append",
+    )
+    assert loader.load() == 2
+    assert loader.stats["rows_copied"] == 2
+    assert loader.stats["rows_affected"] == 2
+    assert book_rows() == {"1": ("a", "1.50"), "2": ("b", None)}
+
+
+def test_append_bytes():
+    loader = CopyLoader(
+        model=Book,
+        data=io.BytesIO(b"isbn,title\n1,a\n2,b\n"),
+        operation="append",
+    )
+    assert loader.load() == 2
+    assert book_rows() == {"1": ("a", None), "2": ("b", None)}
+
+
+def test_append_truncate(books, csv_data):
+    n_rows_affected = Book.objects.load(
+        data=csv_data(BOOK_COLUMNS, [["4", "d", "4.00"]]),
+        operation="append",
+        truncate=True,
+    )
+    assert n_rows_affected == 1
+    assert book_rows() == {"4": ("d", "4.00")}
+
+
+def test_field_mapping(csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(["code", "name"], [["1", "a"]]),
+        operation="append",
+        field_mapping={"code": "isbn", "name": "title"},
+    )
+    assert loader.load() == 1
+    assert book_rows() == {"1": ("a", None)}
+
+
+def test_safe_append(books, csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "x", "9.00"], ["4", "d", "4.00"]]),
+        operation="safe_append",
+        conflict_target=["isbn"],
+    )
+    assert loader.load() == 1
+    assert book_rows() == {
+        "1": ("a", "1.50"),
+        "2": ("b", "2.00"),
+        "3": ("c", "3.00"),
+        "4": ("d", "4.00"),
+    }
+
+
+@pytest.mark.parametrize(
+    "update_operation, price",
+    [("replace", "9.00"), ("add", "10.50"), ("coalesce_old", "1.50")],
+)
+def test_upsert(books, csv_data, update_operation, price):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "a", "9.00"], ["4", "d", "4.00"]]),
+        operation="upsert",
+        conflict_target=["isbn"],
+        update_operation={"price": update_operation, "title": "replace"},
+    )
+    assert loader.load() == 2
+    assert book_rows() == {
+        "1": ("a", price),
+        "2": ("b", "2.00"),
+        "3": ("c", "3.00"),
+        "4": ("d", "4.00"),
+    }
+
+
+def test_update_skips_new_rows(books, csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "x", "9.00"], ["4", "d", "4.00"]]),
+        operation="update",
+        conflict_target=["isbn"],
+        update_operation="replace",
+    )
+    assert loader.load() == 1
+    assert book_rows() == {
+        "1": ("x", "9.00"),
+        "2": ("b", "2.00"),
+        "3": ("c", "3.00"),
+    }
+
+
+def test_update_non_unique_target(csv_data):
+    CopyLoader(
+        model=Reading,
+        data=csv_data(["sensor", "value"], [[1, 1.0], [1, 2.0], [2, 3.0]]),
+        operation="append",
+    ).load()
+    loader = CopyLoader(
+        model=Reading,
+        data=csv_data(["sensor", "value"], [[1, 10.0]]),
+        operation="update",
+        conflict_target=["sensor"],
+        update_operation="add",
+    )
+    assert loader.load() == 2
+    assert sorted(Reading.objects.values_list("sensor", "value")) == [
+        (1, 11.0),
+        (1, 12.0),
+        (2, 3.0),
+    ]
+
+
+def test_update_from_staged_rows(books, csv_data):
+    updated = dict(Book.objects.values_list("isbn", "updated"))
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(["isbn", "price"], [["2", "5.00"], ["", "6.00"]]),
+        operation="update",
+        conflict_target=["isbn"],
+        update_operation="replace",
+    )
+    assert loader.build_insert_query().lstrip().startswith("UPDATE")
+    assert loader.load() == 1
+    assert book_rows() == {
+        "1": ("a", "1.50"),
+        "2": ("b", "5.00"),
+        "3": ("c", "3.00"),
+    }
+    new_updated = dict(Book.objects.values_list("isbn", "updated"))
+    assert new_updated["2"] > updated["2"]
+    assert new_updated["1"] == updated["1"]
+
+
+def test_update_duplicate_staged_rows(books, csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "x", "9.00"], ["1", "y", "8.00"]]),
+        operation="update",
+        conflict_target=["isbn"],
+        update_operation="replace",
+    )
+    assert loader.load() == 1
+    assert book_rows()["1"] in [("x", "9.00"), ("y", "8.00")]
+
+
+def test_update_where(books, csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "x", "9.00"], ["2", "y", "0.00"]]),
+        operation="update",
+        conflict_target=["isbn"],
+        update_operation="replace",
+        where=Q(price__gt=0),
+    )
+    assert loader.load() == 1
+    assert loader.stats["rows_filtered"] == 1
+    assert book_rows()["1"] == ("x", "9.00")
+    assert book_rows()["2"] == ("b", "2.00")
+
+
+@pytest.mark.parametrize(
+    "conflict_target, match",
+    [(None, "conflict target"), (["title"], "not found in data")],
+)
+def test_update_invalid_conflict_target(csv_data, conflict_target, match):
+    with pytest.raises(ValueError, match=match):
+        CopyLoader(
+            model=Book,
+            data=csv_data(["isbn", "price"], [["1", "9.00"]]),
+            operation="update",
+            conflict_target=conflict_target,
+            update_operation="replace",
+        )
+
+
+def upsert_queries(csv_data, **options) -> list:
+    """Upsert books and capture the queries run.
+
+    Args:
+        csv_data (Callable):
+            The csv_data fixture.
+        **options:
+            Other options of the loader.
+
+    Returns (list[str]):
+        The SQL of each query run by the load.
+    """
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["3", "x", "9.00"], ["4", "d", "4.00"]]),
+        operation="upsert",
+        conflict_target=["isbn"],
+        update_operation="replace",
+        **options,
+    )
+    with CaptureQueriesContext(connection) as context:
+        assert loader.load() == 2
+    assert book_rows()["3"] == ("x", "9.00")
+    return [query["sql"] for query in context.captured_queries]
+
+
+def merge_query(queries: list) -> str:
+    """Find the query merging the staged rows into the Book table.
+
+    Args:
+        queries (list[str]):
+            The queries run by a load.
+
+    Returns (str):
+        The merge query.
+    """
+    return next(
+        query
+        for query in queries
+        if query.lstrip().startswith('INSERT INTO "tests_book"')
+    )
+
+
+@pytest.mark.parametrize(
+    "order_by, clause",
+    [
+        (True, 'ORDER BY\n\t"isbn"'),
+        (["title", "isbn"], 'ORDER BY\n\t"title", "isbn"'),
+        (False, None),
+        (None, None),
+    ],
+)
+def test_order_by(books, csv_data, order_by, clause):
+    query = merge_query(upsert_queries(csv_data, order_by=order_by))
+    if clause is None:
+        assert "ORDER BY" not in query
+    else:
+        assert clause in query
+
+
+def test_order_by_concurrent_writer(books, csv_data):
+    writer = connection.copy()
+    try:
+        with writer.cursor() as cursor:
+            cursor.execute("BEGIN")
+            cursor.execute("UPDATE tests_book SET stock = 1 WHERE isbn = '1'")
+            query = merge_query(upsert_queries(csv_data))
+            cursor.execute("ROLLBACK")
+    finally:
+        writer.close()
+    assert 'ORDER BY\n\t"isbn"' in query
+
+
+@pytest.mark.parametrize(
+    "options, error",
+    [
+        ({"order_by": True, "operation": "delete"}, ValueError),
+        ({"order_by": True, "conflict_target": None}, ValueError),
+        ({"order_by": ["created"]}, ValueError),
+        ({"order_by": ["isbn", 1]}, TypeError),
+        ({"order_by": []}, TypeError),
+        ({"order_by": "isbn"}, TypeError),
+    ],
+)
+def test_order_by_invalid(csv_data, options, error):
+    options = {"operation": "append", "conflict_target": ["isbn"], **options}
+    with pytest.raises(error, match="(?i)order by"):
+        CopyLoader(
+            model=Book,
+            data=csv_data(BOOK_COLUMNS, [["1", "a", "1.50"]]),
+            **options,
+        )
+
+
+def test_temp_table_dropped(csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "a", "1.50"]]),
+        operation="append",
+    )
+    loader.load()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT to_regclass(%s) IS NULL", [loader.temp_table_name]
+        )
+        assert cursor.fetchone()[0]
+
+
+def test_session_settings_temp_buffers(csv_data):
+    connection.close()
+    applied = []
+    for isbn, temp_buffers in [("1", "16MB"), ("2", "32MB")]:
+        loader = CopyLoader(
+            model=Book,
+            data=csv_data(BOOK_COLUMNS, [[isbn, "a", "1.50"]]),
+            operation="append",
+            session_settings={"temp_buffers": temp_buffers, "work_mem": "8MB"},
+        )
+        assert loader.load() == 1
+        applied.append(loader.stats["temp_buffers_applied"])
+    assert applied == [1, 0]
+    assert Book.objects.count() == 2
+
+
+def load_authors(csv_data, names) -> None:
+    """Load authors by name.
+
+    Args:
+        csv_data (Callable):
+            The csv_data fixture.
+        names (list[str]):
+            The names of the authors.
+
+    Returns:
+        None
+    """
+    CopyLoader(
+        model=Author,
+        data=csv_data(["name"], [[name] for name in names]),
+        operation="append",
+    ).load()
+
+
+def test_resolve(csv_data):
+    load_authors(csv_data, ["ann", "bob"])
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(
+            ["isbn", "title", "author_name"],
+            [["1", "a", "ann"], ["2", "b", "bob"], ["3", "c", ""]],
+        ),
+        operation="append",
+        resolve={"author_id": ("author_name", Author, "name")},
+    )
+    assert loader.load() == 3
+    assert sorted(Book.objects.values_list("isbn", "author__name")) == [
+        ("1", "ann"),
+        ("2", "bob"),
+        ("3", None),
+    ]
+
+
+def test_resolve_unknown_key_aborts(csv_data):
+    load_authors(csv_data, ["ann"])
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(
+            ["isbn", "title", "author_name"],
+            [["1", "a", "ann"], ["2", "b", "zed"]],
+        ),
+        operation="append",
+        resolve={"author_id": ("author_name", Author, "name")},
+    )
+    with pytest.raises(ValueError, match="zed"):
+        loader.load()
+    assert Book.objects.count() == 0
+
+
+def test_resolve_upsert(csv_data):
+    load_authors(csv_data, ["ann", "bob"])
+    data = [["1", "a", "ann"]]
+    for author in ["ann", "bob"]:
+        data[0][2] = author
+        CopyLoader(
+            model=Book,
+            data=csv_data(["isbn", "title", "author_name"], data),
+            operation="upsert",
+            conflict_target=["isbn"],
+            update_operation="replace",
+            resolve={"author_id": ("author_name", Author, "name")},
+        ).load()
+    assert list(Book.objects.values_list("isbn", "author__name")) == [
+        ("1", "bob")
+    ]
+
+
+@pytest.mark.parametrize(
+    "where, expected",
+    [
+        (Q(price__gt=2), {"2", "3"}),
+        ('"price" > 2', {"2", "3"}),
+        (Q(region="EU") & ~Q(title="c"), {"2"}),
+        (Q(isbn__in=[]), set()),
+        (~Q(isbn__in=[]), {"1", "2", "3"}),
+    ],
+)
+def test_where(csv_data, where, expected):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(
+            BOOK_COLUMNS + ["region"],
+            [
+                ["1", "a", "1.00", "US"],
+                ["2", "b", "3.00", "EU"],
+                ["3", "c", "4.00", "EU"],
+            ],
+        ),
+        operation="append",
+        where=where,
+    )
+    assert loader.load() == len(expected)
+    assert loader.stats["rows_filtered"] == 3 - len(expected)
+    assert set(Book.objects.values_list("isbn", flat=True)) == expected
+
+
+def test_where_upsert(books, csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "x", "9.00"], ["2", "y", "0.50"]]),
+        operation="upsert",
+        conflict_target=["isbn"],
+        update_operation="replace",
+        where=Q(price__gte=1),
+    )
+    assert loader.load() == 1
+    assert book_rows()["1"] == ("x", "9.00")
+    assert book_rows()["2"] == ("b", "2.00")
+
+
+@pytest.mark.parametrize("projection", ["stream", "stage", "auto"])
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ({"ignore_extra_columns": True}, {"1", "2"}),
+        ({"include_columns": ["isbn", "title"]}, {"1", "2"}),
+        (
+            {
+                "include_columns": ["notes"],
+                "ignore_extra_columns": True,
+                "where": Q(notes__startswith="x"),
+            },
+            {"1"},
+        ),
+    ],
+)
+def test_projection(csv_data, projection, options, expected):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(
+            ["notes", "isbn", "junk", "title"],
+            [['x, "y"', "1", "9", "a"], ["", "2", "not a number", "b"]],
+        ),
+        operation="append",
+        projection=projection,
+        **options,
+    )
+    assert loader.projection == (
+        "stage" if projection == "auto" else projection
+    )
+    assert "junk" not in loader.data_columns
+    assert loader.load() == len(expected)
+    assert book_rows() == {
+        isbn: row
+        for isbn, row in {"1": ("a", None), "2": ("b", None)}.items()
+        if isbn in expected
+    }
+
+
+def test_projection_auto_streams_narrow_data(csv_data):
+    extra_columns = [f"extra_{index}" for index in range(6)]
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(
+            ["isbn"] + extra_columns + ["title"],
+            [["1"] + ["x"] * len(extra_columns) + ["a"]],
+        ),
+        operation="append",
+        ignore_extra_columns=True,
+        projection="auto",
+    )
+    assert loader.projection == "stream"
+    assert loader.data_columns == ["isbn", "title"]
+    assert loader.load() == 1
+    assert book_rows() == {"1": ("a", None)}
+
+
+def test_projection_nothing_skipped(csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "a", "1.50"]]),
+        operation="append",
+        ignore_extra_columns=True,
+    )
+    assert loader.projection is None
+
+
+def test_projection_unknown_included_column(csv_data):
+    with pytest.raises(ValueError, match="isbn2"):
+        CopyLoader(
+            model=Book,
+            data=csv_data(BOOK_COLUMNS, [["1", "a", "1.50"]]),
+            operation="append",
+            include_columns=["isbn2"],
+        )
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 2, 10])
+def test_delete(books, csv_data, batch_size):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(
+            BOOK_COLUMNS, [["1", "x", "bad"], ["3", "y", ""], ["9", "z", ""]]
+        ),
+        operation="delete",
+        conflict_target=["isbn"],
+        batch_size=batch_size,
+    )
+    assert loader.data_columns == ["isbn"]
+    assert loader.load() == 2
+    assert book_rows() == {"2": ("b", "2.00")}
+
+
+def test_delete_non_unique_target(csv_data):
+    CopyLoader(
+        model=Reading,
+        data=csv_data(["sensor", "value"], [[1, 1.0], [1, 2.0], [2, 3.0]]),
+        operation="append",
+    ).load()
+    loader = CopyLoader(
+        model=Reading,
+        data=csv_data(["sensor"], [[1], [1]]),
+        operation="delete",
+        conflict_target=["sensor"],
+        batch_size=1,
+    )
+    assert loader.load() == 2
+    assert list(Reading.objects.values_list("sensor", flat=True)) == [2]
+
+
+def test_delete_skips_defaults(csv_data):
+    load_authors(csv_data, ["ann", "bob"])
+    loader = CopyLoader(
+        model=Author,
+        data=csv_data(["name"], [["ann"]]),
+        operation="delete",
+        conflict_target=["name"],
+    )
+    assert loader.get_default_expressions() == dict()
+    assert loader.load() == 1
+    assert list(Author.objects.values_list("name", flat=True)) == ["bob"]
+
+
+@pytest.mark.parametrize(
+    "operation, batch_size, error",
+    [
+        ("delete", 0, ValueError),
+        ("delete", "2", TypeError),
+        ("append", 2, ValueError),
+    ],
+)
+def test_delete_invalid_batch_size(csv_data, operation, batch_size, error):
+    with pytest.raises(error, match="Batch size"):
+        CopyLoader(
+            model=Book,
+            data=csv_data(BOOK_COLUMNS, [["1", "a", "1.50"]]),
+            operation=operation,
+            conflict_target=["isbn"],
+            batch_size=batch_size,
+        )
+
+
+@pytest.mark.parametrize(
+    "scope, expected_deleted, kept",
+    [
+        (None, 2, dict()),
+        (Book.objects.filter(price__lt=2.5), 1, {"3": ("c", "3.00")}),
+        (Book.objects.none(), 0, {"2": ("b", "2.00"), "3": ("c", "3.00")}),
+    ],
+)
+def test_sync(books, csv_data, scope, expected_deleted, kept):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "x", "9.00"], ["4", "d", "4.00"]]),
+        operation="sync",
+        conflict_target=["isbn"],
+        update_operation="replace",
+        scope=scope,
+    )
+    assert loader.load() == 2 + expected_deleted
+    assert loader.stats["rows_inserted"] == 1
+    assert loader.stats["rows_updated"] == 1
+    assert loader.stats["rows_deleted"] == expected_deleted
+    assert book_rows() == {"1": ("x", "9.00"), "4": ("d", "4.00"), **kept}
+
+
+def test_sync_scope_across_relation(csv_data):
+    load_authors(csv_data, ["ann", "bob"])
+    CopyLoader(
+        model=Book,
+        data=csv_data(
+            ["isbn", "title", "author_name"],
+            [["1", "a", "ann"], ["2", "b", "ann"], ["3", "c", "bob"]],
+        ),
+        operation="append",
+        resolve={"author_id": ("author_name", Author, "name")},
+    ).load()
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(["isbn", "title"], [["1", "a"]]),
+        operation="sync",
+        conflict_target=["isbn"],
+        update_operation="replace",
+        scope=Book.objects.filter(author__name="ann"),
+    )
+    loader.load()
+    assert loader.stats["rows_deleted"] == 1
+    assert set(book_rows()) == {"1", "3"}
+
+
+def test_sync_deletes_filtered_rows(books, csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [["1", "a", "1.50"], ["2", "b", "0.00"]]),
+        operation="sync",
+        conflict_target=["isbn"],
+        update_operation="replace",
+        where=Q(price__gt=0),
+    )
+    loader.load()
+    assert loader.stats["rows_filtered"] == 1
+    assert loader.stats["rows_deleted"] == 2
+    assert set(book_rows()) == {"1"}
+
+
+@pytest.mark.parametrize(
+    "operation, scope, error",
+    [
+        ("sync", Author.objects.all(), ValueError),
+        ("sync", Book.objects.all()[:2], ValueError),
+        ("sync", "isbn > '1'", TypeError),
+        ("upsert", Book.objects.all(), ValueError),
+    ],
+)
+def test_sync_invalid_scope(csv_data, operation, scope, error):
+    with pytest.raises(error, match="Scope"):
+        CopyLoader(
+            model=Book,
+            data=csv_data(BOOK_COLUMNS, [["1", "a", "1.50"]]),
+            operation=operation,
+            conflict_target=["isbn"],
+            update_operation="replace",
+            scope=scope,
+        )
+
+
+def hashed_books(csv_data, operation, rows) -> CopyLoader:
+    """Load books, keeping their row hashes.
+
+    Args:
+        csv_data (Callable):
+            The csv_data fixture.
+        operation (str):
+            The operation.
+        rows (list[list[str]]):
+            The rows of the data, with columns BOOK_COLUMNS.
+
+    Returns (CopyLoader):
+        The loader, after the load.
+    """
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, rows),
+        operation=operation,
+        conflict_target=["isbn"],
+        update_operation="replace",
+        hash_column="row_hash",
+    )
+    loader.load()
+    return loader
+
+
+@pytest.mark.parametrize("operation", ["update", "upsert", "sync"])
+def test_hash_column(csv_data, operation):
+    rows = [["1", "a", "1.50"], ["2", "b", "2.00"], ["3", "c", ""]]
+    hashed_books(csv_data, "upsert", rows)
+    hashes = dict(Book.objects.values_list("isbn", "row_hash"))
+    updated = dict(Book.objects.values_list("isbn", "updated"))
+    assert all(len(row_hash) == 32 for row_hash in hashes.values())
+
+    rows[1][2] = "2.50"
+    loader = hashed_books(csv_data, operation, rows)
+    assert loader.stats["rows_affected"] == 1
+    if operation == "sync":
+        assert loader.stats["rows_updated"] == 1
+    new_hashes = dict(Book.objects.values_list("isbn", "row_hash"))
+    new_updated = dict(Book.objects.values_list("isbn", "updated"))
+    assert new_hashes["2"] != hashes["2"]
+    assert new_updated["2"] > updated["2"]
+    for isbn in ["1", "3"]:
+        assert new_hashes[isbn] == hashes[isbn]
+        assert new_updated[isbn] == updated[isbn]
+
+
+def test_hash_column_fills_missing_hashes(books, csv_data):
+    rows = [["1", "a", "1.50"], ["2", "b", "2.00"]]
+    assert hashed_books(csv_data, "update", rows).stats["rows_affected"] == 2
+    assert hashed_books(csv_data, "update", rows).stats["rows_affected"] == 0
+
+
+@pytest.mark.parametrize(
+    "options, error",
+    [
+        ({"hash_column": 1}, TypeError),
+        ({"hash_column": "digest"}, ValueError),
+        ({"hash_column": "title"}, ValueError),
+        ({"hash_column": "row_hash", "operation": "append"}, ValueError),
+        ({"hash_column": "row_hash", "update_operation": "add"}, ValueError),
+    ],
+)
+def test_hash_column_invalid(csv_data, options, error):
+    options = {"operation": "upsert", "update_operation": "replace", **options}
+    with pytest.raises(error, match="Hash column"):
+        CopyLoader(
+            model=Book,
+            data=csv_data(BOOK_COLUMNS, [["1", "a", "1.50"]]),
+            conflict_target=["isbn"],
+            **options,
+        )
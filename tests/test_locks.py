@@ -0,0 +1,168 @@
+"""Tests of the advisory locks taken around the merge."""
+
+# standard library imports
+import contextlib
+import threading
+
+# third-party imports
+import pytest
+from django.db import connection, IntegrityError, transaction
+from django.test.utils import CaptureQueriesContext
+
+# local imports
+from django_postgres_loader import CopyLoader
+from django_postgres_loader.core import definitions
+from tests.models import Book
+from tests.test_load import BOOK_COLUMNS, book_rows
+
+
+def held_advisory_locks() -> list:
+    """Get the advisory locks held by the current session.
+
+    Returns (list[tuple[int, str]]):
+        The bucket (objid) and mode of each lock, in order of bucket.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT objid::integer, mode FROM pg_locks "
+            "WHERE (locktype = 'advisory') AND (pid = pg_backend_pid()) "
+            "ORDER BY objid::integer"
+        )
+        return cursor.fetchall()
+
+
+def upsert_books(csv_data, rows, **options) -> CopyLoader:
+    """Upsert books while holding advisory locks.
+
+    Args:
+        csv_data (Callable):
+            The csv_data fixture.
+        rows (list[list[str]]):
+            The rows of the data, with columns BOOK_COLUMNS.
+        **options:
+            Other options of the loader.
+
+    Returns (CopyLoader):
+        The loader, after the load.
+    """
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, rows),
+        operation="upsert",
+        conflict_target=["isbn"],
+        update_operation="replace",
+        **options,
+    )
+    loader.load()
+    return loader
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"advisory_lock": "model"},
+        {"advisory_lock": "bucket"},
+        {"advisory_lock": "bucket", "lock_buckets": 1},
+    ],
+)
+def test_advisory_lock(books, csv_data, options):
+    loader = upsert_books(
+        csv_data, [["1", "x", "9.00"], ["4", "d", "4.00"]], **options
+    )
+    assert loader.stats["rows_affected"] == 2
+    assert isinstance(loader.stats["lock_wait_seconds"], float)
+    assert loader.stats["lock_wait_seconds"] >= 0
+    assert held_advisory_locks() == []
+    assert book_rows()["1"] == ("x", "9.00")
+
+
+def test_bucket_locks_in_transaction(csv_data):
+    rows = [[str(isbn), "t", "1.00"] for isbn in range(50)]
+    with transaction.atomic():
+        upsert_books(csv_data, rows, advisory_lock="bucket", lock_buckets=4)
+        locks = held_advisory_locks()
+        assert [mode for bucket, mode in locks] == ["ExclusiveLock"] * 4
+        assert [bucket for bucket, mode in locks] == [0, 1, 2, 3]
+    assert held_advisory_locks() == []
+
+
+@pytest.mark.parametrize("atomic", [False, True])
+def test_bucket_locks_in_one_statement(csv_data, atomic):
+    rows = [[str(isbn), "t", "1.00"] for isbn in range(50)]
+    with CaptureQueriesContext(connection) as context:
+        with transaction.atomic() if atomic else contextlib.nullcontext():
+            upsert_books(csv_data, rows, advisory_lock="bucket", lock_buckets=4)
+    lock_queries = [
+        query["sql"]
+        for query in context.captured_queries
+        if "pg_advisory_" in query["sql"]
+    ]
+    if atomic:
+        assert len(lock_queries) == 1
+    else:
+        assert len(lock_queries) == 2
+        assert "pg_advisory_unlock" in lock_queries[1]
+    assert "unnest" in lock_queries[0]
+
+
+def test_model_lock_in_transaction(csv_data):
+    with transaction.atomic():
+        upsert_books(csv_data, [["1", "a", "1.00"]], advisory_lock="model")
+        assert held_advisory_locks() == [
+            (definitions.MODEL_LOCK_BUCKET, "ExclusiveLock")
+        ]
+    assert held_advisory_locks() == []
+
+
+def test_advisory_lock_released_on_failure(csv_data):
+    with pytest.raises(IntegrityError):
+        upsert_books(csv_data, [["1", "", "1.00"]], advisory_lock="model")
+    assert held_advisory_locks() == []
+
+
+def test_advisory_lock_waits(csv_data):
+    holder = connection.copy()
+    try:
+        holder.ensure_connection()
+        raw_connection = holder.connection
+        raw_connection.autocommit = True
+        with raw_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_lock('tests_book'::regclass::oid::integer, "
+                "%s)",
+                [definitions.MODEL_LOCK_BUCKET],
+            )
+
+        def unlock():
+            with raw_connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock_all()")
+
+        timer = threading.Timer(0.5, unlock)
+        timer.start()
+        loader = upsert_books(
+            csv_data, [["1", "a", "1.00"]], advisory_lock="model"
+        )
+        timer.join()
+    finally:
+        holder.close()
+    assert loader.stats["lock_wait_seconds"] >= 0.4
+
+
+@pytest.mark.parametrize(
+    "options, error",
+    [
+        ({"advisory_lock": True}, TypeError),
+        ({"advisory_lock": "table"}, ValueError),
+        ({"advisory_lock": "bucket", "conflict_target": None}, ValueError),
+        ({"advisory_lock": "bucket", "lock_buckets": 0}, ValueError),
+        ({"advisory_lock": "bucket", "lock_buckets": 2.0}, TypeError),
+    ],
+)
+def test_advisory_lock_invalid(csv_data, options, error):
+    options = {"operation": "append", "conflict_target": ["isbn"], **options}
+    with pytest.raises(error, match="(?i)lock"):
+        CopyLoader(
+            model=Book,
+            data=csv_data(BOOK_COLUMNS, [["1", "a", "1.50"]]),
+            **options,
+        )
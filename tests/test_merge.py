@@ -0,0 +1,164 @@
+"""Tests of the MERGE engine (PostgreSQL 15 or higher)."""
+
+# third-party imports
+import pytest
+from django.db import connection, NotSupportedError
+
+# local imports
+from django_postgres_loader import CopyLoader
+from tests.models import Book, Reading
+from tests.test_load import BOOK_COLUMNS, book_rows
+
+pytestmark = pytest.mark.pg_version(
+    at_least=150000,
+    reason="MERGE requires PostgreSQL 15",
+)
+
+ROWS = [["1", "x", "9.00"], ["4", "d", "4.00"]]
+
+
+def merge_books(csv_data, operation, engine="merge", **options) -> int:
+    """Load ROWS into the Book table.
+
+    Args:
+        csv_data (Callable):
+            The csv_data fixture.
+        operation (str):
+            The operation.
+        engine (str):
+            The engine.
+        **options:
+            Other options of the loader.
+
+    Returns (int):
+        The number of rows affected.
+    """
+    return build_loader(csv_data, operation, engine, **options).load()
+
+
+def build_loader(csv_data, operation, engine, **options) -> CopyLoader:
+    """Build a loader of ROWS into the Book table.
+
+    Args:
+        csv_data (Callable):
+            The csv_data fixture.
+        operation (str):
+            The operation.
+        engine (str):
+            The engine.
+        **options:
+            Other options of the loader.
+
+    Returns (CopyLoader):
+        The loader.
+    """
+    return CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, ROWS),
+        operation=operation,
+        conflict_target=["isbn"],
+        update_operation="replace",
+        engine=engine,
+        **options,
+    )
+
+
+@pytest.mark.parametrize("operation", ["update", "upsert", "delete"])
+def test_merge_matches_on_conflict(books, csv_data, operation):
+    n_rows_affected = merge_books(csv_data, operation, engine="on_conflict")
+    expected = book_rows()
+    Book.objects.all().delete()
+    CopyLoader(
+        model=Book,
+        data=csv_data(
+            BOOK_COLUMNS,
+            [["1", "a", "1.50"], ["2", "b", "2.00"], ["3", "c", "3.00"]],
+        ),
+        operation="append",
+    ).load()
+    assert merge_books(csv_data, operation) == n_rows_affected
+    assert book_rows() == expected
+
+
+def test_merge_upsert(books, csv_data):
+    assert merge_books(csv_data, "upsert") == 2
+    assert book_rows() == {
+        "1": ("x", "9.00"),
+        "2": ("b", "2.00"),
+        "3": ("c", "3.00"),
+        "4": ("d", "4.00"),
+    }
+
+
+def test_merge_hash_column(books, csv_data):
+    merge_books(csv_data, "upsert", hash_column="row_hash")
+    assert merge_books(csv_data, "upsert", hash_column="row_hash") == 0
+
+
+def test_merge_non_unique_target(csv_data):
+    CopyLoader(
+        model=Reading,
+        data=csv_data(["sensor", "value"], [[1, 1.0], [1, 2.0], [2, 3.0]]),
+        operation="append",
+    ).load()
+    loader = CopyLoader(
+        model=Reading,
+        data=csv_data(["sensor", "value"], [[1, 10.0]]),
+        operation="update",
+        conflict_target=["sensor"],
+        update_operation="add",
+        engine="merge",
+    )
+    assert loader.load() == 2
+    assert sorted(Reading.objects.values_list("sensor", "value")) == [
+        (1, 11.0),
+        (1, 12.0),
+        (2, 3.0),
+    ]
+
+
+@pytest.mark.pg_version(
+    at_least=170000,
+    reason="MERGE cannot sync before PostgreSQL 17",
+)
+def test_merge_sync(books, csv_data):
+    assert merge_books(csv_data, "sync") == 4
+    assert book_rows() == {"1": ("x", "9.00"), "4": ("d", "4.00")}
+
+
+@pytest.mark.pg_version(
+    below=170000,
+    reason="MERGE can sync from PostgreSQL 17",
+)
+def test_merge_sync_unsupported(csv_data):
+    with pytest.raises(NotSupportedError, match="PostgreSQL version 17"):
+        merge_books(csv_data, "sync")
+
+
+@pytest.mark.pg_version(
+    at_least=170000,
+    reason="MERGE cannot sync before PostgreSQL 17",
+)
+def test_merge_filtered_scope_unsupported(csv_data):
+    with pytest.raises(NotSupportedError, match="filtered scope"):
+        merge_books(csv_data, "sync", scope=Book.objects.filter(price__gt=1))
+
+
+@pytest.mark.parametrize(
+    "operation, engine",
+    [
+        ("upsert", "merge"),
+        ("delete", "merge"),
+        ("sync", "on_conflict"),
+        ("append", "on_conflict"),
+    ],
+)
+def test_auto_engine(csv_data, operation, engine):
+    if (operation == "sync") and (connection.pg_version >= 170000):
+        engine = "merge"
+    assert build_loader(csv_data, operation, "auto").engine == engine
+
+
+def test_merge_unsupported_operation(csv_data):
+    with pytest.raises(ValueError, match="merge engine"):
+        merge_books(csv_data, "safe_append")
@@ -0,0 +1,47 @@
+"""Tests of the per-model metadata registry."""
+
+# third-party imports
+from django.db import connections
+
+# local imports
+from django_postgres_loader import CopyLoader
+from django_postgres_loader.core import registry
+from tests.models import Author, Book
+
+
+def test_metadata_is_shared(csv_data):
+    registry.clear_model_metadata()
+    first = CopyLoader(
+        model=Book, data=csv_data(["isbn", "title"], []), operation="append"
+    )
+    second = CopyLoader(
+        model=Book, data=csv_data(["isbn", "title"], []), operation="append"
+    )
+    assert first.model_metadata is second.model_metadata
+
+
+def test_metadata_is_per_alias():
+    default = registry.get_model_metadata(Book, connections["default"])
+    other = registry.get_model_metadata(Book, connections["other"])
+    assert default is not other
+    assert default.alias == "default"
+    assert other.alias == "other"
+
+
+def test_metadata_contents():
+    metadata = registry.get_model_metadata(Book, connections["default"])
+    assert metadata.db_table == "tests_book"
+    assert metadata.attname_to_column["author_id"] == "author_id"
+    assert metadata.pk_column == "id"
+    assert {"isbn"} in metadata.valid_conflict_targets
+    assert metadata.auto_now_columns == {"updated"}
+    assert "title" in metadata.not_null_columns
+    assert "price" not in metadata.not_null_columns
+
+
+def test_clear_model_metadata():
+    book = registry.get_model_metadata(Book, connections["default"])
+    author = registry.get_model_metadata(Author, connections["default"])
+    registry.clear_model_metadata(Book)
+    assert registry.get_model_metadata(Book, connections["default"]) is not book
+    assert registry.get_model_metadata(Author, connections["default"]) is author
@@ -0,0 +1,260 @@
+"""Tests of error-tolerant loading (on_error="ignore" or "reject")."""
+
+# standard library imports
+import json
+
+# third-party imports
+import psycopg2
+import pytest
+from django.db import connection, DataError, transaction
+
+# local imports
+from django_postgres_loader import CopyLoader
+from tests.models import Author, Book
+
+BOOK_COLUMNS = ["isbn", "title", "price", "stock"]
+ROWS = [
+    ["1", "a", "1.50", "1"],
+    ["2", "b", "x", "2"],
+    ["3", "", "3.00", "3"],
+    ["4", "d", "4.00", "99999999999"],
+    ["5", "e", "5.00", "5"],
+    ["12345678901234", "f", "6.00", "6"],
+]
+ERRORS = {
+    3: 'price: invalid input syntax for type numeric: "x"',
+    4: 'null value in column "title" violates not-null constraint',
+    5: 'stock: value "99999999999" is out of range for type integer',
+    7: "isbn: value too long for type",
+}
+
+
+@pytest.fixture(params=["pg_input_is_valid", "fallback"])
+def input_check(request, monkeypatch):
+    """Check input with pg_input_is_valid, or with the pre-16 fallback.
+
+    Returns (str):
+        The name of the input check.
+    """
+    if request.param == "pg_input_is_valid":
+        if connection.pg_version < 160000:
+            pytest.skip("pg_input_is_valid requires PostgreSQL 16.")
+    else:
+        monkeypatch.setattr(connection, "pg_version", 150000)
+    return request.param
+
+
+@pytest.fixture
+def reject_table():
+    """Drop the reject table after the test.
+
+    Yields (str):
+        The name of the reject table.
+    """
+    yield "tests_book_rejects"
+    with connection.cursor() as cursor:
+        cursor.execute('DROP TABLE IF EXISTS "tests_book_rejects"')
+
+
+def rejected_rows() -> dict:
+    """Read the reject table.
+
+    The error messages are cut to the length of those in ERRORS, since the
+    name of the type in a "value too long" message depends on the check.
+
+    Returns (dict):
+        The error of each rejected row, keyed on line number.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT line_number, error, model_table_name "
+            'FROM "tests_book_rejects"'
+        )
+        rows = cursor.fetchall()
+    assert {row[2] for row in rows} <= {"tests_book"}
+    return {
+        line_number: error[: len(ERRORS.get(line_number, error))]
+        for line_number, error, _ in rows
+    }
+
+
+def test_abort(csv_data, input_check):
+    loader = CopyLoader(
+        model=Book, data=csv_data(BOOK_COLUMNS, ROWS), operation="append"
+    )
+    with pytest.raises((DataError, psycopg2.DataError)):
+        loader.load()
+    assert Book.objects.count() == 0
+
+
+def test_ignore(csv_data, input_check):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, ROWS),
+        operation="append",
+        on_error="ignore",
+    )
+    assert loader.load() == 2
+    assert loader.stats["rows_copied"] == 6
+    assert loader.stats["rows_rejected"] == 4
+    assert sorted(Book.objects.values_list("isbn", "stock")) == [
+        ("1", 1),
+        ("5", 5),
+    ]
+
+
+def test_reject(csv_data, input_check, reject_table):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, ROWS),
+        operation="append",
+        on_error="reject",
+    )
+    assert loader.load() == 2
+    assert loader.stats["rows_rejected"] == 4
+    assert sorted(Book.objects.values_list("isbn", flat=True)) == ["1", "5"]
+    assert rejected_rows() == ERRORS
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT raw_row FROM tests_book_rejects WHERE line_number = 3"
+        )
+        assert json.loads(cursor.fetchone()[0]) == {
+            "isbn": "2",
+            "title": "b",
+            "price": "x",
+            "stock": "2",
+        }
+
+
+def test_reject_multiple_sources(tmp_path, input_check, reject_table):
+    (tmp_path / "a.csv").write_text("isbn,title,price\n1,a,x\n2,b,2\n")
+    (tmp_path / "b.csv").write_text("isbn,title,price\n3,c,3\n4,d,y\n")
+    loader = CopyLoader(
+        model=Book,
+        data=str(tmp_path / "*.csv"),
+        operation="append",
+        on_error="reject",
+    )
+    assert loader.load() == 2
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT source, line_number FROM tests_book_rejects "
+            "ORDER BY source"
+        )
+        assert cursor.fetchall() == [
+            (str(tmp_path / "a.csv"), 2),
+            (str(tmp_path / "b.csv"), 3),
+        ]
+
+
+def test_reject_all_valid(csv_data, input_check, reject_table):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, [ROWS[0], ROWS[4]]),
+        operation="append",
+        on_error="reject",
+    )
+    assert loader.load() == 2
+    assert loader.stats["rows_rejected"] == 0
+    assert rejected_rows() == {}
+
+
+def test_reject_in_transaction(csv_data, input_check, reject_table):
+    with transaction.atomic():
+        loader = CopyLoader(
+            model=Book,
+            data=csv_data(BOOK_COLUMNS, ROWS),
+            operation="append",
+            on_error="reject",
+        )
+        assert loader.load() == 2
+        assert Book.objects.count() == 2
+    assert rejected_rows() == ERRORS
+
+
+def test_fallback_checks_only_invalid_rows(csv_data, monkeypatch):
+    monkeypatch.setattr(connection, "pg_version", 150000)
+    rows = [[str(i), "t", f"{i}.00", str(i)] for i in range(1000)]
+    rows[500][2] = "x"
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, rows),
+        operation="append",
+        on_error="ignore",
+    )
+    loader.create(cursor=connection.cursor())
+    try:
+        loader.copy(cursor=connection.cursor())
+        invalid_rows = loader.find_invalid_input_rows(connection.cursor())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexdef FROM pg_indexes WHERE tablename = %s",
+                [loader.temp_table_name],
+            )
+            index_definitions = [row[0] for row in cursor.fetchall()]
+    finally:
+        loader.drop(cursor=connection.cursor())
+    assert invalid_rows == [501]
+    assert len(index_definitions) == 1
+    assert index_definitions[0].endswith("(__dpl_row)")
+    query = loader.build_reject_query(invalid_rows)
+    assert query.count("dpl_input_error") == len(loader.get_input_checks())
+    assert "IN (501)" in query
+
+
+def test_reject_resolution(csv_data, input_check):
+    Author.objects.create(name="known")
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(
+            ["isbn", "title", "author_name"],
+            [["1", "a", "known"], ["2", "b", "unknown"]],
+        ),
+        operation="append",
+        on_error="ignore",
+        resolve={"author_id": ("author_name", Author, "name")},
+    )
+    assert loader.load() == 1
+    assert list(Book.objects.values_list("isbn", "author__name")) == [
+        ("1", "known")
+    ]
+
+
+@pytest.mark.parametrize(
+    "reject_table_name, error",
+    [
+        (1, TypeError),
+        ("", ValueError),
+        ('rejects"; DROP TABLE tests_book; --', ValueError),
+        ("1rejects", ValueError),
+        ("r" * 64, ValueError),
+    ],
+)
+def test_invalid_reject_table_name(csv_data, reject_table_name, error):
+    with pytest.raises(error, match="Reject table name"):
+        CopyLoader(
+            model=Book,
+            data=csv_data(BOOK_COLUMNS, ROWS),
+            operation="append",
+            on_error="reject",
+            reject_table_name=reject_table_name,
+        )
+
+
+def test_default_reject_table_name(csv_data):
+    loader = CopyLoader(
+        model=Book,
+        data=csv_data(BOOK_COLUMNS, ROWS),
+        operation="append",
+        on_error="reject",
+    )
+    assert loader.reject_table_name == "tests_book_rejects"
+    names = set()
+    for model_table in ["a" * 60, "a" * 60 + "b", "a" * 60]:
+        loader.model_table = model_table
+        name = loader.generate_reject_table_name()
+        assert len(name) == 63
+        assert name.startswith("a" * 40)
+        assert name.endswith("_rejects")
+        names.add(name)
+    assert len(names) == 2
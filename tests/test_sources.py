@@ -0,0 +1,265 @@
+"""Tests of loading from files, byte streams, compressed data, and globs."""
+
+# standard library imports
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+
+# third-party imports
+import pytest
+from django.db import (
+    connection,
+    DatabaseError,
+    IntegrityError,
+    NotSupportedError,
+    transaction,
+)
+
+# local imports
+from django_postgres_loader import CopyLoader
+from django_postgres_loader.core import sources, staging
+from tests.models import Book
+
+DOCUMENT = "isbn,title\n1,é\n2,b\n"
+COMPRESSORS = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+SUFFIXES = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+
+
+def book_titles() -> dict:
+    """Get the titles of the books, keyed on ISBN.
+
+    Returns (dict):
+        Titles keyed on ISBN.
+    """
+    return dict(Book.objects.values_list("isbn", "title"))
+
+
+def test_binary_stream():
+    loader = CopyLoader(
+        model=Book,
+        data=io.BytesIO(DOCUMENT.encode("utf-8")),
+        operation="append",
+    )
+    assert loader.load() == 2
+    assert book_titles() == {"1": "é", "2": "b"}
+
+
+def test_binary_stream_with_encoding():
+    loader = CopyLoader(
+        model=Book,
+        data=io.BytesIO(DOCUMENT.encode("latin-1")),
+        operation="append",
+        encoding="LATIN1",
+    )
+    assert loader.load() == 2
+    assert book_titles() == {"1": "é", "2": "b"}
+
+
+def test_file_path(tmp_path):
+    path = tmp_path / "books.csv"
+    path.write_text(DOCUMENT, encoding="utf-8")
+    loader = CopyLoader(model=Book, data=str(path), operation="append")
+    assert loader.load() == 2
+    assert book_titles() == {"1": "é", "2": "b"}
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+@pytest.mark.parametrize("in_thread", [False, True])
+def test_compressed_stream(compression, in_thread):
+    data = io.BytesIO(COMPRESSORS[compression](DOCUMENT.encode("utf-8")))
+    assert sources.detect_compression(data) == compression
+    loader = CopyLoader(
+        model=Book,
+        data=data,
+        operation="append",
+        decompress_in_thread=in_thread,
+    )
+    assert loader.load() == 2
+    assert book_titles() == {"1": "é", "2": "b"}
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+def test_compressed_file(tmp_path, compression):
+    path = tmp_path / f"books.csv{SUFFIXES[compression]}"
+    path.write_bytes(COMPRESSORS[compression](DOCUMENT.encode("utf-8")))
+    assert sources.detect_compression_from_name(str(path)) == compression
+    loader = CopyLoader(model=Book, data=str(path), operation="append")
+    assert loader.load() == 2
+    assert book_titles() == {"1": "é", "2": "b"}
+
+
+def test_uncompressed_with_compression_disabled():
+    loader = CopyLoader(
+        model=Book,
+        data=io.BytesIO(DOCUMENT.encode("utf-8")),
+        operation="append",
+        compression=None,
+    )
+    assert loader.load() == 2
+    assert book_titles() == {"1": "é", "2": "b"}
+
+
+def write_sources(tmp_path, n_sources: int) -> str:
+    """Write CSV files of one book each.
+
+    Args:
+        tmp_path (Path):
+            The directory in which to write the files.
+        n_sources (int):
+            The number of files.
+
+    Returns (str):
+        A glob pattern matching the files.
+    """
+    for index in range(n_sources):
+        path = tmp_path / f"books_{index}.csv"
+        path.write_text(f"isbn,title\n{index},t{index}\n")
+    return str(tmp_path / "books_*.csv")
+
+
+def staging_table_exists(name: str) -> bool:
+    """Check whether a staging table is visible to the default connection.
+
+    Args:
+        name (str):
+            The name of the table.
+
+    Returns (bool):
+        Whether the table exists.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [f'"{name}"'])
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.parametrize("parallel_copies", [1, 3])
+def test_glob(tmp_path, parallel_copies):
+    loader = CopyLoader(
+        model=Book,
+        data=write_sources(tmp_path, 3),
+        operation="append",
+        parallel_copies=parallel_copies,
+    )
+    assert loader.load() == 3
+    assert loader.source_row_counts == [1, 1, 1]
+    assert book_titles() == {"0": "t0", "1": "t1", "2": "t2"}
+    assert loader.shared_staging == (parallel_copies > 1)
+    prefix = "dpl_stage_" if parallel_copies > 1 else "tmp_"
+    assert loader.temp_table_name.startswith(prefix)
+    assert not staging_table_exists(loader.temp_table_name)
+
+
+def test_single_source_is_not_shared(tmp_path):
+    loader = CopyLoader(
+        model=Book,
+        data=write_sources(tmp_path, 1),
+        operation="append",
+        parallel_copies=4,
+    )
+    assert loader.load() == 1
+    assert not loader.shared_staging
+    assert loader.temp_table_name.startswith("tmp_")
+
+
+def test_list_of_sources():
+    loader = CopyLoader(
+        model=Book,
+        data=[
+            io.StringIO("isbn,title\n1,a\n"),
+            io.BytesIO(b"isbn,title\n2,b\n"),
+        ],
+        operation="append",
+    )
+    assert loader.load() == 2
+    assert book_titles() == {"1": "a", "2": "b"}
+
+
+@pytest.mark.parametrize("parallel_copies", [1, 3])
+def test_staging_table_dropped_on_failure(tmp_path, parallel_copies):
+    pattern = write_sources(tmp_path, 3)
+    (tmp_path / "books_3.csv").write_text("isbn,title\n1,duplicate\n")
+    loader = CopyLoader(
+        model=Book,
+        data=pattern,
+        operation="append",
+        parallel_copies=parallel_copies,
+    )
+    with pytest.raises(IntegrityError):
+        loader.load()
+    assert not staging_table_exists(loader.temp_table_name)
+    assert staging.list_shared_staging_tables() == []
+    assert Book.objects.count() == 0
+
+
+def test_drop_shared_staging_tables():
+    with connection.cursor() as cursor:
+        cursor.execute('CREATE UNLOGGED TABLE "dpl_stage_left" (id integer)')
+        cursor.execute('CREATE UNLOGGED TABLE "dplxstagexkept" (id integer)')
+    assert staging.list_shared_staging_tables() == ["dpl_stage_left"]
+    assert staging.drop_shared_staging_tables() == ["dpl_stage_left"]
+    assert not staging_table_exists("dpl_stage_left")
+    assert staging_table_exists("dplxstagexkept")
+    with connection.cursor() as cursor:
+        cursor.execute('DROP TABLE "dplxstagexkept"')
+
+
+@pytest.fixture
+def server_path():
+    """Write a CSV file that the database server can read.
+
+    The file is written to a world-readable directory outside of pytest's
+    (private) temp directory. The test is skipped if the server cannot read
+    it, e.g. if it runs on another host or as a user without the
+    pg_read_server_files privilege.
+
+    Yields (str):
+        The path of the file.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        os.chmod(directory, 0o755)
+        path = os.path.join(directory, "books.csv")
+        with open(path, "w") as file:
+            file.write("isbn,title\n1,a\n2,b\n")
+        os.chmod(path, 0o644)
+        try:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_stat_file(%s)", [path])
+        except DatabaseError:
+            pytest.skip("The database server cannot read local files.")
+        yield path
+
+
+def test_server_source(server_path):
+    loader = CopyLoader(
+        model=Book,
+        data=server_path,
+        operation="append",
+        source="server",
+    )
+    assert loader.get_data_columns() == ["isbn", "title"]
+    assert loader.load() == 2
+    assert book_titles() == {"1": "a", "2": "b"}
+
+
+def test_server_source_rejects_streams():
+    with pytest.raises(TypeError):
+        CopyLoader(
+            model=Book,
+            data=io.StringIO("isbn,title\n"),
+            operation="append",
+            source="server",
+        )
+
+
+def test_server_source_rejects_compression():
+    with pytest.raises(NotSupportedError):
+        CopyLoader(
+            model=Book,
+            data="/data/books.csv.gz",
+            operation="append",
+            source="server",
+        )
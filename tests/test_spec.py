@@ -0,0 +1,91 @@
+"""Tests of LoadSpec."""
+
+# third-party imports
+import pytest
+from django.db import connection
+
+# local imports
+from django_postgres_loader import LoadSpec
+from tests.models import Book
+
+BOOK_COLUMNS = ["isbn", "title", "price"]
+
+
+def test_spec_loads_repeatedly(csv_data):
+    spec = LoadSpec(
+        model=Book,
+        columns=BOOK_COLUMNS,
+        operation="upsert",
+        conflict_target=["isbn"],
+        update_operation="replace",
+    )
+    assert spec.load(csv_data(BOOK_COLUMNS, [["1", "a", "1.00"]])) == 1
+    assert spec.load(csv_data(BOOK_COLUMNS, [["1", "b", "2.00"]])) == 1
+    assert spec.load(csv_data(BOOK_COLUMNS, [["2", "c", ""]])) == 1
+    assert sorted(Book.objects.values_list("isbn", "title")) == [
+        ("1", "b"),
+        ("2", "c"),
+    ]
+
+
+def test_spec_uses_fresh_temp_table(csv_data):
+    spec = LoadSpec(model=Book, columns=BOOK_COLUMNS, operation="append")
+    names = set()
+    for isbn in ["1", "2", "3"]:
+        spec.load(csv_data(BOOK_COLUMNS, [[isbn, "a", "1.00"]]))
+        names.add(spec.loader.temp_table_name)
+        for query in spec.loader.compiled_queries.values():
+            assert f'"{spec.loader.temp_table_name}"' in query
+    assert len(names) == 3
+    assert Book.objects.count() == 3
+
+
+def test_spec_keeps_given_temp_table_name(csv_data):
+    spec = LoadSpec(
+        model=Book,
+        columns=BOOK_COLUMNS,
+        operation="append",
+        temp_table_name="tmp_spec",
+    )
+    spec.load(csv_data(BOOK_COLUMNS, [["1", "a", "1.00"]]))
+    spec.load(csv_data(BOOK_COLUMNS, [["2", "a", "1.00"]]))
+    assert spec.loader.temp_table_name == "tmp_spec"
+    assert Book.objects.count() == 2
+
+
+def test_spec_forwards_options(csv_data):
+    spec = LoadSpec(
+        model=Book,
+        columns=["isbn", "title"],
+        operation="append",
+        delimiter="|",
+        using="other",
+    )
+    data = csv_data(["isbn|title"], [["1|a"]])
+    assert spec.load(data) == 1
+    assert Book.objects.using("other").count() == 1
+    assert Book.objects.count() == 0
+
+
+def test_spec_rejects_unknown_options():
+    with pytest.raises(TypeError):
+        LoadSpec(model=Book, columns=BOOK_COLUMNS, operation="append", foo=1)
+
+
+def test_spec_rejects_mismatched_header(csv_data):
+    spec = LoadSpec(model=Book, columns=BOOK_COLUMNS, operation="append")
+    with pytest.raises(ValueError):
+        spec.load(csv_data(["isbn", "title"], [["1", "a"]]))
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT count(*) FROM tests_book")
+        assert cursor.fetchone()[0] == 0
+
+
+def test_manager_forwards_options(csv_data):
+    n_rows_affected = Book.objects.load(
+        data=csv_data(["isbn", "title", "extra"], [["1", "a", "x"]]),
+        operation="append",
+        ignore_extra_columns=True,
+    )
+    assert n_rows_affected == 1
+    assert list(Book.objects.values_list("isbn", "title")) == [("1", "a")]